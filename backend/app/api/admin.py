@@ -5,7 +5,7 @@ Admin API endpoints for database maintenance.
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List
-from sqlalchemy import text, inspect
+from sqlalchemy import func, text, inspect
 import logging
 
 from app.database.connection import get_db, engine
@@ -36,21 +36,10 @@ async def cleanup_all_campaigns(
     - Statistics about deleted records
     """
     try:
-        # Count existing records
-        campaign_count = db.query(Campaign).count()
-        creative_count = db.query(Creative).count()
+        logger.info("Starting cleanup")
 
-        logger.info(f"Starting cleanup: {campaign_count} campaigns, {creative_count} creatives")
-
-        if campaign_count == 0 and creative_count == 0:
-            return {
-                "status": "success",
-                "message": "Database is already clean",
-                "deleted_campaigns": 0,
-                "deleted_creatives": 0
-            }
-
-        # Delete all creatives first (due to foreign key constraints)
+        # Delete all creatives first (due to foreign key constraints).
+        # The DELETE row counts double as the record counts - no separate COUNT scans.
         deleted_creatives = db.query(Creative).delete()
         logger.info(f"Deleted {deleted_creatives} creatives")
 
@@ -61,6 +50,14 @@ async def cleanup_all_campaigns(
         # Commit the changes
         db.commit()
 
+        if deleted_campaigns == 0 and deleted_creatives == 0:
+            return {
+                "status": "success",
+                "message": "Database is already clean",
+                "deleted_campaigns": 0,
+                "deleted_creatives": 0
+            }
+
         logger.info("✅ Cleanup complete")
 
         return {
@@ -95,8 +92,8 @@ async def get_campaign_stats(
     - Campaign and creative counts
     """
     try:
-        campaign_count = db.query(Campaign).count()
-        creative_count = db.query(Creative).count()
+        campaign_count = db.query(func.count(Campaign.id)).scalar()
+        creative_count = db.query(func.count(Creative.id)).scalar()
 
         return {
             "total_campaigns": campaign_count,
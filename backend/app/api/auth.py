@@ -72,7 +72,7 @@ def get_current_user_id(authorization: str = Header(None)) -> UUID:
             try:
                 decoded = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
                 user_id = UUID(decoded.get("sub"))
-                logger.debug(f"Authenticated user: {user_id}")
+                logger.debug("Authenticated user: %s", user_id)
                 return user_id
             except Exception:
                 logger.debug("Dev mode: token decode failed, using test user")
@@ -94,7 +94,7 @@ def get_current_user_id(authorization: str = Header(None)) -> UUID:
                 raise HTTPException(status_code=401, detail="Invalid token: missing user ID")
 
             user_id = UUID(user_id_str)
-            logger.debug(f"Authenticated user: {user_id}")
+            logger.debug("Authenticated user: %s", user_id)
             return user_id
 
         except jwt.ExpiredSignatureError:
@@ -266,14 +266,7 @@ def verify_perfume_ownership(
     if db is None:
         raise HTTPException(status_code=503, detail="Database not available")
 
-    product = crud.get_product_by_id(db, perfume_id)
-    if not product:
-        raise HTTPException(
-            status_code=404,
-            detail="Product not found"
-        )
-
-    if product.brand_id != brand_id:
+    if not crud.product_belongs_to_brand(db, perfume_id, brand_id):
         raise HTTPException(
             status_code=404,
             detail="Product not found"
@@ -302,14 +295,7 @@ def verify_campaign_ownership(
     if db is None:
         raise HTTPException(status_code=503, detail="Database not available")
 
-    campaign = crud.get_campaign_by_id(db, campaign_id)
-    if not campaign:
-        raise HTTPException(
-            status_code=404,
-            detail="Campaign not found"
-        )
-
-    if campaign.product.brand_id != brand_id:
+    if not crud.campaign_belongs_to_brand(db, campaign_id, brand_id):
         raise HTTPException(
             status_code=404,
             detail="Campaign not found"
@@ -129,19 +129,19 @@ async def onboard_brand(
         guidelines.file.seek(0)
         
         # Upload logo to S3
-        logger.info(f"📤 Uploading logo for brand {brand_id}")
+        logger.info("📤 Uploading logo for brand %s", brand_id)
         logo_result = await upload_brand_logo(str(brand_id), logo_content, logo.filename)
         logo_url = logo_result["url"]
-        logger.info(f"✅ Logo uploaded: {logo_url}")
+        logger.info("✅ Logo uploaded: %s", logo_url)
         
         # Upload guidelines to S3
-        logger.info(f"📤 Uploading guidelines for brand {brand_id}")
+        logger.info("📤 Uploading guidelines for brand %s", brand_id)
         guidelines_result = await upload_brand_guidelines(str(brand_id), guidelines_content, guidelines.filename)
         guidelines_url = guidelines_result["url"]
-        logger.info(f"✅ Guidelines uploaded: {guidelines_url}")
+        logger.info("✅ Guidelines uploaded: %s", guidelines_url)
         
         # Create brand in database
-        logger.info(f"💾 Creating brand {brand_id} in database")
+        logger.info("💾 Creating brand %s in database", brand_id)
         brand = crud.create_brand(
             db=db,
             user_id=user_id,
@@ -156,15 +156,15 @@ async def onboard_brand(
         db.commit()
         db.refresh(brand)
 
-        logger.info(f"✅ Brand created with ID: {brand.id}")
+        logger.info("✅ Brand created with ID: %s", brand.id)
 
-        logger.info(f"✅ Brand onboarding completed: {brand.id}")
+        logger.info("✅ Brand onboarding completed: %s", brand.id)
         return BrandDetail.model_validate(brand)
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Brand onboarding failed: {e}", exc_info=True)
+        logger.error("❌ Brand onboarding failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to complete onboarding: {str(e)}"
@@ -199,7 +199,7 @@ async def get_my_brand(
         return BrandDetail.model_validate(brand)
 
     except Exception as e:
-        logger.error(f"❌ Failed to get brand: {e}", exc_info=True)
+        logger.error("❌ Failed to get brand: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve brand"
@@ -241,7 +241,7 @@ async def get_brand_stats(
         return stats
 
     except Exception as e:
-        logger.error(f"❌ Failed to get brand stats: {e}", exc_info=True)
+        logger.error("❌ Failed to get brand stats: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve brand statistics"
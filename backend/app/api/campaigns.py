@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from uuid import UUID
 import logging
+from datetime import datetime
 from typing import Optional
 
 from app.database.connection import get_db
@@ -29,6 +30,8 @@ async def list_campaigns(
     product_id: UUID = Query(..., description="Product ID"),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     limit: int = Query(20, ge=1, le=100, description="Items per page (1-100)"),
+    cursor_created_at: Optional[datetime] = Query(None, description="created_at of the last campaign on the previous page"),
+    cursor_id: Optional[UUID] = Query(None, description="id of the last campaign on the previous page"),
     brand_id: UUID = Depends(get_current_brand_id),
     db: Session = Depends(get_db)
 ) -> PaginatedCampaigns:
@@ -39,6 +42,8 @@ async def list_campaigns(
     - `product_id`: Product UUID (required)
     - `page`: Page number (default: 1)
     - `limit`: Items per page (default: 20, max: 100)
+    - `cursor_created_at`, `cursor_id`: created_at and id of the last campaign
+      on the previous page; fetches the next page by keyset instead of `page`
 
     **Returns:**
     - PaginatedCampaigns: Paginated list with total count
@@ -51,7 +56,10 @@ async def list_campaigns(
         verify_perfume_ownership(product_id, brand_id, db)
 
         # Get campaigns for product
-        campaigns, total = crud.get_campaigns_by_product(db, product_id, page, limit)
+        campaigns, total = crud.get_campaigns_by_product(
+            db, product_id, page, limit,
+            cursor=(cursor_created_at, cursor_id) if cursor_created_at and cursor_id else None
+        )
         
         # Convert to response models
         campaign_details = [CampaignDetail.model_validate(c) for c in campaigns]
@@ -69,7 +77,7 @@ async def list_campaigns(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Failed to list campaigns: {e}", exc_info=True)
+        logger.error("❌ Failed to list campaigns: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve campaigns"
@@ -107,11 +115,13 @@ async def get_campaign(
                 detail="Campaign not found"
             )
         
-        # Log campaign_json for debugging
-        logger.info(f"🔍 Campaign {campaign_id} campaign_json type: {type(campaign.campaign_json)}")
-        logger.info(f"🔍 Campaign {campaign_id} campaign_json value: {campaign.campaign_json}")
-        if isinstance(campaign.campaign_json, dict):
-            logger.info(f"🔍 Campaign {campaign_id} variationPaths: {campaign.campaign_json.get('variationPaths', 'NOT FOUND')}")
+        # Log campaign_json for debugging (the full document repr is only
+        # built when DEBUG is enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 Campaign %s campaign_json type: %s", campaign_id, type(campaign.campaign_json))
+            logger.debug("🔍 Campaign %s campaign_json value: %s", campaign_id, campaign.campaign_json)
+            if isinstance(campaign.campaign_json, dict):
+                logger.debug("🔍 Campaign %s variationPaths: %s", campaign_id, campaign.campaign_json.get('variationPaths', 'NOT FOUND'))
         
         # Note: We no longer replace S3 URLs with backend proxy URLs
         # The S3 URLs are presigned and should work directly from the frontend.
@@ -120,15 +130,16 @@ async def get_campaign(
         
         campaign_detail = CampaignDetail.model_validate(campaign)
         
-        logger.info(f"🔍 CampaignDetail campaign_json type: {type(campaign_detail.campaign_json)}")
-        logger.info(f"🔍 CampaignDetail campaign_json value: {campaign_detail.campaign_json}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 CampaignDetail campaign_json type: %s", type(campaign_detail.campaign_json))
+            logger.debug("🔍 CampaignDetail campaign_json value: %s", campaign_detail.campaign_json)
         
         return campaign_detail
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Failed to get campaign: {e}", exc_info=True)
+        logger.error("❌ Failed to get campaign: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve campaign"
@@ -180,13 +191,13 @@ async def delete_campaign(
                 detail="Failed to delete campaign"
             )
         
-        logger.info(f"✅ Deleted campaign {campaign_id}")
+        logger.info("✅ Deleted campaign %s", campaign_id)
         return None
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Failed to delete campaign: {e}", exc_info=True)
+        logger.error("❌ Failed to delete campaign: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete campaign"
@@ -234,7 +234,8 @@ async def create_creative(
             progress=creative.progress,
             cost=float(creative.cost),
             error_message=creative.error_message,
-            aspect_ratio=creative.aspect_ratio,
+            # Echo the requested ratio; the stored one is output_formats[0]
+            aspect_ratio=creative_data.aspect_ratio or creative.aspect_ratio,
             video_provider=creative.video_provider,
             output_formats=creative.output_formats,
             created_at=creative.created_at.isoformat(),
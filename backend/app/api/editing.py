@@ -9,7 +9,6 @@ from pydantic import BaseModel
 import logging
 import boto3
 from io import BytesIO
-import json
 
 from app.database.connection import get_db
 from app.database.crud import get_campaign_by_id
@@ -132,9 +131,6 @@ async def get_campaign_scenes(
         raise HTTPException(status_code=404, detail="Campaign not found")
     
     campaign_json = campaign.campaign_json
-    if isinstance(campaign_json, str):
-        import json
-        campaign_json = json.loads(campaign_json)
     
     scenes = campaign_json.get('scenes', [])
     
@@ -190,9 +186,6 @@ async def edit_scene(
         raise HTTPException(status_code=404, detail="Campaign not found")
     
     campaign_json = campaign.campaign_json
-    if isinstance(campaign_json, str):
-        import json
-        campaign_json = json.loads(campaign_json)
     
     scenes = campaign_json.get('scenes', [])
     if scene_index >= len(scenes):
@@ -230,9 +223,6 @@ async def get_edit_history(
         raise HTTPException(status_code=404, detail="Campaign not found")
     
     campaign_json = campaign.campaign_json
-    if isinstance(campaign_json, str):
-        import json
-        campaign_json = json.loads(campaign_json)
     
     edit_history = campaign_json.get('edit_history', {})
     edits = edit_history.get('edits', [])
@@ -285,9 +275,6 @@ async def stream_scene_video(
         
         # Validate scene index
         campaign_json = campaign.campaign_json
-        if isinstance(campaign_json, str):
-            import json
-            campaign_json = json.loads(campaign_json)
         
         scenes = campaign_json.get('scenes', [])
         if scene_index < 0 or scene_index >= len(scenes):
@@ -434,15 +421,11 @@ async def get_editing_scenes(
     # Get scenes from campaign_json or scene_configs
     campaign_json = campaign.campaign_json
     if campaign_json:
-        if isinstance(campaign_json, str):
-            campaign_json = json.loads(campaign_json)
         scenes = campaign_json.get('scenes', [])
     else:
         # Fall back to scene_configs
         scene_configs = campaign.scene_configs
-        if isinstance(scene_configs, str):
-            scene_configs = json.loads(scene_configs)
-        scenes = scene_configs if isinstance(scene_configs, list) else []
+        scenes = scene_configs if type(scene_configs) is list else []
 
     from app.utils.s3_utils import get_scene_s3_url
 
@@ -507,8 +490,6 @@ async def get_editing_music(
     # Get duration from campaign_json if available
     campaign_json = campaign.campaign_json
     if campaign_json:
-        if isinstance(campaign_json, str):
-            campaign_json = json.loads(campaign_json)
         duration = campaign_json.get('audio_duration', campaign.duration or 30.0)
     else:
         duration = campaign.duration or 30.0
@@ -585,8 +566,6 @@ async def export_manual_edit_upload(
 
         # Update campaign_json with final video URL
         campaign_json = campaign.campaign_json or {}
-        if isinstance(campaign_json, str):
-            campaign_json = json.loads(campaign_json)
         campaign_json['edited_video_url'] = final_url
         campaign_json['editing_completed_at'] = str(datetime.utcnow())
         campaign.campaign_json = campaign_json
@@ -161,6 +161,7 @@ class SelectVariationRequest(BaseModel):
 async def select_variation(
     campaign_id: UUID,
     request: SelectVariationRequest,
+    user_id: UUID = Depends(get_current_user_id),
     _: bool = Depends(verify_campaign_ownership),
     db: Session = Depends(get_db)
 ):
@@ -226,6 +227,7 @@ async def select_variation(
         # Update campaign with selected variation
         updated_campaign = crud.update_campaign(
             db,
+            user_id,
             campaign_id,
             selected_variation_index=request.variation_index
         )
@@ -372,6 +374,7 @@ async def get_generation_progress(
 @router.post("/campaigns/{campaign_id}/cancel")
 async def cancel_generation(
     campaign_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
     _: bool = Depends(verify_campaign_ownership),
     db: Session = Depends(get_db)
 ):
@@ -422,6 +425,7 @@ async def cancel_generation(
         # For now, just mark as failed
         crud.update_campaign(
             db,
+            user_id,
             campaign_id,
             status=CampaignStatus.FAILED.value,
             error_message="Cancelled by user"
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Header, File, UploadFile,
 from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import List, Optional
+from datetime import datetime
 import logging
 
 from app.database.connection import get_db
@@ -14,7 +15,7 @@ from app.database.crud import (
     update_product,
     delete_product,
     create_campaign,
-    get_campaigns_by_product
+    get_campaign_names_by_product
 )
 from app.models.schemas import (
     CreateProductRequest,
@@ -148,7 +149,7 @@ async def create_product_endpoint(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Failed to create product: {e}")
+        logger.error("❌ Failed to create product: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to create product: {str(e)}"
@@ -213,13 +214,13 @@ async def create_product_json_endpoint(
                 detail=f"Brand {brand_id} not found or not owned by user"
             )
 
-        logger.info(f"✅ Created product {product.id} (JSON) for brand {brand_id}")
+        logger.info("✅ Created product %s (JSON) for brand %s", product.id, brand_id)
         return product
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Failed to create product (JSON): {e}")
+        logger.error("❌ Failed to create product (JSON): %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to create product: {str(e)}"
@@ -232,7 +233,9 @@ async def list_brand_products_endpoint(
     db: Session = Depends(get_db),
     authorization: str = Header(None),
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    cursor_created_at: Optional[datetime] = None,
+    cursor_id: Optional[UUID] = None
 ):
     """
     Get all products for a specific brand (ownership verified).
@@ -243,6 +246,8 @@ async def list_brand_products_endpoint(
     **Query Parameters:**
     - limit: Maximum number of products to return (default: 50)
     - offset: Number of products to skip for pagination (default: 0)
+    - cursor_created_at, cursor_id: created_at and id of the last product on
+      the previous page; fetches the next page by keyset instead of offset
 
     **Response:** List of ProductResponse objects
 
@@ -261,7 +266,8 @@ async def list_brand_products_endpoint(
             user_id=user_id,
             brand_id=brand_id,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=(cursor_created_at, cursor_id) if cursor_created_at and cursor_id else None
         )
 
         if products is None:
@@ -270,14 +276,14 @@ async def list_brand_products_endpoint(
                 detail=f"Brand {brand_id} not found or not owned by user"
             )
 
-        logger.info(f"✅ Retrieved {len(products)} products for brand {brand_id}")
+        logger.info("✅ Retrieved %s products for brand %s", len(products), brand_id)
 
         return products
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Failed to list products for brand {brand_id}: {e}")
+        logger.error("❌ Failed to list products for brand %s: %s", brand_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to list products: {str(e)}")
 
 
@@ -310,14 +316,14 @@ async def get_product_endpoint(
         if not product:
             raise HTTPException(status_code=404, detail="Product not found")
 
-        logger.info(f"✅ Retrieved product {product_id}")
+        logger.info("✅ Retrieved product %s", product_id)
 
         return product
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Failed to get product {product_id}: {e}")
+        logger.error("❌ Failed to get product %s: %s", product_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to get product: {str(e)}")
 
 
@@ -371,14 +377,14 @@ async def update_product_endpoint(
         if not product:
             raise HTTPException(status_code=404, detail="Product not found")
 
-        logger.info(f"✅ Updated product {product_id}")
+        logger.info("✅ Updated product %s", product_id)
 
         return product
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Failed to update product {product_id}: {e}")
+        logger.error("❌ Failed to update product %s: %s", product_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to update product: {str(e)}")
 
 
@@ -411,7 +417,7 @@ async def delete_product_endpoint(
         if not deleted:
             raise HTTPException(status_code=404, detail="Product not found")
 
-        logger.info(f"✅ Deleted product {product_id}")
+        logger.info("✅ Deleted product %s", product_id)
 
         # Return 204 No Content
         return None
@@ -419,7 +425,7 @@ async def delete_product_endpoint(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Failed to delete product {product_id}: {e}")
+        logger.error("❌ Failed to delete product %s: %s", product_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to delete product: {str(e)}")
 
 
@@ -467,19 +473,18 @@ async def create_product_campaign(
         verify_perfume_ownership(product_id, brand_id, db)
 
         # Check campaign name uniqueness within product
-        existing_campaigns, _ = get_campaigns_by_product(db, product_id, page=1, limit=1000)
-        for existing in existing_campaigns:
-            if existing.name == data.name:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail=f"Campaign name '{data.name}' already exists for this product"
-                )
+        existing_names = get_campaign_names_by_product(db, product_id)
+        if data.name in existing_names:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Campaign name '{data.name}' already exists for this product"
+            )
 
         # Convert scene_configs to dict format for database
         scene_configs_dict = [scene.model_dump() for scene in data.scene_configs]
 
         # Create campaign
-        logger.info(f"💾 Creating campaign '{data.name}' for product {product_id} (brand {brand_id})")
+        logger.info("💾 Creating campaign '%s' for product %s (brand %s)", data.name, product_id, brand_id)
         campaign = create_campaign(
             db=db,
             user_id=user_id,
@@ -498,13 +503,13 @@ async def create_product_campaign(
                 detail="Product not found or doesn't belong to brand"
             )
 
-        logger.info(f"✅ Created campaign {campaign.id} for product {product_id}")
+        logger.info("✅ Created campaign %s for product %s", campaign.id, product_id)
         return CampaignDetail.model_validate(campaign)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Failed to create campaign: {e}", exc_info=True)
+        logger.error("❌ Failed to create campaign: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create campaign: {str(e)}"
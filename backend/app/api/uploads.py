@@ -10,7 +10,7 @@ from pydantic import BaseModel
 
 from app.api.auth import get_current_user_id
 from app.config import settings
-from app.database.crud import get_campaign
+from app.database.crud import get_campaign_by_id
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -180,7 +180,7 @@ async def upload_reference_image(
         db_gen = get_db()
         session = next(db_gen)
         try:
-            campaign = get_campaign(session, campaign_id)
+            campaign = get_campaign_by_id(session, campaign_id)
             if not campaign:
                 raise HTTPException(status_code=404, detail="Campaign not found")
             if campaign.user_id != user_id:
@@ -205,7 +205,7 @@ async def upload_reference_image(
         db_gen = get_db()
         session = next(db_gen)
         try:
-            campaign = get_campaign(session, campaign_id)
+            campaign = get_campaign_by_id(session, campaign_id)
             
             if campaign.ad_campaign_json is None:
                 campaign.ad_campaign_json = {}
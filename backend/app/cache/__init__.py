@@ -0,0 +1 @@
+"""Shared (Redis-backed) read caches."""
@@ -0,0 +1,100 @@
+"""
+Redis cache-aside for campaign listings.
+
+Cached pages are plain column dicts serialized as JSON (orjson), never ORM objects.
+Every key written for a product is recorded in a tag set so writes to any
+campaign of that product can drop all of its cached pages at once. The tag
+set expires with the entries it lists, so idle products leave nothing behind.
+
+Caching is disabled when REDIS_URL is unset or Redis is unreachable; callers
+then always fall through to the loader.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import UUID
+
+import orjson
+from redis.exceptions import RedisError
+
+from app.cache.client import get_client
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def list_key(
+    product_id: UUID,
+    limit: int,
+    offset: int,
+    cursor: Optional[Tuple[datetime, UUID]] = None
+) -> str:
+    """
+    Cache key for one page of a product's campaign listing.
+
+    Ownership is checked before the cache is consulted, so pages are shared
+    by everyone allowed to see the product.
+    """
+    page = f"{cursor[0].isoformat()}/{cursor[1]}" if cursor is not None else offset
+    return f"camp:list:{product_id}:{limit}:{page}"
+
+
+def _tag(product_id: UUID) -> str:
+    return f"camp:tag:{product_id}"
+
+
+def get_or_set(
+    key: str,
+    product_id: UUID,
+    loader: Callable[[], Optional[Dict[str, Any]]],
+    ttl: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Return the cached page for key, or run loader and cache its result.
+
+    A None result from the loader (not found / not owned) is never cached.
+    Redis errors are logged and treated as a miss.
+    """
+    client = get_client()
+    if client is None:
+        return loader()
+
+    try:
+        cached = client.get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+    except RedisError as e:
+        logger.warning("⚠️ Campaign cache read failed for %s: %s", key, e)
+        return loader()
+
+    page = loader()
+    if page is None:
+        return None
+
+    ttl = ttl or settings.campaign_list_cache_ttl_seconds
+    tag = _tag(product_id)
+    try:
+        pipe = client.pipeline()
+        pipe.setex(key, ttl, orjson.dumps(page, default=str))
+        pipe.sadd(tag, key)
+        # Refreshed on every write, so the tag outlives each entry it lists
+        pipe.expire(tag, ttl)
+        pipe.execute()
+    except RedisError as e:
+        logger.warning("⚠️ Campaign cache write failed for %s: %s", key, e)
+    return page
+
+
+def invalidate_product(product_id: UUID) -> None:
+    """Drop every cached campaign page for a product."""
+    client = get_client()
+    if client is None:
+        return
+
+    tag = _tag(product_id)
+    try:
+        keys = client.smembers(tag)
+        client.delete(*keys, tag)
+    except RedisError as e:
+        logger.warning("⚠️ Campaign cache invalidation failed for product %s: %s", product_id, e)
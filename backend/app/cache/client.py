@@ -0,0 +1,28 @@
+"""Shared Redis client for the read caches."""
+
+import threading
+from typing import Optional
+
+from redis import Redis
+
+from app.config import settings
+
+_client: Optional[Redis] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> Optional[Redis]:
+    """Lazily build the shared Redis client, None when caching is disabled."""
+    global _client
+    if not settings.redis_url:
+        return None
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = Redis.from_url(
+                    settings.redis_url,
+                    socket_connect_timeout=1,
+                    socket_timeout=1,
+                    health_check_interval=30
+                )
+    return _client
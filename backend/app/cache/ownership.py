@@ -0,0 +1,65 @@
+"""
+Redis cache for product / campaign ownership checks.
+
+Both outcomes are cached ("1" owned, "0" not owned) for
+ownership_cache_ttl_seconds, so repeated authorization of the same
+(user, object) pair skips the database. Deleting a product or campaign
+drops its entries; anything else that revokes ownership (e.g. a brand
+delete cascading to its products) is bounded by the TTL.
+
+Disabled when REDIS_URL is unset; Redis errors fall back to the loader.
+"""
+
+import logging
+from typing import Callable, Optional
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from app.cache.client import get_client
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+PRODUCT = "p"
+CAMPAIGN = "c"
+
+
+def _key(kind: str, user_id: UUID, object_id: UUID) -> str:
+    return f"own:{kind}:{user_id}:{object_id}"
+
+
+def get_or_check(kind: str, user_id: UUID, object_id: UUID, check: Callable[[], bool]) -> bool:
+    """Return the cached ownership of object_id by user_id, running check on a miss."""
+    client = get_client()
+    if client is None:
+        return check()
+
+    key = _key(kind, user_id, object_id)
+    try:
+        cached = client.get(key)
+        if cached is not None:
+            return cached == b"1"
+    except RedisError as e:
+        logger.warning("⚠️ Ownership cache read failed for %s: %s", key, e)
+        return check()
+
+    owned = bool(check())
+    try:
+        client.setex(key, settings.ownership_cache_ttl_seconds, b"1" if owned else b"0")
+    except RedisError as e:
+        logger.warning("⚠️ Ownership cache write failed for %s: %s", key, e)
+    return owned
+
+
+def invalidate(kind: str, user_id: UUID, object_id: Optional[UUID]) -> None:
+    """Drop the cached ownership of object_id by user_id."""
+    client = get_client()
+    if client is None or object_id is None:
+        return
+
+    key = _key(kind, user_id, object_id)
+    try:
+        client.delete(key)
+    except RedisError as e:
+        logger.warning("⚠️ Ownership cache invalidation failed for %s: %s", key, e)
@@ -1,7 +1,7 @@
 """Configuration management for the AI Ad Video Generator backend."""
 
 from pydantic_settings import BaseSettings
-from pydantic import field_validator, HttpUrl
+from pydantic import AliasChoices, Field, field_validator, HttpUrl
 from typing import Optional
 import logging
 
@@ -13,6 +13,19 @@ class Settings(BaseSettings):
 
     # Database
     database_url: Optional[str] = None
+    # Pool settings also accept the SQLALCHEMY_POOL_* names used by other deployments
+    db_pool_size: int = Field(20, validation_alias=AliasChoices("db_pool_size", "sqlalchemy_pool_size"))  # 0 disables pooling (NullPool)
+    db_max_overflow: int = Field(40, validation_alias=AliasChoices("db_max_overflow", "sqlalchemy_max_overflow"))
+    db_pool_recycle: int = Field(1800, validation_alias=AliasChoices("db_pool_recycle", "sqlalchemy_pool_recycle"))  # Seconds before a pooled connection is replaced
+    db_pool_timeout: int = 10  # Seconds to wait for a free connection
+    # postgresql+psycopg:// (psycopg 3) only: server-side prepare a statement after this many
+    # executions. 0 disables, e.g. behind PgBouncer transaction pooling older than 1.21
+    db_prepare_threshold: int = 1
+
+    # Cache (optional; Redis-backed read caches are disabled when unset)
+    redis_url: Optional[str] = None
+    campaign_list_cache_ttl_seconds: int = 30
+    ownership_cache_ttl_seconds: int = 60
 
     # Job Queue (SQS - replaces Redis)
     sqs_queue_url: Optional[str] = None
@@ -37,6 +50,9 @@ class Settings(BaseSettings):
     # App Config
     environment: str = "development"
     debug: bool = True
+    log_format: str = "text"  # "json" emits one JSON object per log line
+    dev_mock_without_db: bool = False  # Serve mock campaigns when no DB session is available
+    stats_cache_ttl_seconds: int = 60  # How long dashboard stats aggregates are reused
     
     # API Config
     api_host: str = "0.0.0.0"
@@ -45,6 +61,7 @@ class Settings(BaseSettings):
 
     # Worker Config
     worker_processes: int = 1
+    max_parallel_variations: int = 3  # Variations a pipeline renders at once (bounds upstream API load)
 
     @property
     def ecs_provider_enabled(self) -> bool:
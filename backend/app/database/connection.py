@@ -5,11 +5,18 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import NullPool
 from app.config import settings
 import logging
+import orjson
 import ssl
 import re
 
 logger = logging.getLogger(__name__)
 
+
+def _json_dumps(value) -> str:
+    """orjson encoder for JSON/JSONB binds; non-str dict keys are stringified like stdlib json."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Lazy database engine initialization
 engine = None
 SessionLocal = None
@@ -79,14 +86,42 @@ def init_db():
         if is_local:
             connect_args['sslmode'] = 'disable'
 
+        if db_url.startswith('postgresql+psycopg://'):
+            # psycopg 3 prepares repeated statements server-side, so the hot
+            # lookups skip parse/plan once a connection has run them
+            connect_args['prepare_threshold'] = settings.db_prepare_threshold or None
+        elif 'postgresql' in db_url:
+            # Let psycopg2 adapt uuid.UUID binds and uuid[] results natively
+            # instead of round-tripping them through strings
+            import psycopg2.extras
+            psycopg2.extras.register_uuid()
+
         # Connect to AWS RDS PostgreSQL database
         logger.info("🔧 Connecting to database")
 
+        if settings.db_pool_size > 0:
+            # Pre-ping replaces connections the server or a proxy has dropped
+            # instead of surfacing them as errors mid-request. LIFO checkout
+            # keeps reusing the same few warm connections and lets the rest
+            # idle out, so a pooler in front of Postgres holds fewer backends.
+            pool_args = {
+                'pool_pre_ping': True,
+                'pool_use_lifo': True,
+                'pool_size': settings.db_pool_size,
+                'max_overflow': settings.db_max_overflow,
+                'pool_recycle': settings.db_pool_recycle,
+                'pool_timeout': settings.db_pool_timeout,
+            }
+        else:
+            pool_args = {'poolclass': NullPool}  # No pooling, e.g. behind an external pooler
+
         engine = create_engine(
             db_url,
-            poolclass=NullPool,  # Disable connection pooling for serverless
             echo=settings.debug,
-            connect_args=connect_args
+            connect_args=connect_args,
+            json_serializer=_json_dumps,
+            json_deserializer=orjson.loads,
+            **pool_args
         )
         
         SessionLocal = sessionmaker(
@@ -125,7 +160,10 @@ def get_db() -> Session:
         yield None
         return
     
-    db = SessionLocal()
+    # Request-scoped sessions keep committed objects loaded so handlers can
+    # return freshly written rows without a post-commit SELECT. Background
+    # jobs use long-lived sessions and keep the default expire-on-commit.
+    db = SessionLocal(expire_on_commit=False)
     try:
         yield db
     finally:
@@ -166,6 +204,132 @@ def _run_pending_migrations(engine):
             "check": "SELECT column_name FROM information_schema.columns WHERE table_name='creatives' AND column_name='current_step'",
             "apply": "ALTER TABLE creatives ADD COLUMN current_step VARCHAR(100)"
         },
+        # Local file path maps were plain JSON (stored as text, re-parsed on every read)
+        {
+            "name": "convert_creatives_local_paths_to_jsonb",
+            "check": "SELECT column_name FROM information_schema.columns WHERE table_name='creatives' AND column_name='local_video_paths' AND data_type='jsonb'",
+            "apply": (
+                "ALTER TABLE creatives "
+                "ALTER COLUMN local_video_paths TYPE JSONB USING local_video_paths::jsonb, "
+                "ALTER COLUMN local_input_files TYPE JSONB USING local_input_files::jsonb, "
+                "ALTER COLUMN local_draft_files TYPE JSONB USING local_draft_files::jsonb"
+            )
+        },
+        # creatives.aspect_ratio is derived from output_formats now
+        {
+            "name": "drop_aspect_ratio_from_creatives",
+            "check": "SELECT 1 WHERE NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name='creatives' AND column_name='aspect_ratio')",
+            "apply": (
+                # Rows without output_formats would otherwise lose their ratio
+                "UPDATE creatives SET output_formats = ARRAY[aspect_ratio] "
+                "WHERE aspect_ratio IS NOT NULL AND (output_formats IS NULL OR cardinality(output_formats) = 0); "
+                "ALTER TABLE creatives DROP COLUMN IF EXISTS aspect_ratio"
+            )
+        },
+        # Brand guidelines extracted by the pipeline, kept so reruns skip re-extraction
+        {
+            "name": "add_extracted_guidelines_to_brands",
+            "check": "SELECT column_name FROM information_schema.columns WHERE table_name='brands' AND column_name='extracted_guidelines_json'",
+            "apply": (
+                "ALTER TABLE brands ADD COLUMN extracted_guidelines_json JSONB; "
+                "ALTER TABLE brands ADD COLUMN guidelines_extracted_at TIMESTAMP"
+            )
+        },
+        # Denormalized owner user_id on products and campaigns (copied from the brand)
+        {
+            "name": "add_user_id_to_products",
+            "check": "SELECT column_name FROM information_schema.columns WHERE table_name='products' AND column_name='user_id'",
+            "apply": (
+                "ALTER TABLE products ADD COLUMN user_id UUID; "
+                "UPDATE products SET user_id = brands.user_id FROM brands WHERE brands.id = products.brand_id; "
+                "ALTER TABLE products ALTER COLUMN user_id SET NOT NULL"
+            )
+        },
+        {
+            "name": "add_user_id_to_campaigns",
+            "check": "SELECT column_name FROM information_schema.columns WHERE table_name='campaigns' AND column_name='user_id'",
+            "apply": (
+                "ALTER TABLE campaigns ADD COLUMN user_id UUID; "
+                "UPDATE campaigns SET user_id = products.user_id FROM products WHERE products.id = campaigns.product_id; "
+                "ALTER TABLE campaigns ALTER COLUMN user_id SET NOT NULL"
+            )
+        },
+        {
+            "name": "add_ix_products_user_id",
+            "check": "SELECT indexname FROM pg_indexes WHERE tablename='products' AND indexname='ix_products_user_id'",
+            "apply": "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_user_id ON products (user_id)",
+            "autocommit": True
+        },
+        {
+            "name": "add_ix_campaigns_user_product",
+            "check": "SELECT indexname FROM pg_indexes WHERE tablename='campaigns' AND indexname='ix_campaigns_user_product'",
+            "apply": "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaigns_user_product ON campaigns (user_id, product_id)",
+            "autocommit": True
+        },
+        # Composite indexes backing keyset pagination of brands / products / campaigns
+        {
+            "name": "add_ix_brands_user_created_id",
+            "check": "SELECT indexname FROM pg_indexes WHERE tablename='brands' AND indexname='ix_brands_user_created_id'",
+            "apply": "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_brands_user_created_id ON brands (user_id, created_at DESC, id DESC)",
+            "autocommit": True
+        },
+        {
+            "name": "add_ix_products_brand_created_id",
+            "check": "SELECT indexname FROM pg_indexes WHERE tablename='products' AND indexname='ix_products_brand_created_id'",
+            "apply": "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_brand_created_id ON products (brand_id, created_at DESC, id DESC)",
+            "autocommit": True
+        },
+        {
+            "name": "add_ix_campaigns_product_created",
+            "check": "SELECT indexname FROM pg_indexes WHERE tablename='campaigns' AND indexname='ix_campaigns_product_created'",
+            "apply": "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaigns_product_created ON campaigns (product_id, created_at DESC, id DESC)",
+            "autocommit": True
+        },
+        {
+            "name": "add_ix_campaigns_user_status_created",
+            "check": "SELECT indexname FROM pg_indexes WHERE tablename='campaigns' AND indexname='ix_campaigns_user_status_created'",
+            "apply": "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaigns_user_status_created ON campaigns (user_id, status, created_at DESC)",
+            "autocommit": True
+        },
+        # Replace the full campaigns.status index with one over in-flight rows only
+        {
+            "name": "add_ix_campaigns_status_active",
+            "check": "SELECT indexname FROM pg_indexes WHERE tablename='campaigns' AND indexname='ix_campaigns_status_active'",
+            "apply": "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaigns_status_active ON campaigns (status) WHERE status IN ('pending', 'processing')",
+            "autocommit": True
+        },
+        {
+            "name": "drop_ix_campaigns_status",
+            "check": "SELECT 1 WHERE NOT EXISTS (SELECT 1 FROM pg_indexes WHERE tablename='campaigns' AND indexname='ix_campaigns_status')",
+            "apply": "DROP INDEX CONCURRENTLY IF EXISTS ix_campaigns_status",
+            "autocommit": True
+        },
+        # Partial index for clear_old_failed_campaigns
+        {
+            "name": "add_ix_campaigns_failed_created_at",
+            "check": "SELECT indexname FROM pg_indexes WHERE tablename='campaigns' AND indexname='ix_campaigns_failed_created_at'",
+            "apply": "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_campaigns_failed_created_at ON campaigns (created_at) WHERE status IN ('FAILED', 'failed')",
+            "autocommit": True
+        },
+        # Covering index for the get_generation_stats aggregate (index-only scan)
+        {
+            "name": "add_ix_creatives_user_status",
+            "check": "SELECT indexname FROM pg_indexes WHERE tablename='creatives' AND indexname='ix_creatives_user_status'",
+            "apply": "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_creatives_user_status ON creatives (user_id, status) INCLUDE (cost)",
+            "autocommit": True
+        },
+        # Legacy rows stored campaign_json / scene_configs as JSON-encoded strings;
+        # unwrap them so readers always get a dict or list back from the driver
+        {
+            "name": "unwrap_string_campaign_json",
+            "check": "SELECT 1 WHERE NOT EXISTS (SELECT 1 FROM campaigns WHERE jsonb_typeof(campaign_json) = 'string')",
+            "apply": "UPDATE campaigns SET campaign_json = (campaign_json #>> '{}')::jsonb WHERE jsonb_typeof(campaign_json) = 'string'"
+        },
+        {
+            "name": "unwrap_string_scene_configs",
+            "check": "SELECT 1 WHERE NOT EXISTS (SELECT 1 FROM campaigns WHERE jsonb_typeof(scene_configs) = 'string')",
+            "apply": "UPDATE campaigns SET scene_configs = (scene_configs #>> '{}')::jsonb WHERE jsonb_typeof(scene_configs) = 'string'"
+        },
     ]
 
     with engine.connect() as conn:
@@ -175,12 +339,19 @@ def _run_pending_migrations(engine):
                 exists = result.fetchone() is not None
 
                 if not exists:
-                    conn.execute(text(migration["apply"]))
-                    conn.commit()
+                    if migration.get("autocommit"):
+                        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+                        conn.commit()
+                        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as autocommit_conn:
+                            autocommit_conn.execute(text(migration["apply"]))
+                    else:
+                        conn.execute(text(migration["apply"]))
+                        conn.commit()
                     logger.info(f"✅ Applied migration: {migration['name']}")
                 else:
                     logger.debug(f"✓ Migration already applied: {migration['name']}")
             except Exception as e:
+                conn.rollback()
                 logger.warning(f"⚠️ Migration {migration['name']} failed: {e}")
                 # Don't fail startup - the app can still work without this column
 
@@ -1,162 +1,313 @@
 """Database CRUD operations for campaigns, brands, products, and campaigns."""
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc, func
+from sqlalchemy.orm import Session, joinedload, lazyload, load_only
+from sqlalchemy import DateTime, Integer, Numeric, bindparam, cast, delete, desc, exists, func, insert, lambda_stmt, or_, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID, array as pg_array
+from sqlalchemy.exc import DBAPIError
 from app.database.models import Campaign, Brand, Product, Creative, User  # User model for FK resolution
+from app.database import connection as db_connection
+from app.cache import campaigns as campaign_cache
+from app.cache import ownership as ownership_cache
+from app.config import settings
 from app.models.schemas import (
     CreateCampaignRequest,
     CampaignResponse,
     CampaignDetailResponse
 )
 from uuid import UUID
-from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime
+from functools import wraps
+from cachetools import TTLCache
+from typing import List, Optional, Dict, Any, Tuple, Iterator, Union
+import inspect
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Cache keys below are the 16-byte UUID form (see _uuid_key), so string and
+# UUID inputs for the same id share one entry.
+
+# Confirmed campaign ownership, keyed by (campaign_id, user_id). Only True is
+# stored - never ORM objects, which would outlive their session.
+_CAMPAIGN_OWNER_CACHE = TTLCache(maxsize=10_000, ttl=30)
+
+# Confirmed brand ownership, keyed by (brand_id, user_id). Only True is
+# stored; checked before every product operation.
+_BRAND_OWNER_CACHE = TTLCache(maxsize=50_000, ttl=300)
+
+# Dashboard stats aggregates, keyed by user_id / brand_id. Polling endpoints
+# hit these repeatedly, so a short TTL absorbs most of the aggregate queries.
+_GENERATION_STATS_CACHE = TTLCache(maxsize=10_000, ttl=settings.stats_cache_ttl_seconds)
+_BRAND_STATS_CACHE = TTLCache(maxsize=10_000, ttl=settings.stats_cache_ttl_seconds)
+
+# The hottest lookups (ownership probes, owned campaign by id) are built with
+# lambda_stmt, so the statement is constructed once and later calls only
+# rebind their ids.
+
+# Loader options for a campaign with its product and brand
+_CAMPAIGN_WITH_BRAND = (joinedload(Campaign.product).joinedload(Product.brand),)
+
+# Coalesced non-terminal creative progress ticks, keyed by creative_id and
+# written by a background thread every PROGRESS_FLUSH_INTERVAL seconds
+PROGRESS_FLUSH_INTERVAL = 0.5
+TERMINAL_CREATIVE_STATUSES = ("completed", "failed")
+_pending_progress: Dict[UUID, Dict[str, Any]] = {}
+_pending_progress_lock = threading.Lock()
+_progress_flusher: Optional[threading.Thread] = None
+
+# Both spellings are written by different generations of the pipeline
+FAILED_CAMPAIGN_STATUSES = ("FAILED", "failed")
+
+# Retries for write helpers aborted by serialization_failure / deadlock_detected
+TRANSIENT_DB_RETRIES = 3
+TRANSIENT_DB_BACKOFF = 0.05  # seconds, doubled per attempt
+_TRANSIENT_PGCODES = frozenset({"40001", "40P01"})
+
+# Batch size for yield_per streaming of large result sets
+STREAM_BATCH_SIZE = 500
+
+# Updatable column names per model, used to filter **updates in the update_*
+# helpers. Keys and ownership columns are never writable through **updates.
+_BRAND_UPDATABLE = frozenset(c.key for c in Brand.__table__.columns) - {
+    "id", "user_id", "created_at", "extracted_guidelines_json", "guidelines_extracted_at"
+}
+_PRODUCT_UPDATABLE = frozenset(c.key for c in Product.__table__.columns) - {"id", "brand_id", "user_id", "created_at"}
+_CAMPAIGN_UPDATABLE = frozenset(c.key for c in Campaign.__table__.columns) - {"id", "product_id", "user_id", "created_at"}
+_CREATIVE_UPDATABLE = frozenset(c.key for c in Creative.__table__.columns) - {"id", "campaign_id", "user_id", "created_at"}
+
+
+def _is_transient_db_error(e: BaseException) -> bool:
+    """True for a serialization failure or deadlock reported by Postgres."""
+    return isinstance(e, DBAPIError) and getattr(e.orig, "pgcode", None) in _TRANSIENT_PGCODES
+
+
+def _retry_on_transient_error(func):
+    """
+    Retry a write helper when Postgres aborts it with a serialization failure
+    or deadlock.
+
+    Those errors are safe to retry once the transaction has been rolled back,
+    which the helpers' own except blocks do when they own the commit; helpers
+    that otherwise swallow errors must still re-raise transient ones (see
+    _is_transient_db_error). With auto_commit=False the caller owns the (now
+    aborted) transaction, so the error is re-raised for the caller to handle.
+    """
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        # Resolve auto_commit however it was passed (keyword, positional or default)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        auto_commit = bound.arguments.get("auto_commit", True)
+        for attempt in range(TRANSIENT_DB_RETRIES + 1):
+            try:
+                return func(*args, **kwargs)
+            except DBAPIError as e:
+                pgcode = getattr(e.orig, "pgcode", None)
+                if (not _is_transient_db_error(e) or not auto_commit
+                        or attempt == TRANSIENT_DB_RETRIES):
+                    raise
+                logger.warning("⚠️ %s hit transient DB error %s, retrying (%s/%s)",
+                               func.__name__, pgcode, attempt + 1, TRANSIENT_DB_RETRIES)
+                time.sleep(TRANSIENT_DB_BACKOFF * (2 ** attempt))
+    return wrapper
+
+
+def _commit(db: Session, auto_commit: bool) -> None:
+    """
+    Commit the session, or only flush it when the caller owns the transaction.
+
+    Callers chaining several writes can wrap them in ``with db.begin():`` (or
+    ``db.begin_nested()`` for a SAVEPOINT) and pass auto_commit=False, paying
+    for a single COMMIT instead of one per helper.
+    """
+    if auto_commit:
+        db.commit()
+    else:
+        db.flush()
 
-# ============================================================================
-# CREATE Operations
-# ============================================================================
 
-def create_campaign(
-    db: Session,
-    user_id: UUID,
-    title: str,
-    brief: str,
-    ad_campaign_json: Dict[str, Any],
-    mood: str = "uplifting",
-    duration: int = 30,
-    aspect_ratio: str = "16:9",
-    # STORY 3: New multi-format parameters
-    product_images: Optional[List[str]] = None,
-    scene_backgrounds: Optional[List[Dict[str, str]]] = None,
-    output_formats: Optional[List[str]] = None,
-    selected_style: Optional[str] = None  # PHASE 7: User-selected style
-) -> Campaign:
+def _update_returning(db: Session, model, criteria: Tuple, values: Dict[str, Any]):
     """
-    Create a new campaign in the database.
+    UPDATE model SET values WHERE criteria RETURNING model, in one round trip.
 
-    Args:
-        db: Database session
-        user_id: ID of the user creating the campaign
-        title: Campaign title
-        brief: Product brief/description
-        ad_campaign_json: Complete ad campaign configuration as JSON
-        mood: Video mood/style (deprecated, kept for compatibility)
-        duration: Video duration in seconds
-        aspect_ratio: DEPRECATED - Video aspect ratio (9:16, 1:1, or 16:9)
-        product_images: STORY 3 - Array of product image URLs (max 10)
-        scene_backgrounds: STORY 3 - Array of scene background mappings
-        output_formats: STORY 3 - Array of desired aspect ratios
-        selected_style: (PHASE 7) User-selected video style or None
-        product_name: (Phase 9) Product product name (e.g., "Noir Élégance")
-        product_gender: (Phase 9) Product gender ('masculine', 'feminine', 'unisex')
-        num_variations: (MULTI-VARIATION) Number of video variations to generate (1-3)
+    Returns the updated (identity-mapped) object, or None when no row matched.
+    With nothing to write it only SELECTs the matching row.
+    """
+    if not values:
+        return db.execute(select(model).where(*criteria)).scalar_one_or_none()
+    # "fetch" syncs identity-mapped objects from the RETURNING rows instead of
+    # evaluating the criteria in Python (which would load expired attributes)
+    return db.execute(
+        update(model).where(*criteria).values(**values).returning(model),
+        execution_options={"synchronize_session": "fetch"},
+    ).scalar_one_or_none()
 
-    Returns:
-        Campaign: Created campaign object
 
-    Raises:
-        Exception: If database insert fails
+def _uuid_key(value: Union[UUID, str]) -> bytes:
+    """Canonical cache key for an id: the 16 raw bytes, parsing strings once."""
+    if not isinstance(value, UUID):
+        value = UUID(str(value))
+    return value.bytes
+
+
+def _forget_brand_stats(
+    db: Session,
+    product_id: Optional[UUID] = None,
+    campaign_id: Optional[UUID] = None
+) -> None:
+    """
+    Drop the cached get_brand_stats() entry of the brand owning a product or campaign.
+
+    The brand is only looked up when this process has cached stats at all.
+    """
+    if not _BRAND_STATS_CACHE:
+        return
+    query = select(Product.brand_id)
+    if campaign_id is not None:
+        query = query.join(Campaign, Campaign.product_id == Product.id).where(Campaign.id == campaign_id)
+    else:
+        query = query.where(Product.id == product_id)
+    brand_id = db.scalar(query)
+    if brand_id is not None:
+        _BRAND_STATS_CACHE.pop(_uuid_key(brand_id), None)
+
+
+def _owns_brand(db: Session, brand_id: UUID, user_id: UUID) -> bool:
+    """Check brand ownership, answering repeat checks from _BRAND_OWNER_CACHE."""
+    key = (_uuid_key(brand_id), _uuid_key(user_id))
+    if key in _BRAND_OWNER_CACHE:
+        return True
+
+    owned = db.scalar(lambda_stmt(
+        lambda: select(exists().where(Brand.id == brand_id, Brand.user_id == user_id))
+    ))
+    if owned:
+        _BRAND_OWNER_CACHE[key] = True
+    return owned
+
+
+def _user_owns_product(db: Session, user_id: UUID, product_id: UUID) -> bool:
+    """SELECT EXISTS ownership check for a product (Redis-cached); no product row is loaded."""
+    return ownership_cache.get_or_check(
+        ownership_cache.PRODUCT, user_id, product_id,
+        lambda: db.scalar(lambda_stmt(
+            lambda: select(exists().where(Product.id == product_id, Product.user_id == user_id))
+        ))
+    )
+
+
+def _user_owns_campaign(db: Session, user_id: UUID, campaign_id: UUID) -> bool:
+    """SELECT EXISTS ownership check for a campaign (Redis-cached); no campaign row is loaded."""
+    return ownership_cache.get_or_check(
+        ownership_cache.CAMPAIGN, user_id, campaign_id,
+        lambda: db.scalar(lambda_stmt(
+            lambda: select(exists().where(Campaign.id == campaign_id, Campaign.user_id == user_id))
+        ))
+    )
+
+
+def _campaign_owned_by(user_id: UUID):
+    """Clause matching campaigns owned by user_id (via the denormalized owner column)."""
+    return Campaign.user_id == user_id
+
+
+def _campaign_row(campaign: Campaign) -> Dict[str, Any]:
+    """Loaded column values of a campaign, as stored in the campaign listing cache."""
+    loaded = campaign.__dict__
+    return {c.key: loaded[c.key] for c in Campaign.__table__.columns if c.key in loaded}
+
+
+def _campaign_from_row(row: Dict[str, Any]) -> Campaign:
+    """Rebuild a transient Campaign from a cached row, restoring UUID/datetime columns."""
+    values = dict(row)
+    for column in Campaign.__table__.columns:
+        value = values.get(column.key)
+        if isinstance(value, str):
+            if isinstance(column.type, PG_UUID):
+                values[column.key] = UUID(value)
+            elif isinstance(column.type, DateTime):
+                values[column.key] = datetime.fromisoformat(value)
+    return Campaign(**values)
+
+
+def page_cursor(items: List[Any], limit: int) -> Optional[Tuple[datetime, UUID]]:
     """
-    try:
-        # Default output_formats if not provided
-        if output_formats is None:
-            output_formats = [aspect_ratio]  # Use aspect_ratio as fallback
+    Build the keyset cursor for the page after ``items``.
 
-        campaign = Campaign(
-            user_id=user_id,
-            title=title,
-            ad_campaign_json=ad_campaign_json,
-            status="PENDING",
-            selected_style=selected_style,  # PHASE 7: Store selected style
-            progress=0,
-            cost=0.0,
-            aspect_ratio=aspect_ratio,  # Kept for backward compatibility
-            # STORY 3: New fields
-            product_images=product_images,
-            scene_backgrounds=scene_backgrounds,
-            output_formats=output_formats,
-            product_name=product_name,  # Phase 9: Store product name
-            product_gender=product_gender,  # Phase 9: Store product gender
-            num_variations=num_variations,  # MULTI-VARIATION: Store variation count
-            selected_variation_index=None  # MULTI-VARIATION: No selection yet
-        )
-        db.add(campaign)
-        db.commit()
-        db.refresh(campaign)
-        logger.info(f"✅ Created campaign {campaign.id} for user {user_id} with {len(output_formats)} output formats")
-        return campaign
-    except Exception as e:
-        try:
-            db.rollback()
-        except:
-            pass
-        logger.error(f"❌ Failed to create campaign: {e}")
-        # Create in-memory mock campaign for development
-        logger.warning("⚠️ Using mock campaign (database connection issue)")
-        from uuid import uuid4
-        from datetime import datetime
-        mock_campaign = Campaign(
-            user_id=user_id,
-            title=title,
-            ad_campaign_json=ad_campaign_json,
-            status="PENDING",
-            progress=0,
-            cost=0.0,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-        mock_campaign.id = uuid4()
-        return mock_campaign
+    Returns (created_at, id) of the last item, or None when the page came back
+    short and there is nothing left to fetch.
+    """
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return (last.created_at, last.id)
 
 
 # ============================================================================
 # READ Operations
 # ============================================================================
 
-def get_campaign(db: Session, campaign_id: UUID) -> Optional[Campaign]:
+def _mock_campaign(campaign_id: UUID) -> Campaign:
     """
-    Get a single campaign by ID.
+    Build an in-memory campaign for local development without a database.
 
-    Args:
-        db: Database session
-        campaign_id: ID of the campaign to retrieve
+    Only used when settings.dev_mock_without_db is enabled.
+    """
+    from datetime import datetime
+    now = datetime.utcnow()
+    return Campaign(
+        id=campaign_id,
+        name=f"Campaign {campaign_id}",
+        seasonal_event="",
+        year=now.year,
+        duration=30,
+        scene_configs=[],
+        status="pending",
+        progress=0,
+        created_at=now,
+        updated_at=now
+    )
 
-    Returns:
-        Campaign: Campaign object if found, None otherwise
+
+def _get_campaign_by_user_real(db: Session, campaign_id: UUID, user_id: UUID) -> Optional[Campaign]:
+    """
+    Fetch a campaign owned by user_id, None on miss or error.
+
+    Confirmed ownership is cached per (campaign_id, user_id) so repeat lookups
+    load the campaign by primary key (an identity-map hit within a session).
     """
+    key = (_uuid_key(campaign_id), _uuid_key(user_id))
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        if key in _CAMPAIGN_OWNER_CACHE:
+            campaign = db.get(Campaign, campaign_id)
+        else:
+            campaign = db.query(Campaign).filter(
+                Campaign.id == campaign_id,
+                _campaign_owned_by(user_id)
+            ).first()
+            if campaign:
+                _CAMPAIGN_OWNER_CACHE[key] = True
         if campaign:
-            logger.debug(f"✅ Retrieved campaign {campaign_id}")
+            logger.debug("✅ User %s owns campaign %s", user_id, campaign_id)
         else:
-            logger.debug(f"⚠️ Campaign {campaign_id} not found")
+            logger.warning("⚠️ User %s does not own campaign %s", user_id, campaign_id)
         return campaign
     except Exception as e:
-        logger.error(f"❌ Failed to get campaign {campaign_id}: {e}")
-        # In development mode with DB issues, create a mock campaign
-        logger.warning(f"⚠️ Database error - creating mock campaign for development")
-        from datetime import datetime
-        mock_campaign = Campaign(
-            id=campaign_id,
-            user_id=UUID('00000000-0000-0000-0000-000000000001'),  # Default user
-            title=f"Campaign {campaign_id}",
-            ad_campaign_json={},
-            status="PENDING",
-            progress=0,
-            cost=0.0,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-        return mock_campaign
+        logger.error("❌ Failed to get campaign %s: %s", campaign_id, e)
+        return None
 
 
 def get_campaign_by_user(db: Session, campaign_id: UUID, user_id: UUID) -> Optional[Campaign]:
     """
     Get a campaign by ID and verify user ownership.
 
+    When there is no database session and settings.dev_mock_without_db is
+    enabled, an in-memory mock campaign is returned for local development.
+
     Args:
         db: Database session
         campaign_id: ID of the campaign
@@ -165,50 +316,66 @@ def get_campaign_by_user(db: Session, campaign_id: UUID, user_id: UUID) -> Optio
     Returns:
         Campaign: Campaign if found and owned by user, None otherwise
     """
-    # If db is None, create a mock campaign for development
     if db is None:
-        logger.warning(f"⚠️ Database session is None - creating mock campaign for development")
-        from datetime import datetime
-        mock_campaign = Campaign(
-            id=campaign_id,
-            user_id=user_id,
-            title=f"Campaign {campaign_id}",
-            ad_campaign_json={},
-            status="PENDING",
-            progress=0,
-            cost=0.0,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-        return mock_campaign
+        if settings.dev_mock_without_db:
+            logger.warning("⚠️ Database session is None - creating mock campaign for development")
+            return _mock_campaign(campaign_id)
+        logger.warning("⚠️ Database session is None - cannot load campaign %s", campaign_id)
+        return None
+
+    return _get_campaign_by_user_real(db, campaign_id, user_id)
 
+
+def campaign_belongs_to_brand(db: Session, campaign_id: UUID, brand_id: UUID) -> bool:
+    """
+    Check whether a campaign belongs to a brand (via its product).
+
+    Runs a single EXISTS query instead of loading the campaign, product and
+    brand rows, for callers that only need the ownership answer.
+
+    Args:
+        db: Database session
+        campaign_id: ID of the campaign
+        brand_id: ID of the brand
+
+    Returns:
+        bool: True if the campaign exists and belongs to the brand
+    """
     try:
-        campaign = db.query(Campaign).filter(
-            Campaign.id == campaign_id,
-            Campaign.user_id == user_id
-        ).first()
-        if campaign:
-            logger.debug(f"✅ User {user_id} owns campaign {campaign_id}")
-        else:
-            logger.warning(f"⚠️ User {user_id} does not own campaign {campaign_id}")
-        return campaign
+        return db.query(
+            exists().where(
+                Campaign.id == campaign_id,
+                Campaign.product_id == Product.id,
+                Product.brand_id == brand_id
+            )
+        ).scalar()
     except Exception as e:
-        logger.error(f"❌ Failed to get campaign {campaign_id}: {e}")
-        # In development mode with DB issues, create a mock campaign for development
-        logger.warning(f"⚠️ Database error - creating mock campaign for development")
-        from datetime import datetime
-        mock_campaign = Campaign(
-            id=campaign_id,
-            user_id=user_id,
-            title=f"Campaign {campaign_id}",
-            ad_campaign_json={},
-            status="PENDING",
-            progress=0,
-            cost=0.0,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
-        return mock_campaign
+        logger.error("❌ Failed to check ownership of campaign %s: %s", campaign_id, e)
+        return False
+
+
+def product_belongs_to_brand(db: Session, product_id: UUID, brand_id: UUID) -> bool:
+    """
+    Check whether a product belongs to a brand with a single EXISTS query.
+
+    Args:
+        db: Database session
+        product_id: ID of the product
+        brand_id: ID of the brand
+
+    Returns:
+        bool: True if the product exists and belongs to the brand
+    """
+    try:
+        return db.query(
+            exists().where(
+                Product.id == product_id,
+                Product.brand_id == brand_id
+            )
+        ).scalar()
+    except Exception as e:
+        logger.error("❌ Failed to check ownership of product %s: %s", product_id, e)
+        return False
 
 
 def get_user_campaigns(
@@ -239,10 +406,10 @@ def get_user_campaigns(
 
         campaigns = query.order_by(desc(Campaign.created_at)).limit(limit).offset(offset).all()
 
-        logger.info(f"✅ Retrieved {len(campaigns)} campaigns for user {user_id}")
+        logger.info("✅ Retrieved %s campaigns for user %s", len(campaigns), user_id)
         return campaigns
     except Exception as e:
-        logger.error(f"❌ Failed to get campaigns for user {user_id}: {e}")
+        logger.error("❌ Failed to get campaigns for user %s: %s", user_id, e)
         # Return empty list instead of raising - allows development without DB
         logger.warning("⚠️ Returning empty campaign list (database connection issue)")
         return []
@@ -252,27 +419,37 @@ def get_campaigns_by_status(
     db: Session,
     status: str,
     limit: int = 50
-) -> List[Campaign]:
+) -> Iterator[Campaign]:
     """
     Get all campaigns with a specific status (for monitoring/admin).
 
+    Rows are streamed in batches of STREAM_BATCH_SIZE rather than
+    materialized into a list, so large monitoring scans keep memory flat.
+    The session must stay open while the result is iterated.
+    Only in-flight statuses ("pending", "processing") are index-backed,
+    via the partial ix_campaigns_status_active.
+
     Args:
         db: Database session
         status: Status to filter by (e.g., "GENERATING_SCENES", "FAILED")
         limit: Maximum number of campaigns to return
 
     Returns:
-        List[Campaign]: List of matching campaigns
+        Iterator[Campaign]: Matching campaigns, most recently updated first
     """
     try:
-        campaigns = db.query(Campaign).filter(
-            Campaign.status == status
-        ).order_by(desc(Campaign.updated_at)).limit(limit).all()
-
-        logger.info(f"✅ Found {len(campaigns)} campaigns with status '{status}'")
+        campaigns = db.execute(
+            select(Campaign)
+            .where(Campaign.status == status)
+            .order_by(desc(Campaign.updated_at))
+            .limit(limit)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        ).scalars()
+
+        logger.debug("✅ Streaming campaigns with status '%s' (limit %s)", status, limit)
         return campaigns
     except Exception as e:
-        logger.error(f"❌ Failed to get campaigns by status {status}: {e}")
+        logger.error("❌ Failed to get campaigns by status %s: %s", status, e)
         raise
 
 
@@ -280,18 +457,24 @@ def get_campaigns_by_status(
 # UPDATE Operations
 # ============================================================================
 
-def update_campaign(
+@_retry_on_transient_error
+def update_campaign_by_id(
     db: Session,
     campaign_id: UUID,
+    auto_commit: bool = True,
     **updates
 ) -> Optional[Campaign]:
     """
-    Update campaign fields.
+    Update campaign fields without an ownership check.
+
+    For background jobs and routes that have already verified ownership;
+    request handlers holding a user_id should use update_campaign().
 
     Args:
         db: Database session
         campaign_id: ID of the campaign to update
-        **updates: Fields to update (status, progress, cost, ad_campaign_json, etc.)
+        **updates: Fields to update (status, progress, error_message, campaign_json, etc.)
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         Campaign: Updated campaign object if successful, None if campaign not found
@@ -300,34 +483,35 @@ def update_campaign(
         Exception: If database update fails
     """
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        updates = {k: v for k, v in updates.items() if k in _CAMPAIGN_UPDATABLE}
+        campaign = _update_returning(db, Campaign, (Campaign.id == campaign_id,), updates)
 
         if not campaign:
-            logger.warning(f"⚠️ Campaign {campaign_id} not found for update")
+            logger.warning("⚠️ Campaign %s not found for update", campaign_id)
             return None
 
-        # Update fields
-        for key, value in updates.items():
-            if hasattr(campaign, key):
-                setattr(campaign, key, value)
+        _commit(db, auto_commit)
+        campaign_cache.invalidate_product(campaign.product_id)
 
-        db.commit()
-        db.refresh(campaign)
-
-        logger.info(f"✅ Updated campaign {campaign_id}: {list(updates.keys())}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Updated campaign %s: %s", campaign_id, list(updates.keys()))
         return campaign
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to update campaign {campaign_id}: {e}")
+        logger.error("❌ Failed to update campaign %s: %s", campaign_id, e)
         raise
 
 
+@_retry_on_transient_error
 def update_campaign_status(
     db: Session,
     campaign_id: UUID,
     status: str,
     progress: int = 0,
-    error_message: Optional[str] = None
+    error_message: Optional[str] = None,
+    auto_commit: bool = True
 ) -> Optional[Campaign]:
     """
     Update campaign status and progress.
@@ -338,46 +522,91 @@ def update_campaign_status(
         status: New status (e.g., "GENERATING_SCENES")
         progress: Progress percentage (0-100)
         error_message: Optional error message
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         Campaign: Updated campaign object
     """
     # If db is None, just log and skip update
     if db is None:
-        logger.warning(f"⚠️ Database session is None - skipping status update for {campaign_id}")
+        logger.warning("⚠️ Database session is None - skipping status update for %s", campaign_id)
         return None
 
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        values = {"status": status, "progress": max(0, min(100, progress))}  # Clamp 0-100
+        if error_message:
+            values["error_message"] = error_message
+
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE + refresh
+        campaign = _update_returning(db, Campaign, (Campaign.id == campaign_id,), values)
 
         if not campaign:
             return None
 
-        campaign.status = status
-        campaign.progress = max(0, min(100, progress))  # Clamp 0-100
-        if error_message:
-            campaign.error_message = error_message
-
-        db.commit()
-        db.refresh(campaign)
+        _commit(db, auto_commit)
+        campaign_cache.invalidate_product(campaign.product_id)
 
-        logger.info(f"✅ Updated campaign {campaign_id} status to {status} ({progress}%)")
+        logger.info("✅ Updated campaign %s status to %s (%s%%)", campaign_id, status, progress)
         return campaign
     except Exception as e:
+        if not auto_commit:
+            raise
         try:
             db.rollback()
         except:
             pass
-        logger.error(f"❌ Failed to update status for {campaign_id}: {e}")
+        if _is_transient_db_error(e):
+            raise
+        logger.error("❌ Failed to update status for %s: %s", campaign_id, e)
         # In development mode with DB issues, just log and continue
-        logger.warning(f"⚠️ Database error updating status - continuing with in-memory state")
+        logger.warning("⚠️ Database error updating status - continuing with in-memory state")
         return None
 
 
+@_retry_on_transient_error
+def mark_campaign_processing(db: Session, campaign_id: UUID, auto_commit: bool = True) -> bool:
+    """
+    Set a campaign's status to "processing" unless it already is.
+
+    The status guard is part of the UPDATE, so a campaign that is already
+    processing (e.g. a retried job) costs no row write.
+
+    Args:
+        db: Database session
+        campaign_id: ID of the campaign
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
+
+    Returns:
+        bool: True if the status changed, False if it was already processing or the campaign does not exist
+    """
+    try:
+        product_id = db.execute(
+            update(Campaign)
+            .where(Campaign.id == campaign_id, Campaign.status.is_distinct_from("processing"))
+            .values(status="processing")
+            .returning(Campaign.product_id),
+            execution_options={"synchronize_session": "fetch"},
+        ).scalar_one_or_none()
+        _commit(db, auto_commit)
+        if product_id is None:
+            return False
+
+        campaign_cache.invalidate_product(product_id)
+        return True
+    except Exception as e:
+        if not auto_commit:
+            raise
+        db.rollback()
+        logger.error("❌ Failed to mark campaign %s processing: %s", campaign_id, e)
+        raise
+
+
+@_retry_on_transient_error
 def update_campaign_cost(
     db: Session,
     campaign_id: UUID,
-    cost: float
+    cost: float,
+    auto_commit: bool = True
 ) -> Optional[Campaign]:
     """
     Update campaign cost tracking.
@@ -386,35 +615,40 @@ def update_campaign_cost(
         db: Database session
         campaign_id: ID of the campaign
         cost: Total cost in USD
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         Campaign: Updated campaign object
     """
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        campaign = db.get(Campaign, campaign_id)
 
         if not campaign:
             return None
 
         campaign.cost = round(float(cost), 2)
 
-        db.commit()
-        db.refresh(campaign)
+        _commit(db, auto_commit)
+        campaign_cache.invalidate_product(campaign.product_id)
 
-        logger.info(f"✅ Updated campaign {campaign_id} cost to ${campaign.cost}")
+        logger.info("✅ Updated campaign %s cost to $%s", campaign_id, campaign.cost)
         return campaign
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to update cost for {campaign_id}: {e}")
+        logger.error("❌ Failed to update cost for %s: %s", campaign_id, e)
         raise
 
 
+@_retry_on_transient_error
 def update_campaign_output(
     db: Session,
     campaign_id: UUID,
     final_videos: Dict[str, str],
     total_cost: float,
-    cost_breakdown: Dict[str, float]
+    cost_breakdown: Dict[str, float],
+    auto_commit: bool = True
 ) -> Optional[Campaign]:
     """
     Update campaign with final output and cost breakdown.
@@ -423,49 +657,139 @@ def update_campaign_output(
         db: Database session
         campaign_id: ID of the campaign
         final_videos: Dict with aspect ratio as key (16:9) and S3 URL as value
-        total_cost: Total cost in USD
+        total_cost: Total cost in USD (logged; cost is stored per creative)
         cost_breakdown: Dict with cost per service
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         Campaign: Updated campaign object
     """
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        # Patch only the two keys server-side with jsonb_set instead of
+        # copying the whole document in Python and writing it back
+        campaign_json = func.coalesce(Campaign.campaign_json, cast({}, JSONB))
+        campaign_json = func.jsonb_set(campaign_json, pg_array(["aspectExports"]), cast(final_videos, JSONB))
+        campaign_json = func.jsonb_set(campaign_json, pg_array(["costBreakdown"]), cast(cost_breakdown, JSONB))
+
+        campaign = _update_returning(
+            db, Campaign, (Campaign.id == campaign_id,),
+            {"campaign_json": campaign_json, "status": "COMPLETED", "progress": 100}
+        )
 
         if not campaign:
             return None
 
-        # Update output videos in ad_campaign_json
-        # Must create new dict to trigger SQLAlchemy change detection for JSON fields
-        if isinstance(campaign.ad_campaign_json, dict):
-            updated_json = dict(campaign.ad_campaign_json)
-            updated_json["aspectExports"] = final_videos
-            updated_json["costBreakdown"] = cost_breakdown
-            campaign.ad_campaign_json = updated_json
-            # Mark as modified to ensure SQLAlchemy detects the change
-            from sqlalchemy.orm.attributes import flag_modified
-            flag_modified(campaign, "ad_campaign_json")
+        _commit(db, auto_commit)
+        campaign_cache.invalidate_product(campaign.product_id)
 
-        
-        campaign.cost = round(float(total_cost), 2)
-        campaign.status = "COMPLETED"
-        campaign.progress = 100
+        logger.info("✅ Updated campaign %s with final output, cost: $%.2f", campaign_id, total_cost)
+        return campaign
+    except Exception as e:
+        if not auto_commit:
+            raise
+        db.rollback()
+        logger.error("❌ Failed to update campaign output %s: %s", campaign_id, e)
+        raise
 
-        db.commit()
-        db.refresh(campaign)
 
-        logger.info(f"✅ Updated campaign {campaign_id} with final output, cost: ${total_cost:.2f}")
+def _jsonb_set_path(doc, source, path: Tuple[str, ...], value):
+    """
+    jsonb_set(doc, path, value), first creating any missing parent objects.
+
+    jsonb_set only creates the last key of a path, so each parent is set to
+    its current value in ``source`` (the stored column), or {} when absent.
+    """
+    for depth in range(1, len(path)):
+        parent = path[:depth]
+        doc = func.jsonb_set(doc, pg_array(list(parent)), func.coalesce(source[parent], cast({}, JSONB)))
+    return func.jsonb_set(doc, pg_array(list(path)), value)
+
+
+@_retry_on_transient_error
+def apply_scene_edit(
+    db: Session,
+    campaign_id: UUID,
+    scene_index: int,
+    scene_updates: Dict[str, Any],
+    variation_index: int,
+    final_video_url: str,
+    edit_record: Dict[str, Any],
+    edit_cost: float,
+    auto_commit: bool = True
+) -> Optional[Campaign]:
+    """
+    Record a finished scene edit in campaign_json and mark the campaign completed.
+
+    The document is patched server-side: the scene's fields, the variation's
+    9:16 export URL and the edit history are updated with jsonb_set/||, so
+    the rest of campaign_json is neither sent back nor rewritten from Python,
+    and concurrent edits append to the history instead of overwriting it.
+
+    Args:
+        db: Database session
+        campaign_id: ID of the campaign
+        scene_index: 0-based index into campaign_json['scenes']
+        scene_updates: Keys to set on that scene (e.g. background_prompt)
+        variation_index: Variation whose 9:16 export was re-rendered
+        final_video_url: URL of the re-rendered final video
+        edit_record: Entry appended to edit_history.edits
+        edit_cost: Cost of the edit, added to edit_history.total_edit_cost
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
+
+    Returns:
+        Campaign: Updated campaign object, None if the campaign does not exist
+    """
+    try:
+        source = Campaign.campaign_json
+        campaign_json = func.coalesce(source, cast({}, JSONB))
+
+        for key, value in scene_updates.items():
+            campaign_json = func.jsonb_set(
+                campaign_json, pg_array(["scenes", str(scene_index), key]), cast(value, JSONB)
+            )
+
+        campaign_json = _jsonb_set_path(
+            campaign_json, source,
+            ("variationPaths", f"variation_{variation_index}", "aspectExports", "9:16"),
+            cast(final_video_url, JSONB)
+        )
+
+        history = func.coalesce(source[("edit_history",)], cast({}, JSONB)).op("||")(func.jsonb_build_object(
+            "edits", func.coalesce(source[("edit_history", "edits")], cast([], JSONB)).op("||")(
+                func.jsonb_build_array(cast(edit_record, JSONB))
+            ),
+            "total_edit_cost", func.coalesce(cast(source[("edit_history", "total_edit_cost")].astext, Numeric), 0) + edit_cost,
+            "edit_count", func.coalesce(cast(source[("edit_history", "edit_count")].astext, Integer), 0) + 1,
+        ))
+        campaign_json = func.jsonb_set(campaign_json, pg_array(["edit_history"]), history)
+
+        campaign = _update_returning(
+            db, Campaign, (Campaign.id == campaign_id,),
+            {"campaign_json": campaign_json, "status": "completed"}
+        )
+
+        if not campaign:
+            return None
+
+        _commit(db, auto_commit)
+        campaign_cache.invalidate_product(campaign.product_id)
+
+        logger.info("✅ Recorded edit of scene %s for campaign %s", scene_index, campaign_id)
         return campaign
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to update campaign output {campaign_id}: {e}")
+        logger.error("❌ Failed to record scene edit for %s: %s", campaign_id, e)
         raise
 
 
+@_retry_on_transient_error
 def update_campaign_json(
     db: Session,
     campaign_id: UUID,
-    ad_campaign_json: Dict[str, Any]
+    ad_campaign_json: Dict[str, Any],
+    auto_commit: bool = True
 ) -> Optional[Campaign]:
     """
     Update the ad_campaign_json configuration.
@@ -474,66 +798,70 @@ def update_campaign_json(
         db: Database session
         campaign_id: ID of the campaign
         ad_campaign_json: New configuration JSON
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         Campaign: Updated campaign object
     """
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        campaign = _update_returning(db, Campaign, (Campaign.id == campaign_id,), {"campaign_json": ad_campaign_json})
 
         if not campaign:
             return None
 
-        campaign.campaign_json = ad_campaign_json
-
-        db.commit()
-        db.refresh(campaign)
+        _commit(db, auto_commit)
+        campaign_cache.invalidate_product(campaign.product_id)
 
-        logger.info(f"✅ Updated campaign {campaign_id} campaign_json")
+        logger.info("✅ Updated campaign %s campaign_json", campaign_id)
         return campaign
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to update json for {campaign_id}: {e}")
+        logger.error("❌ Failed to update json for %s: %s", campaign_id, e)
         raise
 
 
-# ============================================================================
-# DELETE Operations
-# ============================================================================
-
-def delete_campaign(db: Session, campaign_id: UUID, user_id: UUID) -> bool:
+@_retry_on_transient_error
+def save_brand_guidelines(
+    db: Session,
+    brand_id: UUID,
+    guidelines_json: Dict[str, Any],
+    auto_commit: bool = True
+) -> bool:
     """
-    Delete a campaign (only if owned by user).
+    Cache the extracted guidelines for a brand's current guidelines document.
+
+    update_brand() clears the cache when the guidelines document changes.
+    updated_at is left alone, since this is derived data, not a user edit.
 
     Args:
         db: Database session
-        campaign_id: ID of the campaign to delete
-        user_id: ID of the user (for verification)
+        brand_id: ID of the brand
+        guidelines_json: ExtractedGuidelines.to_dict() plus its source URL
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
-        bool: True if deleted, False if not found or unauthorized
-
-    Raises:
-        Exception: If database delete fails
+        bool: True if the brand was found and updated
     """
     try:
-        campaign = db.query(Campaign).filter(
-            Campaign.id == campaign_id,
-            Campaign.user_id == user_id
-        ).first()
-
-        if not campaign:
-            logger.warning(f"⚠️ Cannot delete: User {user_id} does not own campaign {campaign_id}")
+        brand = _update_returning(db, Brand, (Brand.id == brand_id,), {
+            "extracted_guidelines_json": guidelines_json,
+            "guidelines_extracted_at": datetime.utcnow(),
+            "updated_at": Brand.updated_at,
+        })
+        if not brand:
             return False
 
-        db.delete(campaign)
-        db.commit()
+        _commit(db, auto_commit)
 
-        logger.info(f"✅ Deleted campaign {campaign_id}")
+        logger.info("✅ Cached extracted guidelines for brand %s", brand_id)
         return True
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to delete campaign {campaign_id}: {e}")
+        logger.error("❌ Failed to cache guidelines for brand %s: %s", brand_id, e)
         raise
 
 
@@ -552,15 +880,32 @@ def get_generation_stats(db: Session, user_id: UUID) -> Dict[str, Any]:
     Returns:
         Dict with statistics (total campaigns, completed, failed, total cost, etc.)
     """
-    try:
-        user_campaigns = db.query(Campaign).filter(Campaign.user_id == user_id).all()
-
-        total = len(user_campaigns)
-        completed = len([p for p in user_campaigns if p.status == "COMPLETED"])
-        failed = len([p for p in user_campaigns if p.status == "FAILED"])
-        in_progress = len([p for p in user_campaigns if p.status.startswith("GENERATING") or p.status.startswith("EXTRACTING") or p.status.startswith("COMPOSITING")])
+    cached = _GENERATION_STATS_CACHE.get(_uuid_key(user_id))
+    if cached is not None:
+        return dict(cached)
 
-        total_cost = sum(float(p.cost) for p in user_campaigns)
+    try:
+        # Creatives are the per-user generation runs and carry both status and
+        # cost, so the whole summary is one aggregate over that table.
+        status = func.lower(Creative.status)
+        row = db.query(
+            func.count().label("total"),
+            func.count().filter(status == "completed").label("completed"),
+            func.count().filter(status == "failed").label("failed"),
+            func.count().filter(or_(
+                status == "processing",
+                status.like("generating%"),
+                status.like("extracting%"),
+                status.like("compositing%"),
+            )).label("in_progress"),
+            func.coalesce(func.sum(Creative.cost), 0).label("total_cost"),
+        ).filter(Creative.user_id == user_id).one()
+
+        total = row.total
+        completed = row.completed
+        failed = row.failed
+        in_progress = row.in_progress
+        total_cost = float(row.total_cost)
 
         stats = {
             "total_campaigns": total,
@@ -571,42 +916,52 @@ def get_generation_stats(db: Session, user_id: UUID) -> Dict[str, Any]:
             "success_rate": round((completed / total * 100) if total > 0 else 0, 1)
         }
 
-        logger.debug(f"✅ Generated stats for user {user_id}: {stats}")
-        return stats
+        _GENERATION_STATS_CACHE[_uuid_key(user_id)] = stats
+        logger.debug("✅ Generated stats for user %s: %s", user_id, stats)
+        return dict(stats)
     except Exception as e:
-        logger.error(f"❌ Failed to get stats for user {user_id}: {e}")
+        logger.error("❌ Failed to get stats for user %s: %s", user_id, e)
         raise
 
 
-def clear_old_failed_campaigns(db: Session, days: int = 7) -> int:
+@_retry_on_transient_error
+def clear_old_failed_campaigns(db: Session, days: int = 7, auto_commit: bool = True) -> int:
     """
     Delete failed campaigns older than N days (for cleanup).
 
     Args:
         db: Database session
         days: Number of days before cleanup
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         int: Number of campaigns deleted
     """
     try:
-        from datetime import datetime, timedelta
+        from datetime import timedelta
         cutoff = datetime.utcnow() - timedelta(days=days)
 
-        query = db.query(Campaign).filter(
-            Campaign.status == "FAILED",
-            Campaign.created_at < cutoff
-        )
-
-        count = query.count()
-        query.delete()
-        db.commit()
-
-        logger.info(f"✅ Deleted {count} failed campaigns older than {days} days")
+        # One DELETE; the returned product ids replace the separate COUNT(*)
+        # scan and name the listing caches to drop
+        product_ids = db.execute(
+            delete(Campaign)
+            .where(Campaign.status.in_(FAILED_CAMPAIGN_STATUSES), Campaign.created_at < cutoff)
+            .returning(Campaign.product_id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        count = len(product_ids)
+        _commit(db, auto_commit)
+        for product_id in set(product_ids):
+            campaign_cache.invalidate_product(product_id)
+            _forget_brand_stats(db, product_id=product_id)
+
+        logger.info("✅ Deleted %s failed campaigns older than %s days", count, days)
         return count
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to clean up old campaigns: {e}")
+        logger.error("❌ Failed to clean up old campaigns: %s", e)
         raise
 
 
@@ -614,73 +969,211 @@ def clear_old_failed_campaigns(db: Session, days: int = 7) -> int:
 # S3 RESTRUCTURING: New helper functions for per-campaign folders
 # ============================================================================
 
+@_retry_on_transient_error
 def update_campaign_s3_paths(
     db: Session,
     campaign_id: UUID,
     s3_campaign_folder: str,
-    s3_campaign_folder_url: str
+    s3_campaign_folder_url: str,
+    auto_commit: bool = True
 ) -> Optional[Campaign]:
     """
-    Update campaign with S3 folder paths.
+    Store a campaign's S3 folder paths.
 
-    Called after campaign creation to store the campaign's S3 folder location.
+    Campaign has no S3 columns; the paths live on the campaign's creatives,
+    exactly as bulk_update_campaign_s3_paths() writes them. Creatives added
+    after this call are not covered and show up in
+    get_campaigns_without_s3_paths().
 
     Args:
         db: Database session
         campaign_id: ID of the campaign
         s3_campaign_folder: S3 key prefix (e.g., "campaigns/{id}/")
         s3_campaign_folder_url: Public HTTPS URL to folder
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
-        Campaign: Updated campaign object
+        Campaign: The campaign, None if it does not exist
     """
     try:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+        campaign = db.get(Campaign, campaign_id)
 
         if not campaign:
-            logger.warning(f"⚠️ Campaign {campaign_id} not found for S3 path update")
+            logger.warning("⚠️ Campaign %s not found for S3 path update", campaign_id)
             return None
 
-        campaign.s3_campaign_folder = s3_campaign_folder
-        campaign.s3_campaign_folder_url = s3_campaign_folder_url
+        db.execute(
+            update(Creative)
+            .where(Creative.campaign_id == campaign_id)
+            .values(s3_campaign_folder=s3_campaign_folder, s3_campaign_folder_url=s3_campaign_folder_url),
+            execution_options={"synchronize_session": "fetch"},
+        )
 
-        db.commit()
-        db.refresh(campaign)
+        _commit(db, auto_commit)
 
-        logger.info(f"✅ Updated campaign {campaign_id} S3 paths")
+        logger.info("✅ Updated campaign %s S3 paths", campaign_id)
         return campaign
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to update S3 paths for {campaign_id}: {e}")
+        logger.error("❌ Failed to update S3 paths for %s: %s", campaign_id, e)
         raise
 
 
 def get_campaigns_without_s3_paths(
     db: Session,
     limit: int = 100
-) -> List[Campaign]:
+) -> List[UUID]:
     """
-    Get campaigns that don't have S3 folder paths set (for migration).
+    Get IDs of campaigns that don't have S3 folder paths set (for migration).
 
     Useful for identifying campaigns created before restructuring was implemented.
+    The S3 folder is stored on each campaign's creatives, so a campaign is
+    listed when any of its creatives is missing it.
 
     Args:
         db: Database session
         limit: Maximum number to return
 
     Returns:
-        List of campaigns without S3 paths
+        List of campaign IDs without S3 paths
     """
     try:
-        campaigns = db.query(Campaign).filter(
-            (Campaign.s3_campaign_folder == None) |
-            (Campaign.s3_campaign_folder == "")
-        ).limit(limit).all()
+        # Select only the id column - no ORM objects, no JSONB hydration
+        rows = db.query(Creative.campaign_id).filter(
+            or_(Creative.s3_campaign_folder.is_(None), Creative.s3_campaign_folder == "")
+        ).distinct().limit(limit).all()
+        campaign_ids = [row.campaign_id for row in rows]
+
+        logger.info("✅ Found %s campaigns without S3 paths", len(campaign_ids))
+        return campaign_ids
+    except Exception as e:
+        logger.error("❌ Failed to get campaigns without S3 paths: %s", e)
+        raise
 
-        logger.info(f"✅ Found {len(campaigns)} campaigns without S3 paths")
-        return campaigns
+
+def iter_campaigns_without_s3_paths(
+    db: Session,
+    chunk_size: int = STREAM_BATCH_SIZE
+) -> Iterator[List[UUID]]:
+    """
+    Stream IDs of campaigns without S3 folder paths, one batch at a time.
+
+    Unbounded counterpart of get_campaigns_without_s3_paths() for migration
+    scripts: rows come from a server-side cursor in batches of chunk_size, so
+    memory stays flat however many campaigns need backfilling. Each batch
+    pairs naturally with bulk_update_campaign_s3_paths(). The session must
+    stay open while the generator is consumed.
+
+    Args:
+        db: Database session
+        chunk_size: Number of campaign IDs per yielded batch
+
+    Yields:
+        List[UUID]: Campaign IDs without S3 paths
+    """
+    result = db.execute(
+        select(Creative.campaign_id)
+        .where(or_(Creative.s3_campaign_folder.is_(None), Creative.s3_campaign_folder == ""))
+        .distinct()
+        .execution_options(stream_results=True, yield_per=chunk_size)
+    )
+    for partition in result.scalars().partitions():
+        yield list(partition)
+
+
+@_retry_on_transient_error
+def bulk_update_campaign_s3_paths(
+    db: Session,
+    rows: List[Tuple[UUID, str, str]],
+    auto_commit: bool = True
+) -> int:
+    """
+    Set S3 folder paths for many campaigns in one executemany UPDATE.
+
+    Batch counterpart of update_campaign_s3_paths() for migrations over
+    get_campaigns_without_s3_paths(). The paths are written to each
+    campaign's creatives. This is a Core UPDATE: the session's identity map
+    is bypassed, so already-loaded Creative objects keep their old values
+    until expired or refreshed.
+
+    Args:
+        db: Database session
+        rows: (campaign_id, s3_campaign_folder, s3_campaign_folder_url) tuples
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
+
+    Returns:
+        int: Number of campaigns in the batch
+    """
+    if not rows:
+        return 0
+
+    creatives = Creative.__table__
+    try:
+        db.execute(
+            update(creatives)
+            .where(creatives.c.campaign_id == bindparam("b_campaign_id"))
+            .values(
+                s3_campaign_folder=bindparam("b_folder"),
+                s3_campaign_folder_url=bindparam("b_url"),
+            ),
+            [
+                {"b_campaign_id": campaign_id, "b_folder": folder, "b_url": url}
+                for campaign_id, folder, url in rows
+            ],
+        )
+        _commit(db, auto_commit)
+
+        logger.info("✅ Bulk updated S3 paths for %s campaigns", len(rows))
+        return len(rows)
+    except Exception as e:
+        if not auto_commit:
+            raise
+        db.rollback()
+        logger.error("❌ Failed to bulk update S3 paths: %s", e)
+        raise
+
+
+@_retry_on_transient_error
+def bulk_update_creative_status(
+    db: Session,
+    rows: List[Tuple[UUID, str, int]],
+    auto_commit: bool = True
+) -> int:
+    """
+    Set status and progress for many creatives in one executemany UPDATE.
+
+    Fan-in counterpart of update_creative_status() for workers completing
+    several creatives at once. Uses bulk_update_mappings, which skips ORM
+    history tracking: already-loaded Creative objects are not updated and
+    the generation stats cache is not invalidated (it expires on its TTL).
+
+    Args:
+        db: Database session
+        rows: (creative_id, status, progress) tuples
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
+
+    Returns:
+        int: Number of creatives in the batch
+    """
+    if not rows:
+        return 0
+
+    try:
+        db.bulk_update_mappings(Creative, [
+            {"id": creative_id, "status": status, "progress": max(0, min(100, progress))}
+            for creative_id, status, progress in rows
+        ])
+        _commit(db, auto_commit)
+
+        logger.info("✅ Bulk updated status for %s creatives", len(rows))
+        return len(rows)
     except Exception as e:
-        logger.error(f"❌ Failed to get campaigns without S3 paths: {e}")
+        if not auto_commit:
+            raise
+        db.rollback()
+        logger.error("❌ Failed to bulk update creative status: %s", e)
         raise
 
 
@@ -688,6 +1181,7 @@ def get_campaigns_without_s3_paths(
 # Brand CRUD Operations (Phase 2 B2B SaaS)
 # ============================================================================
 
+@_retry_on_transient_error
 def create_brand(
     db: Session,
     user_id: UUID,
@@ -695,7 +1189,8 @@ def create_brand(
     brand_name: Optional[str] = None,
     description: Optional[str] = None,
     guidelines: Optional[str] = None,
-    logo_urls: Optional[Dict[str, Any]] = None
+    logo_urls: Optional[Dict[str, Any]] = None,
+    auto_commit: bool = True
 ) -> Brand:
     """
     Create a new brand in the database.
@@ -708,6 +1203,7 @@ def create_brand(
         description: Brand description (optional)
         guidelines: Brand guidelines (optional)
         logo_urls: JSONB object with logo URLs (optional)
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         Brand: Created brand object
@@ -725,13 +1221,14 @@ def create_brand(
             logo_urls=logo_urls
         )
         db.add(brand)
-        db.commit()
-        db.refresh(brand)
-        logger.info(f"✅ Created brand {brand.id} ({company_name}) for user {user_id}")
+        _commit(db, auto_commit)
+        logger.info("✅ Created brand %s (%s) for user %s", brand.id, company_name, user_id)
         return brand
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to create brand: {e}")
+        logger.error("❌ Failed to create brand: %s", e)
         raise
 
 
@@ -739,29 +1236,38 @@ def get_user_brands(
     db: Session,
     user_id: UUID,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[Tuple[datetime, UUID]] = None
 ) -> List[Brand]:
     """
-    Get all brands for a specific user.
+    Get all brands for a specific user, newest first.
 
     Args:
         db: Database session
         user_id: ID of the user
         limit: Maximum number of brands to return
-        offset: Number of brands to skip (for pagination)
+        offset: Number of brands to skip (ignored when cursor is given)
+        cursor: (created_at, id) of the last brand on the previous page;
+            see page_cursor(). Seeks past it instead of scanning offset rows.
 
     Returns:
         List[Brand]: List of brands owned by user
     """
     try:
-        brands = db.query(Brand).filter(
-            Brand.user_id == user_id
-        ).order_by(desc(Brand.created_at)).limit(limit).offset(offset).all()
+        query = db.query(Brand).filter(Brand.user_id == user_id)
+        if cursor is not None:
+            query = query.filter(tuple_(Brand.created_at, Brand.id) < tuple_(*cursor))
+
+        query = query.order_by(desc(Brand.created_at), desc(Brand.id))
+        if cursor is None:
+            query = query.offset(offset)
 
-        logger.info(f"✅ Retrieved {len(brands)} brands for user {user_id}")
+        brands = query.limit(limit).all()
+
+        logger.info("✅ Retrieved %s brands for user %s", len(brands), user_id)
         return brands
     except Exception as e:
-        logger.error(f"❌ Failed to get brands for user {user_id}: {e}")
+        logger.error("❌ Failed to get brands for user %s: %s", user_id, e)
         return []
 
 
@@ -786,13 +1292,13 @@ def get_brand_by_user_id(
         ).order_by(desc(Brand.created_at)).first()
 
         if brand:
-            logger.debug(f"✅ Found primary brand {brand.id} for user {user_id}")
+            logger.debug("✅ Found primary brand %s for user %s", brand.id, user_id)
         else:
-            logger.warning(f"⚠️ No brand found for user {user_id}")
+            logger.warning("⚠️ No brand found for user %s", user_id)
 
         return brand
     except Exception as e:
-        logger.error(f"❌ Failed to get brand for user {user_id}: {e}")
+        logger.error("❌ Failed to get brand for user %s: %s", user_id, e)
         return None
 
 
@@ -813,19 +1319,18 @@ def get_brand(
         Brand: Brand object if found and owned by user, None otherwise
     """
     try:
-        brand = db.query(Brand).filter(
-            Brand.id == brand_id,
-            Brand.user_id == user_id
-        ).first()
+        brand = db.get(Brand, brand_id)
+        if brand is not None and brand.user_id != user_id:
+            brand = None
 
         if brand:
-            logger.debug(f"✅ User {user_id} owns brand {brand_id}")
+            logger.debug("✅ User %s owns brand %s", user_id, brand_id)
         else:
-            logger.warning(f"⚠️ Brand {brand_id} not found or not owned by user {user_id}")
+            logger.warning("⚠️ Brand %s not found or not owned by user %s", brand_id, user_id)
 
         return brand
     except Exception as e:
-        logger.error(f"❌ Failed to get brand {brand_id}: {e}")
+        logger.error("❌ Failed to get brand %s: %s", brand_id, e)
         return None
 
 
@@ -847,23 +1352,25 @@ def get_brand_by_id(
         Brand: Brand object if found, None otherwise
     """
     try:
-        brand = db.query(Brand).filter(Brand.id == brand_id).first()
+        brand = db.get(Brand, brand_id)
 
         if brand:
-            logger.debug(f"✅ Found brand {brand_id}")
+            logger.debug("✅ Found brand %s", brand_id)
         else:
-            logger.warning(f"⚠️ Brand {brand_id} not found")
+            logger.warning("⚠️ Brand %s not found", brand_id)
 
         return brand
     except Exception as e:
-        logger.error(f"❌ Failed to get brand {brand_id}: {e}")
+        logger.error("❌ Failed to get brand %s: %s", brand_id, e)
         return None
 
 
+@_retry_on_transient_error
 def update_brand(
     db: Session,
     brand_id: UUID,
     user_id: UUID,
+    auto_commit: bool = True,
     **updates
 ) -> Optional[Brand]:
     """
@@ -874,6 +1381,7 @@ def update_brand(
         brand_id: ID of the brand to update
         user_id: ID of the user (for ownership check)
         **updates: Fields to update (company_name, brand_name, description, etc.)
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         Brand: Updated brand object if successful, None if not found or unauthorized
@@ -882,35 +1390,37 @@ def update_brand(
         Exception: If database update fails
     """
     try:
-        brand = db.query(Brand).filter(
-            Brand.id == brand_id,
-            Brand.user_id == user_id
-        ).first()
+        # Ownership is part of the WHERE clause, so check and write are one statement
+        updates = {k: v for k, v in updates.items() if k in _BRAND_UPDATABLE}
+        if "guidelines" in updates:
+            # The cached extraction belongs to the old document
+            updates["extracted_guidelines_json"] = None
+            updates["guidelines_extracted_at"] = None
+        brand = _update_returning(db, Brand, (Brand.id == brand_id, Brand.user_id == user_id), updates)
 
         if not brand:
-            logger.warning(f"⚠️ Cannot update: Brand {brand_id} not found or not owned by user {user_id}")
+            logger.warning("⚠️ Cannot update: Brand %s not found or not owned by user %s", brand_id, user_id)
             return None
 
-        # Update fields
-        for key, value in updates.items():
-            if hasattr(brand, key) and key != 'id' and key != 'user_id':
-                setattr(brand, key, value)
-
-        db.commit()
-        db.refresh(brand)
+        _commit(db, auto_commit)
 
-        logger.info(f"✅ Updated brand {brand_id}: {list(updates.keys())}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Updated brand %s: %s", brand_id, list(updates.keys()))
         return brand
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to update brand {brand_id}: {e}")
+        logger.error("❌ Failed to update brand %s: %s", brand_id, e)
         raise
 
 
+@_retry_on_transient_error
 def delete_brand(
     db: Session,
     brand_id: UUID,
-    user_id: UUID
+    user_id: UUID,
+    auto_commit: bool = True
 ) -> bool:
     """
     Delete a brand (only if owned by user). CASCADE deletes products.
@@ -919,31 +1429,40 @@ def delete_brand(
         db: Database session
         brand_id: ID of the brand to delete
         user_id: ID of the user (for ownership check)
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
-        bool: True if deleted, False if not found or unauthorized
+        bool: True if deleted, False if not found, unauthorized or the delete failed
 
     Raises:
-        Exception: If database delete fails
+        DBAPIError: On a serialization failure or deadlock that outlasts the retries
     """
     try:
-        brand = db.query(Brand).filter(
-            Brand.id == brand_id,
-            Brand.user_id == user_id
-        ).first()
+        brand = db.get(Brand, brand_id)
+        if brand is not None and brand.user_id != user_id:
+            brand = None
 
         if not brand:
-            logger.warning(f"⚠️ Cannot delete: Brand {brand_id} not found or not owned by user {user_id}")
+            logger.warning("⚠️ Cannot delete: Brand %s not found or not owned by user %s", brand_id, user_id)
             return False
 
         db.delete(brand)
-        db.commit()
+        _commit(db, auto_commit)
+        _BRAND_STATS_CACHE.pop(_uuid_key(brand_id), None)
+        _BRAND_OWNER_CACHE.pop((_uuid_key(brand_id), _uuid_key(user_id)), None)
 
-        logger.info(f"✅ Deleted brand {brand_id} (CASCADE to products)")
+        logger.info("✅ Deleted brand %s (CASCADE to products)", brand_id)
         return True
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to delete brand {brand_id}: {e}")
+        if _is_transient_db_error(e):
+            raise
+        logger.error("❌ Failed to delete brand %s: %s", brand_id, e)
+        return False
+
+
 def get_brand_stats(db: Session, brand_id: UUID) -> Dict[str, Any]:
     """
     Get brand statistics (products count, campaigns count, total cost).
@@ -958,33 +1477,47 @@ def get_brand_stats(db: Session, brand_id: UUID) -> Dict[str, Any]:
     Returns:
         Dict with statistics
     """
+    cached = _BRAND_STATS_CACHE.get(_uuid_key(brand_id))
+    if cached is not None:
+        return dict(cached)
+
     try:
         # Products count - direct query
-        products_count = db.query(Product).filter(Product.brand_id == brand_id).count()
+        products_count = select(func.count(Product.id)).where(
+            Product.brand_id == brand_id
+        ).scalar_subquery()
 
         # Campaigns count - join through Product
-        campaigns_count = db.query(Campaign).join(
+        campaigns_count = select(func.count(Campaign.id)).join(
             Product, Campaign.product_id == Product.id
-        ).filter(Product.brand_id == brand_id).count()
+        ).where(Product.brand_id == brand_id).scalar_subquery()
 
         # Total cost - sum from Creatives, joining through Campaign and Product
         # Cost is tracked at the Creative level, not Campaign level
-        total_cost = db.query(func.sum(Creative.cost)).join(
+        total_cost = select(func.coalesce(func.sum(Creative.cost), 0)).join(
             Campaign, Creative.campaign_id == Campaign.id
         ).join(
             Product, Campaign.product_id == Product.id
-        ).filter(Product.brand_id == brand_id).scalar() or 0
+        ).where(Product.brand_id == brand_id).scalar_subquery()
+
+        # All three as scalar subqueries of one SELECT - a single round trip
+        row = db.execute(select(
+            products_count.label("total_products"),
+            campaigns_count.label("total_campaigns"),
+            total_cost.label("total_cost"),
+        )).one()
 
         stats = {
-            "total_products": products_count,
-            "total_campaigns": campaigns_count,
-            "total_cost": float(total_cost)
+            "total_products": row.total_products,
+            "total_campaigns": row.total_campaigns,
+            "total_cost": float(row.total_cost)
         }
 
-        logger.debug(f"✅ Generated stats for brand {brand_id}: {stats}")
-        return stats
+        _BRAND_STATS_CACHE[_uuid_key(brand_id)] = stats
+        logger.debug("✅ Generated stats for brand %s: %s", brand_id, stats)
+        return dict(stats)
     except Exception as e:
-        logger.error(f"❌ Failed to get stats for brand {brand_id}: {e}")
+        logger.error("❌ Failed to get stats for brand %s: %s", brand_id, e)
         raise
 
 
@@ -992,6 +1525,7 @@ def get_brand_stats(db: Session, brand_id: UUID) -> Dict[str, Any]:
 # PRODUCT CRUD Operations
 # ============================================================================
 
+@_retry_on_transient_error
 def create_product(
     db: Session,
     user_id: UUID,
@@ -1001,7 +1535,8 @@ def create_product(
     product_gender: Optional[str] = None,
     product_attributes: Optional[Dict] = None,
     icp_segment: Optional[str] = None,
-    image_urls: Optional[List[str]] = None
+    image_urls: Optional[List[str]] = None,
+    auto_commit: bool = True
 ) -> Optional[Product]:
     """
     Create a new product associated with a brand.
@@ -1016,6 +1551,7 @@ def create_product(
         product_attributes: Type-specific attributes as dict (optional)
         icp_segment: ICP/target audience segment (optional)
         image_urls: List of S3 image URLs (optional, max 10)
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         Product: Created product object if brand is owned by user, None otherwise
@@ -1025,18 +1561,14 @@ def create_product(
     """
     try:
         # Validate brand ownership
-        brand = db.query(Brand).filter(
-            Brand.id == brand_id,
-            Brand.user_id == user_id
-        ).first()
-
-        if not brand:
-            logger.warning(f"⚠️ Cannot create product: Brand {brand_id} not found or not owned by user {user_id}")
+        if not _owns_brand(db, brand_id, user_id):
+            logger.warning("⚠️ Cannot create product: Brand %s not found or not owned by user %s", brand_id, user_id)
             return None
 
         # Create product
         product = Product(
             brand_id=brand_id,
+            user_id=user_id,
             product_type=product_type,
             name=name,
             product_gender=product_gender,
@@ -1045,14 +1577,16 @@ def create_product(
             image_urls=image_urls
         )
         db.add(product)
-        db.commit()
-        db.refresh(product)
+        _commit(db, auto_commit)
+        _BRAND_STATS_CACHE.pop(_uuid_key(brand_id), None)
 
-        logger.info(f"✅ Created product {product.id} ({name}, type={product_type}) for brand {brand_id}")
+        logger.info("✅ Created product %s (%s, type=%s) for brand %s", product.id, name, product_type, brand_id)
         return product
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to create product: {e}")
+        logger.error("❌ Failed to create product: %s", e)
         raise
 
 
@@ -1061,41 +1595,45 @@ def get_brand_products(
     user_id: UUID,
     brand_id: UUID,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[Tuple[datetime, UUID]] = None
 ) -> Optional[List]:
     """
-    Get all products for a specific brand (with ownership validation).
+    Get all products for a specific brand (with ownership validation), newest first.
 
     Args:
         db: Database session
         user_id: ID of the authenticated user (for brand ownership validation)
         brand_id: ID of the brand
         limit: Maximum number of products to return
-        offset: Number of products to skip (for pagination)
+        offset: Number of products to skip (ignored when cursor is given)
+        cursor: (created_at, id) of the last product on the previous page;
+            see page_cursor(). Seeks past it instead of scanning offset rows.
 
     Returns:
         List[Product]: List of products if brand is owned by user, None if brand not found/owned
     """
     try:
         # Validate brand ownership
-        brand = db.query(Brand).filter(
-            Brand.id == brand_id,
-            Brand.user_id == user_id
-        ).first()
-
-        if not brand:
-            logger.warning(f"⚠️ Cannot list products: Brand {brand_id} not found or not owned by user {user_id}")
+        if not _owns_brand(db, brand_id, user_id):
+            logger.warning("⚠️ Cannot list products: Brand %s not found or not owned by user %s", brand_id, user_id)
             return None
 
         # Get products for brand
-        products = db.query(Product).filter(
-            Product.brand_id == brand_id
-        ).order_by(desc(Product.created_at)).limit(limit).offset(offset).all()
+        query = db.query(Product).filter(Product.brand_id == brand_id)
+        if cursor is not None:
+            query = query.filter(tuple_(Product.created_at, Product.id) < tuple_(*cursor))
+
+        query = query.order_by(desc(Product.created_at), desc(Product.id))
+        if cursor is None:
+            query = query.offset(offset)
 
-        logger.info(f"✅ Retrieved {len(products)} products for brand {brand_id}")
+        products = query.limit(limit).all()
+
+        logger.info("✅ Retrieved %s products for brand %s", len(products), brand_id)
         return products
     except Exception as e:
-        logger.error(f"❌ Failed to get products for brand {brand_id}: {e}")
+        logger.error("❌ Failed to get products for brand %s: %s", brand_id, e)
         return None
 
 
@@ -1116,20 +1654,19 @@ def get_product(
         Product: Product object if found and brand is owned by user, None otherwise
     """
     try:
-        # Get product with brand ownership check via JOIN
-        product = db.query(Product).join(Brand).filter(
-            Product.id == product_id,
-            Brand.user_id == user_id
-        ).first()
+        # Get product, then check ownership
+        product = db.get(Product, product_id)
+        if product is not None and product.user_id != user_id:
+            product = None
 
         if product:
-            logger.debug(f"✅ User {user_id} owns product {product_id} via brand")
+            logger.debug("✅ User %s owns product %s via brand", user_id, product_id)
         else:
-            logger.warning(f"⚠️ Product {product_id} not found or brand not owned by user {user_id}")
+            logger.warning("⚠️ Product %s not found or brand not owned by user %s", product_id, user_id)
 
         return product
     except Exception as e:
-        logger.error(f"❌ Failed to get product {product_id}: {e}")
+        logger.error("❌ Failed to get product %s: %s", product_id, e)
         return None
 
 
@@ -1151,23 +1688,25 @@ def get_product_by_id(
         Product: Product object if found, None otherwise
     """
     try:
-        product = db.query(Product).filter(Product.id == product_id).first()
+        product = db.get(Product, product_id)
 
         if product:
-            logger.debug(f"✅ Found product {product_id}")
+            logger.debug("✅ Found product %s", product_id)
         else:
-            logger.warning(f"⚠️ Product {product_id} not found")
+            logger.warning("⚠️ Product %s not found", product_id)
 
         return product
     except Exception as e:
-        logger.error(f"❌ Failed to get product {product_id}: {e}")
+        logger.error("❌ Failed to get product %s: %s", product_id, e)
         return None
 
 
+@_retry_on_transient_error
 def update_product(
     db: Session,
     user_id: UUID,
     product_id: UUID,
+    auto_commit: bool = True,
     **updates
 ) -> Optional[Product]:
     """
@@ -1178,6 +1717,7 @@ def update_product(
         user_id: ID of the authenticated user (for brand ownership validation)
         product_id: ID of the product to update
         **updates: Fields to update (product_type, name, product_gender, product_attributes, icp_segment, image_urls)
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         Product: Updated product object if successful, None if not found or unauthorized
@@ -1186,36 +1726,35 @@ def update_product(
         Exception: If database update fails
     """
     try:
-        # Get product with brand ownership check
-        product = db.query(Product).join(Brand).filter(
-            Product.id == product_id,
-            Brand.user_id == user_id
-        ).first()
+        # Ownership is part of the WHERE clause, so check and write are one statement
+        updates = {k: v for k, v in updates.items() if k in _PRODUCT_UPDATABLE}
+        product = _update_returning(
+            db, Product, (Product.id == product_id, Product.user_id == user_id), updates
+        )
 
         if not product:
-            logger.warning(f"⚠️ Cannot update: Product {product_id} not found or brand not owned by user {user_id}")
+            logger.warning("⚠️ Cannot update: Product %s not found or brand not owned by user %s", product_id, user_id)
             return None
 
-        # Update fields
-        for key, value in updates.items():
-            if hasattr(product, key) and key not in ['id', 'brand_id']:
-                setattr(product, key, value)
-
-        db.commit()
-        db.refresh(product)
+        _commit(db, auto_commit)
 
-        logger.info(f"✅ Updated product {product_id}: {list(updates.keys())}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Updated product %s: %s", product_id, list(updates.keys()))
         return product
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to update product {product_id}: {e}")
+        logger.error("❌ Failed to update product %s: %s", product_id, e)
         raise
 
 
+@_retry_on_transient_error
 def delete_product(
     db: Session,
     user_id: UUID,
-    product_id: UUID
+    product_id: UUID,
+    auto_commit: bool = True
 ) -> bool:
     """
     Delete a product (only if user owns parent brand).
@@ -1224,32 +1763,42 @@ def delete_product(
         db: Database session
         user_id: ID of the authenticated user (for brand ownership validation)
         product_id: ID of the product to delete
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
-        bool: True if deleted, False if not found or unauthorized
+        bool: True if deleted, False if not found, unauthorized or the delete failed
 
     Raises:
-        Exception: If database delete fails
+        DBAPIError: On a serialization failure or deadlock that outlasts the retries
     """
     try:
-        # Get product with brand ownership check
-        product = db.query(Product).join(Brand).filter(
-            Product.id == product_id,
-            Brand.user_id == user_id
-        ).first()
+        # Get product, then check ownership
+        product = db.get(Product, product_id)
+        if product is not None and product.user_id != user_id:
+            product = None
 
         if not product:
-            logger.warning(f"⚠️ Cannot delete: Product {product_id} not found or brand not owned by user {user_id}")
+            logger.warning("⚠️ Cannot delete: Product %s not found or brand not owned by user %s", product_id, user_id)
             return False
 
+        brand_id = product.brand_id
         db.delete(product)
-        db.commit()
+        _commit(db, auto_commit)
+        _BRAND_STATS_CACHE.pop(_uuid_key(brand_id), None)
+        campaign_cache.invalidate_product(product_id)
+        ownership_cache.invalidate(ownership_cache.PRODUCT, user_id, product_id)
 
-        logger.info(f"✅ Deleted product {product_id}")
+        logger.info("✅ Deleted product %s", product_id)
         return True
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to delete product {product_id}: {e}")
+        if _is_transient_db_error(e):
+            raise
+        logger.error("❌ Failed to delete product %s: %s", product_id, e)
+        return False
+
 
 def get_perfume_campaigns_count(db: Session, perfume_id: UUID) -> int:
     """
@@ -1263,10 +1812,9 @@ def get_perfume_campaigns_count(db: Session, perfume_id: UUID) -> int:
         int: Number of campaigns
     """
     try:
-        count = db.query(Campaign).filter(Campaign.perfume_id == perfume_id).count()
-        return count
+        return db.query(func.count(Campaign.id)).filter(Campaign.product_id == perfume_id).scalar()
     except Exception as e:
-        logger.error(f"❌ Failed to get campaigns count for perfume {perfume_id}: {e}")
+        logger.error("❌ Failed to get campaigns count for perfume %s: %s", perfume_id, e)
         raise
 
 
@@ -1274,6 +1822,7 @@ def get_perfume_campaigns_count(db: Session, perfume_id: UUID) -> int:
 # CAMPAIGN CRUD Operations
 # ============================================================================
 
+@_retry_on_transient_error
 def create_campaign(
     db: Session,
     user_id: UUID,
@@ -1283,11 +1832,17 @@ def create_campaign(
     seasonal_event: str,
     year: int,
     duration: int,
-    scene_configs: List[Dict[str, Any]]
+    scene_configs: List[Dict[str, Any]],
+    num_variations: int = 1,
+    auto_commit: bool = True
 ) -> Optional[Campaign]:
     """
     Create a new campaign associated with a product.
 
+    Variations are rendered inside a single campaign, so num_variations is
+    stored on the one row rather than creating a row per variation; use
+    create_campaigns_bulk() to create several campaigns in one INSERT.
+
     Args:
         db: Database session
         user_id: ID of the authenticated user (for ownership validation)
@@ -1298,6 +1853,8 @@ def create_campaign(
         year: Campaign year
         duration: Video duration in seconds (15, 30, 45, or 60)
         scene_configs: List of scene configuration dicts
+        num_variations: Number of video variations to generate (1-3)
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         Campaign: Created campaign object if product is owned by user, None otherwise
@@ -1311,35 +1868,91 @@ def create_campaign(
         be accessed via campaign.product.brand.
     """
     try:
-        # Validate product ownership via brand
-        product = db.query(Product).join(Brand).filter(
-            Product.id == product_id,
-            Brand.user_id == user_id
-        ).first()
+        if not _user_owns_product(db, user_id, product_id):
+            logger.warning("⚠️ Cannot create campaign: Product %s not found or not owned by user %s", product_id, user_id)
+            return None
 
-        if not product:
-            logger.warning(f"⚠️ Cannot create campaign: Product {product_id} not found or not owned by user {user_id}")
+        # Create campaign with "pending" status to allow immediate generation.
+        # INSERT ... RETURNING hands back the full row (id, timestamps and
+        # column defaults) from the write itself, with no reload afterwards.
+        campaign = db.scalars(insert(Campaign).returning(Campaign), [{
+            "product_id": product_id,
+            "user_id": user_id,
+            "name": name,
+            "seasonal_event": seasonal_event,
+            "year": year,
+            "duration": duration,
+            "scene_configs": scene_configs,
+            "num_variations": num_variations,
+            "status": "pending",
+        }]).one()
+        _commit(db, auto_commit)
+        campaign_cache.invalidate_product(product_id)
+        _forget_brand_stats(db, product_id=product_id)
+
+        logger.info("✅ Created campaign %s (%s) for product %s", campaign.id, name, product_id)
+        return campaign
+    except Exception as e:
+        if not auto_commit:
+            raise
+        db.rollback()
+        logger.error("❌ Failed to create campaign: %s", e)
+        raise
+
+
+@_retry_on_transient_error
+def create_campaigns_bulk(
+    db: Session,
+    user_id: UUID,
+    product_id: UUID,
+    payloads: List[Dict[str, Any]],
+    auto_commit: bool = True
+) -> Optional[List[Campaign]]:
+    """
+    Create several campaigns for one product in a single INSERT ... RETURNING.
+
+    Ownership is checked once for the whole batch, and the new rows come back
+    from the INSERT itself rather than a reload per campaign.
+
+    Args:
+        db: Database session
+        user_id: ID of the authenticated user (for ownership validation)
+        product_id: ID of the product to associate the campaigns with
+        payloads: One dict of campaign fields per campaign (name, seasonal_event,
+            year, duration, scene_configs, ...). Unknown keys are ignored and
+            every campaign starts as "pending".
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
+
+    Returns:
+        List[Campaign]: Created campaigns in payload order, None if the product is not owned by user
+
+    Raises:
+        Exception: If database insert fails
+    """
+    try:
+        if not _user_owns_product(db, user_id, product_id):
+            logger.warning("⚠️ Cannot create campaigns: Product %s not found or not owned by user %s", product_id, user_id)
             return None
 
-        # Create campaign with "pending" status to allow immediate generation
-        campaign = Campaign(
-            product_id=product_id,
-            name=name,
-            seasonal_event=seasonal_event,
-            year=year,
-            duration=duration,
-            scene_configs=scene_configs,
-            status="pending"
-        )
-        db.add(campaign)
-        db.commit()
-        db.refresh(campaign)
+        if not payloads:
+            return []
 
-        logger.info(f"✅ Created campaign {campaign.id} ({name}) for product {product_id}")
-        return campaign
+        rows = [
+            {**{k: v for k, v in payload.items() if k in _CAMPAIGN_UPDATABLE}, "product_id": product_id, "user_id": user_id, "status": "pending"}
+            for payload in payloads
+        ]
+        campaigns = list(db.scalars(insert(Campaign).returning(Campaign, sort_by_parameter_order=True), rows))
+        _commit(db, auto_commit)
+        campaign_cache.invalidate_product(product_id)
+        _forget_brand_stats(db, product_id=product_id)
+
+        logger.info("✅ Created %s campaigns for product %s", len(campaigns), product_id)
+        return campaigns
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to create campaign: {e}")
+        logger.error("❌ Failed to create campaigns for product %s: %s", product_id, e)
         raise
 
 
@@ -1364,25 +1977,18 @@ def get_product_campaigns(
         List[Campaign]: List of campaigns if product is owned by user, None if not found/owned
     """
     try:
-        # Validate product ownership via brand
-        product = db.query(Product).join(Brand).filter(
-            Product.id == product_id,
-            Brand.user_id == user_id
-        ).first()
-
-        if not product:
-            logger.warning(f"⚠️ Cannot list campaigns: Product {product_id} not found or not owned by user {user_id}")
+        if not _user_owns_product(db, user_id, product_id):
+            logger.warning("⚠️ Cannot list campaigns: Product %s not found or not owned by user %s", product_id, user_id)
             return None
 
-        # Get campaigns for product
         campaigns = db.query(Campaign).filter(
             Campaign.product_id == product_id
         ).order_by(desc(Campaign.created_at)).limit(limit).offset(offset).all()
 
-        logger.info(f"✅ Retrieved {len(campaigns)} campaigns for product {product_id}")
+        logger.info("✅ Retrieved %s campaigns for product %s", len(campaigns), product_id)
         return campaigns
     except Exception as e:
-        logger.error(f"❌ Failed to get campaigns for product {product_id}: {e}")
+        logger.error("❌ Failed to get campaigns for product %s: %s", product_id, e)
         return None
 
 
@@ -1403,20 +2009,22 @@ def get_campaign(
         Campaign: Campaign object if found and owned by user, None otherwise
     """
     try:
-        # Get campaign with ownership check via product->brand chain
-        campaign = db.query(Campaign).join(Product).join(Brand).filter(
-            Campaign.id == campaign_id,
-            Brand.user_id == user_id
-        ).first()
+        # Ownership is a column predicate; product and brand come back in the same query
+        campaign = db.scalars(lambda_stmt(
+            lambda: select(Campaign).options(*_CAMPAIGN_WITH_BRAND).where(
+                Campaign.id == campaign_id,
+                Campaign.user_id == user_id
+            ).limit(1)
+        )).first()
 
         if campaign:
-            logger.debug(f"✅ User {user_id} owns campaign {campaign_id}")
+            logger.debug("✅ User %s owns campaign %s", user_id, campaign_id)
         else:
-            logger.warning(f"⚠️ Campaign {campaign_id} not found or not owned by user {user_id}")
+            logger.warning("⚠️ Campaign %s not found or not owned by user %s", campaign_id, user_id)
 
         return campaign
     except Exception as e:
-        logger.error(f"❌ Failed to get campaign {campaign_id}: {e}")
+        logger.error("❌ Failed to get campaign %s: %s", campaign_id, e)
         return None
 
 
@@ -1428,7 +2036,8 @@ def get_campaign_by_id(
     Get a campaign by ID without ownership verification.
 
     This function is used in background jobs where user context is not available.
-    Use get_campaign() in API endpoints for ownership verification.
+    Use get_campaign() in API endpoints for ownership verification. Repeat calls
+    on the same session return the already-loaded campaign without a query.
 
     Args:
         db: Database session
@@ -1438,65 +2047,165 @@ def get_campaign_by_id(
         Campaign: Campaign object if found, None otherwise
     """
     try:
-        # Eagerly load product and its brand to avoid lazy loading issues
-        campaign = db.query(Campaign).options(
-            joinedload(Campaign.product).joinedload(Product.brand)
-        ).filter(Campaign.id == campaign_id).first()
+        # Session.get answers repeat lookups in the same session from the
+        # identity map without SQL; a miss loads product and brand eagerly
+        campaign = db.get(Campaign, campaign_id, options=_CAMPAIGN_WITH_BRAND)
 
         if campaign:
-            logger.debug(f"✅ Found campaign {campaign_id}")
+            logger.debug("✅ Found campaign %s", campaign_id)
         else:
-            logger.warning(f"⚠️ Campaign {campaign_id} not found")
+            logger.warning("⚠️ Campaign %s not found", campaign_id)
 
         return campaign
     except Exception as e:
-        logger.error(f"❌ Failed to get campaign {campaign_id}: {e}")
+        logger.error("❌ Failed to get campaign %s: %s", campaign_id, e)
         return None
 
 
+# Columns needed to serialize a campaign in list responses (CampaignResponse)
+CAMPAIGN_LIST_COLUMNS = (
+    Campaign.id,
+    Campaign.product_id,
+    Campaign.name,
+    Campaign.seasonal_event,
+    Campaign.year,
+    Campaign.duration,
+    Campaign.scene_configs,
+    Campaign.status,
+    Campaign.progress,
+    Campaign.campaign_json,
+    Campaign.created_at,
+    Campaign.updated_at,
+)
+
+# Above this many estimated rows the planner estimate is returned instead of an exact COUNT
+EXACT_COUNT_THRESHOLD = 10_000
+
+
+def estimated_campaign_count_for_product(db: Session, product_id: UUID) -> int:
+    """
+    Get the number of campaigns for a product, estimated when the set is large.
+
+    Reads the planner's row estimate from EXPLAIN (FORMAT JSON). If the
+    estimate is above EXACT_COUNT_THRESHOLD it is returned as-is; otherwise
+    (or on non-PostgreSQL databases) an exact COUNT is run.
+
+    Args:
+        db: Database session
+        product_id: ID of the product
+
+    Returns:
+        int: Estimated or exact campaign count
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        plan = db.execute(
+            text("EXPLAIN (FORMAT JSON) SELECT 1 FROM campaigns WHERE product_id = :product_id"),
+            {"product_id": product_id}
+        ).scalar()
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+        if estimate > EXACT_COUNT_THRESHOLD:
+            logger.debug("Using estimated campaign count %s for product %s", estimate, product_id)
+            return estimate
+
+    return db.query(func.count(Campaign.id)).filter(
+        Campaign.product_id == product_id
+    ).scalar()
+
+
 def get_campaigns_by_product(
     db: Session,
     product_id: UUID,
     page: int = 1,
-    limit: int = 20
+    limit: int = 20,
+    cursor: Optional[Tuple[datetime, UUID]] = None
 ) -> tuple[List[Campaign], int]:
     """
-    Get campaigns for a product with pagination.
+    Get campaigns for a product with pagination, newest first.
+
+    Pages (and the total) are served through the Redis campaign listing cache
+    when it is enabled, as transient Campaign instances holding only
+    CAMPAIGN_LIST_COLUMNS and no relationships. Callers must have checked
+    ownership of the product already.
 
     Args:
         db: Database session
         product_id: ID of the product
-        page: Page number (1-indexed)
+        page: Page number (1-indexed; ignored when cursor is given)
         limit: Number of campaigns per page
+        cursor: (created_at, id) of the last campaign on the previous page;
+            see page_cursor(). Seeks past it instead of scanning offset rows.
 
     Returns:
         tuple: (list of campaigns, total count)
     """
-    try:
-        # Calculate offset
-        offset = (page - 1) * limit
+    # Calculate offset
+    offset = (page - 1) * limit
 
-        # Get total count
-        total = db.query(Campaign).filter(
-            Campaign.product_id == product_id
-        ).count()
+    def load() -> Dict[str, Any]:
+        # Get total count (planner estimate for very large products)
+        total = estimated_campaign_count_for_product(db, product_id)
 
-        # Get paginated campaigns
-        campaigns = db.query(Campaign).filter(
+        # Get paginated campaigns (only the columns CampaignResponse serializes);
+        # rows are cached as column dicts, so skip the eager product join
+        query = db.query(Campaign).options(
+            load_only(*CAMPAIGN_LIST_COLUMNS), lazyload(Campaign.product)
+        ).filter(
             Campaign.product_id == product_id
-        ).order_by(desc(Campaign.created_at)).limit(limit).offset(offset).all()
+        )
+        if cursor is not None:
+            query = query.filter(tuple_(Campaign.created_at, Campaign.id) < tuple_(*cursor))
+
+        query = query.order_by(desc(Campaign.created_at), desc(Campaign.id))
+        if cursor is None:
+            query = query.offset(offset)
+
+        campaigns = query.limit(limit).all()
+
+        return {"total": total, "rows": [_campaign_row(c) for c in campaigns]}
 
-        logger.info(f"✅ Retrieved {len(campaigns)} campaigns for product {product_id} (page {page}, total {total})")
+    try:
+        cached = campaign_cache.get_or_set(
+            campaign_cache.list_key(product_id, limit, offset, cursor), product_id, load
+        )
+        total = cached["total"]
+        campaigns = [_campaign_from_row(row) for row in cached["rows"]]
+
+        logger.info("✅ Retrieved %s campaigns for product %s (page %s, total %s)", len(campaigns), product_id, page, total)
         return campaigns, total
     except Exception as e:
-        logger.error(f"❌ Failed to get campaigns for product {product_id}: {e}")
+        logger.error("❌ Failed to get campaigns for product %s: %s", product_id, e)
         return [], 0
 
 
+def get_campaign_names_by_product(
+    db: Session,
+    product_id: UUID
+) -> List[str]:
+    """
+    Get the names of all campaigns for a product.
+
+    Selects only the name column, for uniqueness checks that don't need
+    full Campaign rows.
+
+    Args:
+        db: Database session
+        product_id: ID of the product
+
+    Returns:
+        List[str]: Campaign names
+    """
+    rows = db.query(Campaign).filter(
+        Campaign.product_id == product_id
+    ).with_entities(Campaign.name).all()
+    return [name for (name,) in rows]
+
+
+@_retry_on_transient_error
 def update_campaign(
     db: Session,
     user_id: UUID,
     campaign_id: UUID,
+    auto_commit: bool = True,
     **updates
 ) -> Optional[Campaign]:
     """
@@ -1507,6 +2216,7 @@ def update_campaign(
         user_id: ID of the authenticated user (for ownership validation)
         campaign_id: ID of the campaign to update
         **updates: Fields to update (name, seasonal_event, year, duration, scene_configs, status)
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         Campaign: Updated campaign object if successful, None if not found or unauthorized
@@ -1515,36 +2225,36 @@ def update_campaign(
         Exception: If database update fails
     """
     try:
-        # Get campaign with ownership check
-        campaign = db.query(Campaign).join(Product).join(Brand).filter(
-            Campaign.id == campaign_id,
-            Brand.user_id == user_id
-        ).first()
+        # Ownership is part of the WHERE clause, so check and write are one statement
+        updates = {k: v for k, v in updates.items() if k in _CAMPAIGN_UPDATABLE}
+        campaign = _update_returning(
+            db, Campaign, (Campaign.id == campaign_id, _campaign_owned_by(user_id)), updates
+        )
 
         if not campaign:
-            logger.warning(f"⚠️ Cannot update: Campaign {campaign_id} not found or not owned by user {user_id}")
+            logger.warning("⚠️ Cannot update: Campaign %s not found or not owned by user %s", campaign_id, user_id)
             return None
 
-        # Update fields
-        for key, value in updates.items():
-            if hasattr(campaign, key) and key not in ['id', 'product_id']:
-                setattr(campaign, key, value)
+        _commit(db, auto_commit)
+        campaign_cache.invalidate_product(campaign.product_id)
 
-        db.commit()
-        db.refresh(campaign)
-
-        logger.info(f"✅ Updated campaign {campaign_id}: {list(updates.keys())}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Updated campaign %s: %s", campaign_id, list(updates.keys()))
         return campaign
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to update campaign {campaign_id}: {e}")
+        logger.error("❌ Failed to update campaign %s: %s", campaign_id, e)
         raise
 
 
+@_retry_on_transient_error
 def delete_campaign(
     db: Session,
     user_id: UUID,
-    campaign_id: UUID
+    campaign_id: UUID,
+    auto_commit: bool = True
 ) -> bool:
     """
     Delete a campaign (only if user owns product/brand).
@@ -1553,6 +2263,7 @@ def delete_campaign(
         db: Database session
         user_id: ID of the authenticated user (for ownership validation)
         campaign_id: ID of the campaign to delete
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         bool: True if deleted, False if not found or unauthorized
@@ -1561,24 +2272,33 @@ def delete_campaign(
         Exception: If database delete fails
     """
     try:
-        # Get campaign with ownership check
-        campaign = db.query(Campaign).join(Product).join(Brand).filter(
-            Campaign.id == campaign_id,
-            Brand.user_id == user_id
-        ).first()
-
-        if not campaign:
-            logger.warning(f"⚠️ Cannot delete: Campaign {campaign_id} not found or not owned by user {user_id}")
+        # Ownership check and delete in one statement; creatives go with the
+        # row via ON DELETE CASCADE
+        product_id = db.execute(
+            delete(Campaign).where(
+                Campaign.id == campaign_id,
+                _campaign_owned_by(user_id)
+            ).returning(Campaign.product_id),
+            execution_options={"synchronize_session": "fetch"},
+        ).scalar_one_or_none()
+
+        if product_id is None:
+            logger.warning("⚠️ Cannot delete: Campaign %s not found or not owned by user %s", campaign_id, user_id)
             return False
 
-        db.delete(campaign)
-        db.commit()
+        _commit(db, auto_commit)
+        _CAMPAIGN_OWNER_CACHE.pop((_uuid_key(campaign_id), _uuid_key(user_id)), None)
+        campaign_cache.invalidate_product(product_id)
+        _forget_brand_stats(db, product_id=product_id)
+        ownership_cache.invalidate(ownership_cache.CAMPAIGN, user_id, campaign_id)
 
-        logger.info(f"✅ Deleted campaign {campaign_id}")
+        logger.info("✅ Deleted campaign %s", campaign_id)
         return True
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to delete campaign {campaign_id}: {e}")
+        logger.error("❌ Failed to delete campaign %s: %s", campaign_id, e)
         raise
 
 
@@ -1586,6 +2306,7 @@ def delete_campaign(
 # Creative CRUD Operations
 # ============================================================================
 
+@_retry_on_transient_error
 def create_creative(
     db: Session,
     campaign_id: UUID,
@@ -1595,7 +2316,8 @@ def create_creative(
     status: str = "pending",
     aspect_ratio: str = "9:16",
     video_provider: str = "replicate",
-    output_formats: Optional[List[str]] = None
+    output_formats: Optional[List[str]] = None,
+    auto_commit: bool = True
 ) -> Optional[Creative]:
     """
     Create a new creative for a campaign.
@@ -1607,22 +2329,18 @@ def create_creative(
         title: Creative title
         ad_creative_json: Creative configuration JSON
         status: Initial status (default: "pending")
-        aspect_ratio: Aspect ratio for the creative
+        aspect_ratio: Output format to use when output_formats is not given
         video_provider: Video generation provider
         output_formats: List of output aspect ratios
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
     
     Returns:
         Creative: Created creative object
     """
     try:
         # Verify campaign exists and user has access
-        campaign = db.query(Campaign).join(Product).join(Brand).filter(
-            Campaign.id == campaign_id,
-            Brand.user_id == user_id
-        ).first()
-        
-        if not campaign:
-            logger.warning(f"⚠️ Cannot create creative: Campaign {campaign_id} not found or not owned by user {user_id}")
+        if not _user_owns_campaign(db, user_id, campaign_id):
+            logger.warning("⚠️ Cannot create creative: Campaign %s not found or not owned by user %s", campaign_id, user_id)
             return None
         
         # Create creative
@@ -1632,7 +2350,6 @@ def create_creative(
             title=title,
             ad_creative_json=ad_creative_json,
             status=status,
-            aspect_ratio=aspect_ratio,
             video_provider=video_provider,
             output_formats=output_formats or [aspect_ratio],
             progress=0,
@@ -1640,15 +2357,17 @@ def create_creative(
         )
         
         db.add(creative)
-        db.commit()
-        db.refresh(creative)
+        _commit(db, auto_commit)
+        _GENERATION_STATS_CACHE.pop(_uuid_key(user_id), None)
         
-        logger.info(f"✅ Created creative {creative.id} for campaign {campaign_id}")
+        logger.info("✅ Created creative %s for campaign %s", creative.id, campaign_id)
         return creative
         
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to create creative: {e}")
+        logger.error("❌ Failed to create creative: %s", e)
         raise
 
 
@@ -1672,13 +2391,13 @@ def get_creative_by_id(db: Session, creative_id: UUID) -> Optional[Creative]:
         ).filter(Creative.id == creative_id).first()
 
         if creative:
-            logger.debug(f"✅ Found creative {creative_id}")
+            logger.debug("✅ Found creative %s", creative_id)
         else:
-            logger.warning(f"⚠️ Creative {creative_id} not found")
+            logger.warning("⚠️ Creative %s not found", creative_id)
 
         return creative
     except Exception as e:
-        logger.error(f"❌ Failed to get creative {creative_id}: {e}")
+        logger.error("❌ Failed to get creative %s: %s", creative_id, e)
         return None
 
 
@@ -1704,31 +2423,30 @@ def get_creatives_for_campaign(
     """
     try:
         # Verify campaign ownership
-        campaign = db.query(Campaign).join(Product).join(Brand).filter(
-            Campaign.id == campaign_id,
-            Brand.user_id == user_id
-        ).first()
-        
-        if not campaign:
-            logger.warning(f"⚠️ Cannot list creatives: Campaign {campaign_id} not found or not owned by user {user_id}")
+        if not _user_owns_campaign(db, user_id, campaign_id):
+            logger.warning("⚠️ Cannot list creatives: Campaign %s not found or not owned by user %s", campaign_id, user_id)
             return [], 0
         
         # Get creatives
         query = db.query(Creative).filter(Creative.campaign_id == campaign_id)
-        total = query.count()
+        total = db.query(func.count(Creative.id)).filter(
+            Creative.campaign_id == campaign_id
+        ).scalar()
         creatives = query.order_by(desc(Creative.created_at)).offset(offset).limit(limit).all()
         
-        logger.info(f"✅ Retrieved {len(creatives)} creatives for campaign {campaign_id} (total: {total})")
+        logger.info("✅ Retrieved %s creatives for campaign %s (total: %s)", len(creatives), campaign_id, total)
         return creatives, total
         
     except Exception as e:
-        logger.error(f"❌ Failed to get creatives for campaign {campaign_id}: {e}")
+        logger.error("❌ Failed to get creatives for campaign %s: %s", campaign_id, e)
         raise
 
 
+@_retry_on_transient_error
 def update_creative(
     db: Session,
     creative_id: UUID,
+    auto_commit: bool = True,
     **updates
 ) -> Optional[Creative]:
     """
@@ -1738,40 +2456,44 @@ def update_creative(
         db: Database session
         creative_id: ID of the creative
         **updates: Fields to update
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
     
     Returns:
         Creative: Updated creative object
     """
     try:
-        creative = db.query(Creative).filter(Creative.id == creative_id).first()
+        updates = {k: v for k, v in updates.items() if k in _CREATIVE_UPDATABLE}
+        creative = _update_returning(db, Creative, (Creative.id == creative_id,), updates)
         
         if not creative:
-            logger.warning(f"⚠️ Creative {creative_id} not found")
+            logger.warning("⚠️ Creative %s not found", creative_id)
             return None
         
-        for key, value in updates.items():
-            if hasattr(creative, key):
-                setattr(creative, key, value)
-        
-        db.commit()
-        db.refresh(creative)
+        _commit(db, auto_commit)
+        if "cost" in updates or "status" in updates:
+            _GENERATION_STATS_CACHE.pop(_uuid_key(creative.user_id), None)
+            _forget_brand_stats(db, campaign_id=creative.campaign_id)
         
-        logger.info(f"✅ Updated creative {creative_id}")
+        logger.info("✅ Updated creative %s", creative_id)
         return creative
         
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to update creative {creative_id}: {e}")
+        logger.error("❌ Failed to update creative %s: %s", creative_id, e)
         raise
 
 
+@_retry_on_transient_error
 def update_creative_status(
     db: Session,
     creative_id: UUID,
     status: str,
     progress: int = 0,
     current_step: Optional[str] = None,
-    error_message: Optional[str] = None
+    error_message: Optional[str] = None,
+    auto_commit: bool = True
 ) -> Optional[Creative]:
     """
     Update creative status and progress.
@@ -1783,47 +2505,164 @@ def update_creative_status(
         progress: Progress percentage (0-100)
         current_step: Detailed step description for UI (e.g., "Planning Scenes", "Generating Videos")
         error_message: Optional error message
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         Creative: Updated creative object
     """
     if db is None:
-        logger.warning(f"⚠️ Database session is None - skipping status update for creative {creative_id}")
+        logger.warning("⚠️ Database session is None - skipping status update for creative %s", creative_id)
         return None
 
     try:
-        creative = db.query(Creative).filter(Creative.id == creative_id).first()
+        values = {"status": status, "progress": max(0, min(100, progress))}  # Clamp 0-100
+        if current_step:
+            values["current_step"] = current_step
+        if error_message:
+            values["error_message"] = error_message
+
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE + refresh
+        creative = _update_returning(db, Creative, (Creative.id == creative_id,), values)
 
         if not creative:
-            logger.warning(f"⚠️ Creative {creative_id} not found for status update")
+            logger.warning("⚠️ Creative %s not found for status update", creative_id)
             return None
 
-        creative.status = status
-        creative.progress = max(0, min(100, progress))  # Clamp 0-100
-        if current_step:
-            creative.current_step = current_step
-        if error_message:
-            creative.error_message = error_message
-
-        db.commit()
-        db.refresh(creative)
+        _commit(db, auto_commit)
+        if status.lower() in TERMINAL_CREATIVE_STATUSES:
+            _GENERATION_STATS_CACHE.pop(_uuid_key(creative.user_id), None)
+            _forget_brand_stats(db, campaign_id=creative.campaign_id)
 
-        logger.info(f"✅ Updated creative {creative_id}: status={status}, progress={progress}%, step={current_step}")
+        logger.info("✅ Updated creative %s: status=%s, progress=%s%%, step=%s", creative_id, status, progress, current_step)
         return creative
     except Exception as e:
+        if not auto_commit:
+            raise
         try:
             db.rollback()
         except:
             pass
-        logger.error(f"❌ Failed to update status for creative {creative_id}: {e}")
-        logger.warning(f"⚠️ Database error updating creative status - continuing with in-memory state")
+        if _is_transient_db_error(e):
+            raise
+        logger.error("❌ Failed to update status for creative %s: %s", creative_id, e)
+        logger.warning("⚠️ Database error updating creative status - continuing with in-memory state")
         return None
 
 
+def queue_creative_status(
+    db: Session,
+    creative_id: UUID,
+    status: str,
+    progress: int = 0,
+    current_step: Optional[str] = None,
+    error_message: Optional[str] = None
+) -> None:
+    """
+    Record a creative status update without waiting for the database.
+
+    Non-terminal progress ticks are coalesced per creative and written by a
+    background flusher every PROGRESS_FLUSH_INTERVAL seconds, so a pipeline
+    ticking 5%, 10%, 15%, ... costs one UPDATE per interval instead of one per
+    tick. Terminal statuses ("completed", "failed") discard any pending tick
+    and are written synchronously through update_creative_status().
+
+    Jobs must call flush_creative_progress() before they return: RQ work
+    horses leave through os._exit(), so nothing queued is flushed at exit.
+
+    Args:
+        db: Database session, used for terminal updates and when no
+            background session factory is available
+        creative_id: ID of the creative
+        status: New status
+        progress: Progress percentage (0-100)
+        current_step: Detailed step description for UI
+        error_message: Optional error message
+    """
+    if status.lower() in TERMINAL_CREATIVE_STATUSES or db_connection.SessionLocal is None:
+        with _pending_progress_lock:
+            _pending_progress.pop(creative_id, None)
+        update_creative_status(
+            db, creative_id, status=status, progress=progress,
+            current_step=current_step, error_message=error_message
+        )
+        return
+
+    values = {"status": status, "progress": max(0, min(100, progress))}
+    if current_step:
+        values["current_step"] = current_step
+    if error_message:
+        values["error_message"] = error_message
+
+    with _pending_progress_lock:
+        _pending_progress.setdefault(creative_id, {}).update(values)
+    _ensure_progress_flusher()
+
+
+def flush_creative_progress() -> int:
+    """
+    Write all pending creative progress ticks in a single transaction.
+
+    Rows that already reached a terminal status are left untouched, so a tick
+    queued before completion can never overwrite the final state.
+
+    Returns:
+        int: Number of creatives whose pending tick was written
+    """
+    with _pending_progress_lock:
+        if not _pending_progress:
+            return 0
+        pending = dict(_pending_progress)
+        _pending_progress.clear()
+
+    if db_connection.SessionLocal is None:
+        return 0
+
+    db = db_connection.SessionLocal()
+    try:
+        for creative_id, values in pending.items():
+            db.execute(
+                update(Creative)
+                .where(
+                    Creative.id == creative_id,
+                    func.lower(Creative.status).notin_(TERMINAL_CREATIVE_STATUSES),
+                )
+                .values(**values)
+            )
+        db.commit()
+        logger.debug("✅ Flushed progress for %s creatives", len(pending))
+        return len(pending)
+    except Exception as e:
+        db.rollback()
+        logger.warning("⚠️ Failed to flush creative progress (%s creatives): %s", len(pending), e)
+        return 0
+    finally:
+        db.close()
+
+
+def _progress_flusher_loop() -> None:
+    while True:
+        time.sleep(PROGRESS_FLUSH_INTERVAL)
+        flush_creative_progress()
+
+
+def _ensure_progress_flusher() -> None:
+    global _progress_flusher
+    if _progress_flusher is not None:
+        return
+    with _pending_progress_lock:
+        if _progress_flusher is None:
+            _progress_flusher = threading.Thread(
+                target=_progress_flusher_loop, name="creative-progress-flusher", daemon=True
+            )
+            _progress_flusher.start()
+
+
+@_retry_on_transient_error
 def update_creative_json(
     db: Session,
     creative_id: UUID,
-    ad_creative_json: Dict[str, Any]
+    ad_creative_json: Dict[str, Any],
+    auto_commit: bool = True
 ) -> Optional[Creative]:
     """
     Update the ad_creative_json configuration for a creative.
@@ -1832,35 +2671,39 @@ def update_creative_json(
         db: Database session
         creative_id: ID of the creative
         ad_creative_json: New configuration JSON
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         Creative: Updated creative object
     """
     try:
-        creative = db.query(Creative).filter(Creative.id == creative_id).first()
+        creative = _update_returning(
+            db, Creative, (Creative.id == creative_id,), {"ad_creative_json": ad_creative_json}
+        )
 
         if not creative:
-            logger.warning(f"⚠️ Creative {creative_id} not found")
+            logger.warning("⚠️ Creative %s not found", creative_id)
             return None
 
-        creative.ad_creative_json = ad_creative_json
-
-        db.commit()
-        db.refresh(creative)
+        _commit(db, auto_commit)
 
-        logger.info(f"✅ Updated creative {creative_id} ad_creative_json")
+        logger.info("✅ Updated creative %s ad_creative_json", creative_id)
         return creative
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to update json for creative {creative_id}: {e}")
+        logger.error("❌ Failed to update json for creative %s: %s", creative_id, e)
         raise
 
 
+@_retry_on_transient_error
 def delete_creative(
     db: Session,
     campaign_id: UUID,
     creative_id: UUID,
-    user_id: UUID
+    user_id: UUID,
+    auto_commit: bool = True
 ) -> bool:
     """
     Delete a creative.
@@ -1870,29 +2713,34 @@ def delete_creative(
         campaign_id: ID of the parent campaign
         creative_id: ID of the creative to delete
         user_id: ID of the user (for ownership validation)
+        auto_commit: Commit on success; pass False to only flush inside a caller-owned transaction
 
     Returns:
         bool: True if deleted, False if not found or unauthorized
     """
     try:
         # Get creative with ownership check
-        creative = db.query(Creative).join(Campaign).join(Product).join(Brand).filter(
+        creative = db.query(Creative).join(Campaign).filter(
             Creative.id == creative_id,
             Creative.campaign_id == campaign_id,
-            Brand.user_id == user_id
+            _campaign_owned_by(user_id)
         ).first()
         
         if not creative:
-            logger.warning(f"⚠️ Cannot delete: Creative {creative_id} not found or not owned by user {user_id}")
+            logger.warning("⚠️ Cannot delete: Creative %s not found or not owned by user %s", creative_id, user_id)
             return False
         
         db.delete(creative)
-        db.commit()
+        _commit(db, auto_commit)
+        _GENERATION_STATS_CACHE.pop(_uuid_key(user_id), None)
+        _forget_brand_stats(db, campaign_id=campaign_id)
         
-        logger.info(f"✅ Deleted creative {creative_id}")
+        logger.info("✅ Deleted creative %s", creative_id)
         return True
         
     except Exception as e:
+        if not auto_commit:
+            raise
         db.rollback()
-        logger.error(f"❌ Failed to delete creative {creative_id}: {e}")
+        logger.error("❌ Failed to delete creative %s: %s", creative_id, e)
         raise
@@ -1,27 +1,43 @@
 """SQLAlchemy ORM models for the database."""
 
-from sqlalchemy import Column, String, Integer, DateTime, Numeric, Text, Boolean, ForeignKey, CheckConstraint, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY, JSON
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, validates
+from sqlalchemy import Column, String, Integer, DateTime, Numeric, Text, Boolean, ForeignKey, CheckConstraint, UniqueConstraint, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
+from sqlalchemy.orm import declarative_base, relationship, validates
 from sqlalchemy.sql import func
 from datetime import datetime
+import os
+import time
 import uuid
 
 Base = declarative_base()
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7) for primary keys.
+
+    The leading 48 bits are the Unix time in milliseconds, so new rows land on
+    the rightmost page of the primary key index instead of a random one.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class Brand(Base):
     """Brand model for storing brand identity information."""
 
     __tablename__ = "brands"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     company_name = Column(String(200), nullable=False)
     brand_name = Column(String(200), nullable=True)
     description = Column(Text, nullable=True)
     guidelines = Column(Text, nullable=True)
+    extracted_guidelines_json = Column(JSONB, nullable=True)  # Cached ExtractedGuidelines.to_dict() of `guidelines`
+    guidelines_extracted_at = Column(DateTime, nullable=True)
     logo_urls = Column(JSONB, nullable=True)  # Array of S3 logo URLs
 
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -34,13 +50,18 @@ class Brand(Base):
         return f"<Brand {self.id} - {self.company_name}>"
 
 
+# Keyset pagination in get_user_brands
+Index("ix_brands_user_created_id", Brand.user_id, Brand.created_at.desc(), Brand.id.desc())
+
+
 class Product(Base):
     """Product model for storing product catalog information."""
 
     __tablename__ = "products"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     brand_id = Column(UUID(as_uuid=True), ForeignKey('brands.id', ondelete='CASCADE'), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), nullable=False, index=True)  # Copied from brand; ownership checks skip the brand join
     product_type = Column(String(100), nullable=False, index=True)
     name = Column(String(200), nullable=False)
     product_gender = Column(String(20), nullable=True)  # 'masculine', 'feminine', 'unisex', or NULL
@@ -59,20 +80,25 @@ class Product(Base):
         return f"<Product {self.id} - {self.name}>"
 
 
+# Keyset pagination in get_brand_products
+Index("ix_products_brand_created_id", Product.brand_id, Product.created_at.desc(), Product.id.desc())
+
+
 class Campaign(Base):
     """Campaign model for storing marketing campaign configurations."""
 
     __tablename__ = "campaigns"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     product_id = Column(UUID(as_uuid=True), ForeignKey('products.id', ondelete='CASCADE'), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), nullable=False)  # Copied from product's brand; see ix_campaigns_user_product
     name = Column(String(100), nullable=False)
     seasonal_event = Column(String(100), nullable=False)
     year = Column(Integer, nullable=False)
     duration = Column(Integer, nullable=False)  # Duration in seconds: 15, 30, 45, 60
     scene_configs = Column(JSONB, nullable=False)  # Array of scene configuration objects
     num_variations = Column(Integer, default=1, nullable=False)  # Number of video variations to generate (1-3)
-    status = Column(String(50), default="draft", index=True)  # draft, generating, completed, failed
+    status = Column(String(50), default="draft")  # draft, generating, completed, failed; see ix_campaigns_status_active
     progress = Column(Integer, default=0)  # Progress percentage 0-100
     error_message = Column(Text, nullable=True)  # Error message if generation failed
 
@@ -84,9 +110,12 @@ class Campaign(Base):
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    # Relationships
-    product = relationship("Product", back_populates="campaigns")
-    creatives = relationship("Creative", back_populates="campaign", cascade="all, delete-orphan")
+    # Relationships. Nearly every single-campaign path reads campaign.product,
+    # so it rides along as an inner join; creatives carry large JSON payloads
+    # and stay lazy, to be eager-loaded per query where they are iterated.
+    # Deletes leave creatives to the FK's ON DELETE CASCADE instead of loading them.
+    product = relationship("Product", back_populates="campaigns", lazy="joined", innerjoin=True)
+    creatives = relationship("Creative", back_populates="campaign", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<Campaign {self.id} - {self.name}>"
@@ -97,12 +126,40 @@ class Campaign(Base):
         return f"{self.name}-{self.seasonal_event}-{self.year}"
 
 
+# Ownership checks by user_id (leading column also serves user-only lookups)
+Index("ix_campaigns_user_product", Campaign.user_id, Campaign.product_id)
+
+# Keyset pagination in get_campaigns_by_product. Deliberately not partial on
+# status: campaign listings show every status, so a WHERE status <> 'failed'
+# index would never match their predicates.
+Index("ix_campaigns_product_created", Campaign.product_id, Campaign.created_at.desc(), Campaign.id.desc())
+
+# get_user_campaigns filtered by status: one ordered scan instead of
+# bitmap-ANDing the user and status indexes and sorting by created_at
+Index("ix_campaigns_user_status_created", Campaign.user_id, Campaign.status, Campaign.created_at.desc())
+
+# Status lookups only target the few in-flight rows; finished campaigns,
+# the vast majority, stay out of the index
+Index(
+    "ix_campaigns_status_active",
+    Campaign.status,
+    postgresql_where=Campaign.status.in_(("pending", "processing")),
+)
+
+# Partial index for clear_old_failed_campaigns
+Index(
+    "ix_campaigns_failed_created_at",
+    Campaign.created_at,
+    postgresql_where=Campaign.status.in_(("FAILED", "failed")),
+)
+
+
 class Creative(Base):
     """Creative model for storing individual creative executions within a campaign."""
 
     __tablename__ = "creatives"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     campaign_id = Column(UUID(as_uuid=True), ForeignKey('campaigns.id', ondelete='CASCADE'), nullable=False, index=True)
     user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     title = Column(String(200), nullable=False)
@@ -118,16 +175,15 @@ class Creative(Base):
     s3_campaign_folder_url = Column(String, nullable=True)
 
     # Video settings
-    aspect_ratio = Column(String, default='16:9')
     product_images = Column(ARRAY(Text), nullable=True)
     scene_backgrounds = Column(JSONB, nullable=True)
     output_formats = Column(ARRAY(Text), nullable=True, default=['16:9'])
 
     # Local storage paths
     local_campaign_path = Column(String(500), nullable=True)
-    local_video_paths = Column(JSON, nullable=True)
-    local_input_files = Column(JSON, nullable=True)
-    local_draft_files = Column(JSON, nullable=True)
+    local_video_paths = Column(JSONB, nullable=True)
+    local_input_files = Column(JSONB, nullable=True)
+    local_draft_files = Column(JSONB, nullable=True)
 
     # Style and provider settings
     selected_style = Column(String(50), nullable=True)
@@ -143,6 +199,11 @@ class Creative(Base):
     def __repr__(self):
         return f"<Creative {self.id} - {self.title}>"
 
+    @property
+    def aspect_ratio(self):
+        """Primary output format; replaces the dropped aspect_ratio column."""
+        return self.output_formats[0] if self.output_formats else '9:16'
+
     @validates('video_provider')
     def validate_video_provider(self, key, value):
         """Validate that video_provider is either 'replicate' or 'ecs'."""
@@ -155,6 +216,10 @@ class Creative(Base):
         return value
 
 
+# Covering index for the get_generation_stats aggregate
+Index("ix_creatives_user_status", Creative.user_id, Creative.status, postgresql_include=["cost"])
+
+
 # ============================================================================
 # Users Model (Direct PostgreSQL Authentication)
 # ============================================================================
@@ -166,7 +231,7 @@ class User(Base):
     """
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
@@ -1,18 +1,17 @@
 """Jobs module for background processing."""
 
-# These imports require image processing libraries (OpenCV/NumPy)
-# They're only needed in the worker Lambda, not the API Lambda
-try:
-    from app.jobs.generation_pipeline import GenerationPipeline, generate_video
-    from app.jobs.sqs_worker import SQSWorkerConfig, create_sqs_worker
-    _HAS_JOBS = True
-except (ImportError, AttributeError) as e:
-    # Missing dependencies for image processing
-    GenerationPipeline = None
-    generate_video = None
-    SQSWorkerConfig = None
-    create_sqs_worker = None
-    _HAS_JOBS = False
+import importlib
+
+# These exports pull in image processing libraries (OpenCV/NumPy/rembg).
+# They're only needed in the worker Lambda, not the API Lambda, so they are
+# imported on first attribute access instead of with the package (importing
+# any app.jobs submodule would otherwise pay for them too).
+_LAZY_EXPORTS = {
+    "GenerationPipeline": "app.jobs.generation_pipeline",
+    "generate_video": "app.jobs.generation_pipeline",
+    "SQSWorkerConfig": "app.jobs.sqs_worker",
+    "create_sqs_worker": "app.jobs.sqs_worker",
+}
 
 __all__ = [
     "GenerationPipeline",
@@ -21,3 +20,14 @@ __all__ = [
     "create_sqs_worker",
 ]
 
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    except (ImportError, AttributeError):
+        # Missing dependencies for image processing
+        value = None
+    globals()[name] = value
+    return value
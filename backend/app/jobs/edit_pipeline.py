@@ -1,25 +1,28 @@
 """Scene editing pipeline job."""
 
 import asyncio
+import functools
 import logging
 import time
 import os
 import tempfile
 import aiohttp
-import boto3
 from uuid import UUID
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
 
 from app.database.connection import init_db
 from app.database import connection as db_connection
-from app.database.crud import get_campaign_by_id, update_campaign
+from app.database.crud import apply_scene_edit, get_campaign_by_id, mark_campaign_processing, update_campaign_by_id
 from app.services.edit_service import EditService
 from app.services.video_generator import VideoGenerator
 from app.services.renderer import Renderer
+from app.utils.http_download import stream_response_to_file
 from app.utils.s3_utils import (
     upload_draft_video,
     upload_final_video,
+    S3_TRANSFER_CONFIG,
+    get_s3_client,
     get_scene_s3_url,
     get_final_video_s3_url,
     parse_s3_url,
@@ -29,6 +32,9 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Parallel S3 scene downloads per edit (bounded to avoid S3 throttling)
+SCENE_DOWNLOAD_CONCURRENCY = 8
+
 
 class SceneEditPipeline:
     """Pipeline for editing a single scene in a campaign."""
@@ -41,12 +47,47 @@ class SceneEditPipeline:
     ):
         """Initialize edit pipeline."""
         self.campaign_id = campaign_id
+        self.campaign_id_str = str(campaign_id)  # For S3 keys, logs and the job result
         self.scene_index = scene_index
         self.edit_instruction = edit_instruction
         self.db = None  # Will be initialized in run()
         
         logger.info(f"Initialized edit pipeline for campaign {campaign_id}, scene {scene_index}")
     
+    async def _download_scenes(self, urls: List[str], temp_paths: List[str]) -> List[str]:
+        """
+        Download scene videos from S3 to temp files, in order.
+
+        Downloads run concurrently on the default executor with one shared
+        (thread-safe) S3 client, at most SCENE_DOWNLOAD_CONCURRENCY at a time.
+        Each temp file is appended to temp_paths as soon as it exists, and the
+        call only returns or raises once no download is still writing, so the
+        caller can always delete them afterwards.
+        """
+        s3_client = get_s3_client()
+        semaphore = asyncio.Semaphore(SCENE_DOWNLOAD_CONCURRENCY)
+        loop = asyncio.get_running_loop()
+
+        async def download(url: str) -> str:
+            with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as temp:
+                temp_path = temp.name
+            temp_paths.append(temp_path)
+            bucket_name, s3_key = parse_s3_url(url)
+            async with semaphore:
+                await loop.run_in_executor(
+                    None,
+                    functools.partial(s3_client.download_file, bucket_name, s3_key, temp_path, Config=S3_TRANSFER_CONFIG)
+                )
+            return temp_path
+
+        # return_exceptions so one failed download doesn't return early while
+        # the others are still writing their files
+        results = await asyncio.gather(*(download(url) for url in urls), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+    
     async def run(self) -> Dict[str, Any]:
         """Execute scene edit pipeline."""
         start_time = time.time()
@@ -54,22 +95,29 @@ class SceneEditPipeline:
         
         # Initialize DB session
         self.db = db_connection.SessionLocal()
+        prefetch = None
+        # Every local temp file of this edit, deleted in the finally below
+        temp_paths: List[str] = []
         
         try:
-            logger.info(f"Starting scene edit: Campaign {self.campaign_id}, Scene {self.scene_index}")
+            logger.info(f"Starting scene edit: Campaign {self.campaign_id_str}, Scene {self.scene_index}")
             
             # Load campaign
             self.campaign = get_campaign_by_id(self.db, self.campaign_id)
             if not self.campaign:
-                raise ValueError(f"Campaign {self.campaign_id} not found")
+                raise ValueError(f"Campaign {self.campaign_id_str} not found")
+            
+            # Read what the pipeline needs once: product and brand come back
+            # with the campaign, but the status commit below expires them and
+            # every later access through the ORM graph would reload them
+            brand_id = str(self.campaign.product.brand_id)
+            product_id = str(self.campaign.product_id)
+            campaign_id = self.campaign_id_str
+            variation_index = self.campaign.selected_variation_index or 0
+            campaign_json = self.campaign.campaign_json
             
             # Update status
-            update_campaign(self.db, self.campaign_id, status="processing")
-            
-            campaign_json = self.campaign.campaign_json
-            if isinstance(campaign_json, str):
-                import json
-                campaign_json = json.loads(campaign_json)
+            mark_campaign_processing(self.db, self.campaign_id)
             
             # STEP 1: Get scene data
             scenes = campaign_json.get('scenes', [])
@@ -86,6 +134,21 @@ class SceneEditPipeline:
             
             logger.info(f"Scene {self.scene_index}: role={scene_role}, duration={scene_duration}s")
             
+            # The unchanged scenes are needed whatever the edit turns out to be:
+            # start downloading them now so S3 transfer overlaps STEP 2-4
+            other_scene_urls = [
+                get_scene_s3_url(
+                    brand_id=brand_id,
+                    product_id=product_id,
+                    campaign_id=campaign_id,
+                    variation_index=variation_index,
+                    scene_index=i
+                )
+                for i in range(len(scenes))
+                if i != self.scene_index
+            ]
+            prefetch = asyncio.create_task(self._download_scenes(other_scene_urls, temp_paths))
+            
             # STEP 2: Modify prompt via LLM
             edit_service = EditService(openai_api_key=settings.openai_api_key)
             
@@ -115,63 +178,35 @@ class SceneEditPipeline:
             
             logger.info(f"New scene video generated: {new_video_url}")
             
-            # STEP 4: Download and upload to S3 (replace old scene)
-            with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as tmp:
-                tmp_path = tmp.name
-                
+            # STEP 4: Download the new scene and upload it to S3 (replace old scene)
+            async def fetch_new_scene() -> str:
+                with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as tmp:
+                    tmp_path = tmp.name
+                temp_paths.append(tmp_path)
+
                 async with aiohttp.ClientSession() as session:
                     async with session.get(new_video_url) as resp:
                         if resp.status != 200:
                             raise RuntimeError(f"Failed to download video: HTTP {resp.status}")
-                        content = await resp.read()
-                        tmp.write(content)
-            
-            # Upload to S3 (replaces old scene video)
-            s3_result = await upload_draft_video(
-                brand_id=str(self.campaign.product.brand_id),
-                product_id=str(self.campaign.product_id),
-                campaign_id=str(self.campaign_id),
-                variation_index=self.campaign.selected_variation_index or 0,
-                scene_index=self.scene_index + 1,  # 1-based
-                file_path=tmp_path
-            )
-            new_scene_s3_url = s3_result['url']
-            
-            os.unlink(tmp_path)
-            logger.info(f"Scene uploaded to S3: {new_scene_s3_url}")
-            
-            # STEP 5: Download ALL scenes for re-rendering
-            all_scene_urls = []
-            for i, s in enumerate(scenes):
-                if i == self.scene_index:
-                    # Use new scene
-                    all_scene_urls.append(new_scene_s3_url)
-                else:
-                    # Use existing scene from S3
-                    scene_s3_url = get_scene_s3_url(
-                        brand_id=str(self.campaign.product.brand_id),
-                        product_id=str(self.campaign.product_id),
-                        campaign_id=str(self.campaign_id),
-                        variation_index=self.campaign.selected_variation_index or 0,
-                        scene_index=i
-                    )
-                    all_scene_urls.append(scene_s3_url)
-            
-            # Download scenes temporarily
-            scene_temps = []
-            for url in all_scene_urls:
-                temp = tempfile.NamedTemporaryFile(suffix='.mp4', delete=False)
-                temp_path = temp.name
-                # Download from S3 using boto3
-                bucket_name, s3_key = parse_s3_url(url)
-                s3_client = boto3.client(
-                    's3',
-                    aws_access_key_id=settings.aws_access_key_id,
-                    aws_secret_access_key=settings.aws_secret_access_key,
-                    region_name=settings.aws_region
+                        await stream_response_to_file(resp, tmp_path)
+                
+                # Upload to S3 (replaces old scene video)
+                s3_result = await upload_draft_video(
+                    brand_id=brand_id,
+                    product_id=product_id,
+                    campaign_id=campaign_id,
+                    variation_index=variation_index,
+                    scene_index=self.scene_index + 1,  # 1-based
+                    file_path=tmp_path
                 )
-                s3_client.download_file(bucket_name, s3_key, temp_path)
-                scene_temps.append(temp_path)
+                logger.info(f"Scene uploaded to S3: {s3_result['url']}")
+                return tmp_path
+            
+            # STEP 5: Collect the prefetched unchanged scenes, and render from the
+            # new scene's local copy instead of fetching it back from S3
+            new_scene_path = await fetch_new_scene()
+            scene_temps = await prefetch
+            scene_temps.insert(self.scene_index, new_scene_path)
             
             # STEP 6: Re-render final video
             renderer = Renderer(
@@ -187,10 +222,10 @@ class SceneEditPipeline:
                 # Construct S3 URL for audio file
                 from app.utils.s3_utils import get_audio_s3_url
                 audio_url = get_audio_s3_url(
-                    brand_id=str(self.campaign.product.brand_id),
-                    product_id=str(self.campaign.product_id),
-                    campaign_id=str(self.campaign_id),
-                    variation_index=self.campaign.selected_variation_index or 0
+                    brand_id=brand_id,
+                    product_id=product_id,
+                    campaign_id=campaign_id,
+                    variation_index=variation_index
                 )
                 logger.info(f"Constructed audio S3 URL: {audio_url}")
             
@@ -200,51 +235,25 @@ class SceneEditPipeline:
             final_video_path = await renderer.render_final_video(
                 scene_video_urls=scene_temps,
                 audio_url=audio_url,
-                campaign_id=str(self.campaign_id),
-                variation_index=self.campaign.selected_variation_index or 0
+                campaign_id=campaign_id,
+                variation_index=variation_index
             )
+            temp_paths.append(final_video_path)
             
             # STEP 7: Upload new final video (replaces old)
             final_result = await upload_final_video(
-                brand_id=str(self.campaign.product.brand_id),
-                product_id=str(self.campaign.product_id),
-                campaign_id=str(self.campaign_id),
-                variation_index=self.campaign.selected_variation_index or 0,
+                brand_id=brand_id,
+                product_id=product_id,
+                campaign_id=campaign_id,
+                variation_index=variation_index,
                 file_path=final_video_path
             )
             
             # STEP 8: Update campaign database
-            # Update scene prompt
-            scenes[self.scene_index]['background_prompt'] = modified_prompt
-            scenes[self.scene_index]['edit_count'] = scenes[self.scene_index].get('edit_count', 0) + 1
-            scenes[self.scene_index]['last_edited_at'] = datetime.utcnow().isoformat() + "Z"
-            
-            # Update variationPaths with new final video URL
-            # This ensures frontend gets the updated video URL
-            variation_index = self.campaign.selected_variation_index or 0
+            # Only the changed paths are sent; Postgres patches campaign_json
+            # in place (scene fields, 9:16 export URL, edit history)
             new_final_video_url = final_result['url']  # New presigned URL
             
-            if 'variationPaths' not in campaign_json:
-                campaign_json['variationPaths'] = {}
-            
-            if f'variation_{variation_index}' not in campaign_json['variationPaths']:
-                campaign_json['variationPaths'][f'variation_{variation_index}'] = {
-                    'aspectExports': {}
-                }
-            
-            # Update the 9:16 aspect export with new URL
-            campaign_json['variationPaths'][f'variation_{variation_index}']['aspectExports']['9:16'] = new_final_video_url
-            
-            logger.info(f"✅ Updated variationPaths with new final video URL for variation_{variation_index}")
-            
-            # Add to edit history
-            if 'edit_history' not in campaign_json:
-                campaign_json['edit_history'] = {
-                    'edits': [],
-                    'total_edit_cost': 0.0,
-                    'edit_count': 0
-                }
-            
             edit_record = edit_service.create_edit_record(
                 scene_index=self.scene_index,
                 edit_prompt=self.edit_instruction,
@@ -255,33 +264,29 @@ class SceneEditPipeline:
                 duration_seconds=int(time.time() - start_time)
             )
             
-            campaign_json['edit_history']['edits'].append(edit_record)
-            campaign_json['edit_history']['total_edit_cost'] += total_cost
-            campaign_json['edit_history']['edit_count'] += 1
-            
-            # Update campaign
-            update_campaign(
+            apply_scene_edit(
                 self.db,
                 self.campaign_id,
-                campaign_json=campaign_json,
-                cost=float(self.campaign.cost) + total_cost,
-                status="completed"
+                scene_index=self.scene_index,
+                scene_updates={
+                    'background_prompt': modified_prompt,
+                    'edit_count': scene.get('edit_count', 0) + 1,
+                    'last_edited_at': datetime.utcnow().isoformat() + "Z"
+                },
+                variation_index=variation_index,
+                final_video_url=new_final_video_url,
+                edit_record=edit_record,
+                edit_cost=total_cost
             )
             
-            # STEP 9: Cleanup temps
-            for temp in scene_temps + [final_video_path]:
-                if os.path.exists(temp):
-                    try:
-                        os.unlink(temp)
-                    except Exception as e:
-                        logger.warning(f"Failed to delete temp file {temp}: {e}")
+            logger.info(f"✅ Updated variationPaths with new final video URL for variation_{variation_index}")
             
             elapsed = time.time() - start_time
             logger.info(f"✅ Scene edit complete! Time: {elapsed:.1f}s, Cost: ${total_cost:.2f}")
             
             return {
                 "success": True,
-                "campaign_id": str(self.campaign_id),
+                "campaign_id": campaign_id,
                 "scene_index": self.scene_index,
                 "cost": total_cost,
                 "duration_seconds": int(elapsed),
@@ -291,10 +296,22 @@ class SceneEditPipeline:
             
         except Exception as e:
             logger.error(f"❌ Scene edit failed: {e}", exc_info=True)
-            update_campaign(self.db, self.campaign_id, status="failed", error_message=str(e))
+            update_campaign_by_id(self.db, self.campaign_id, status="failed", error_message=str(e))
             raise
         
         finally:
+            if prefetch is not None:
+                # Cancelling would not stop downloads already running in the
+                # executor, so wait for them (this also retrieves a prefetch
+                # failure) before deleting what they wrote
+                await asyncio.gather(prefetch, return_exceptions=True)
+            # STEP 9: Cleanup temps, whether or not the edit succeeded
+            for temp in temp_paths:
+                if os.path.exists(temp):
+                    try:
+                        os.unlink(temp)
+                    except Exception as e:
+                        logger.warning(f"Failed to delete temp file {temp}: {e}")
             self.db.close()
 
 
@@ -30,25 +30,30 @@ S3-FIRST ARCHITECTURE:
 
 import asyncio
 import logging
+import re
 import time
 import boto3
 from uuid import UUID
 from typing import Dict, Any, Optional, List, Tuple
-from datetime import datetime
-from functools import wraps
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
 
+from cachetools import TTLCache
+
+from app.config import settings
 from app.database import connection as db_connection
 from app.database.connection import init_db
 from app.database.crud import (
     get_campaign_by_id,
-    get_product_by_id,
-    get_brand_by_id,
     get_creative_by_id,
     update_campaign_json,
     update_creative_status,
     update_creative_json,
+    queue_creative_status,
+    flush_creative_progress,
+    save_brand_guidelines,
 )
-from app.models.schemas import AdCampaign, Scene, StyleSpec
+from app.models.schemas import AdCampaign, Overlay, Scene, StyleSpec
 from app.services.scene_planner import ScenePlanner
 from app.services.product_extractor import ProductExtractor
 from app.services.video_generator import VideoGenerator
@@ -62,21 +67,83 @@ from app.utils.s3_utils import (
     upload_draft_video,
     upload_final_video,
     upload_draft_music,
+    S3_TRANSFER_CONFIG,
 )
 from app.utils.local_storage import LocalStorageManager, format_storage_size
-from decimal import Decimal
+from app.utils.http_download import stream_response_to_file
 
 logger = logging.getLogger(__name__)
 
-# Cost constants (in USD, based on API documentation)
-COST_REFERENCE_EXTRACTION = Decimal("0.025")  # GPT-4 Vision extraction
-COST_SCENE_PLANNING = Decimal("0.01")  # GPT-4o-mini cheap
-COST_PRODUCT_EXTRACTION = Decimal("0.00")  # rembg local, free
-COST_VIDEO_GENERATION = Decimal("0.08")  # SeedAnce-1-lite per scene
-COST_COMPOSITING = Decimal("0.00")  # Local OpenCV, free
-COST_TEXT_OVERLAY = Decimal("0.00")  # Local FFmpeg, free
-COST_MUSIC_GENERATION = Decimal("0.10")  # MusicGen per track
-COST_RENDERING = Decimal("0.00")  # Local FFmpeg, free
+# Cost constants (in USD, based on API documentation). Costs accumulate as
+# floats; cents-level rounding happens where they are persisted.
+COST_REFERENCE_EXTRACTION = 0.025  # GPT-4 Vision extraction
+COST_SCENE_PLANNING = 0.01  # GPT-4o-mini cheap
+COST_PRODUCT_EXTRACTION = 0.00  # rembg local, free
+COST_VIDEO_GENERATION = 0.08  # SeedAnce-1-lite per scene
+COST_COMPOSITING = 0.00  # Local OpenCV, free
+COST_TEXT_OVERLAY = 0.00  # Local FFmpeg, free
+COST_MUSIC_GENERATION = 0.10  # MusicGen per track
+COST_RENDERING = 0.00  # Local FFmpeg, free
+
+# Scene videos moved to S3 at once per variation in _upload_scene_videos_to_s3
+SCENE_TRANSFER_CONCURRENCY = 8
+
+# Virtual-hosted (bucket.s3.region...) and path-style (s3.region... / s3...)
+# S3 hosts; checked against the host only, not the path or query string
+_S3_HOST_PATTERN = r"^https://(?:[^/?#]+\.)?s3[.-][^/?#]*amazonaws\.com(?:[/?#]|$)"
+
+
+@lru_cache(maxsize=None)
+def _s3_url_re(bucket_name: Optional[str]) -> "re.Pattern[str]":
+    """S3 host pattern, plus any https URL naming the configured bucket (compiled once per bucket)."""
+    if not bucket_name:
+        return re.compile(_S3_HOST_PATTERN)
+    return re.compile(rf"{_S3_HOST_PATTERN}|^https://.*{re.escape(bucket_name)}")
+
+# Extracted brand guidelines (ExtractedGuidelines.to_dict()) keyed by
+# (brand_id, guidelines document), so every variation and rerun for a brand
+# skips the download + LLM extraction. Backed by brands.extracted_guidelines_json
+# across processes.
+_GUIDELINES_CACHE: TTLCache = TTLCache(maxsize=512, ttl=3600)
+
+def _scene_from_plan(index: int, scene: Dict[str, Any], default_style: Optional[str]) -> Scene:
+    """Convert one ScenePlanner scene dict to an AdCampaign Scene."""
+    g = scene.get
+    overlay = g('overlay')
+    return Scene(
+        id=str(g('scene_id', index)),
+        role=g('role', 'showcase'),
+        duration=g('duration', 5),
+        description=g('background_prompt', ''),
+        background_prompt=g('background_prompt', ''),
+        background_type=g('background_type', 'cinematic'),
+        style=g('style', default_style),
+        
+        use_product=g('use_product', False),
+        product_usage=g('product_usage', 'static_insert'),
+        product_position=g('product_position', 'center'),
+        product_scale=g('product_scale', 0.3),
+        product_opacity=g('product_opacity', 1.0),
+        
+        use_logo=g('use_logo', False),
+        logo_position=g('logo_position', 'top_right'),
+        logo_scale=g('logo_scale', 0.1),
+        logo_opacity=g('logo_opacity', 0.9),
+        
+        camera_movement=g('camera_movement', 'static'),
+        transition_to_next=g('transition_to_next', 'cut'),
+        safe_zone=g('safe_zone'),
+        overlay_preference=g('overlay_preference'),
+        
+        # Text overlay
+        overlay=Overlay(
+            text=overlay.get('text', ''),
+            position=overlay.get('position', 'bottom'),
+            font_size=overlay.get('font_size', 48),
+            duration=overlay.get('duration', 2.0),
+        ) if overlay else None,
+    )
+
 
 def timed_step(step_name: str):
     """Decorator to time pipeline steps."""
@@ -84,7 +151,7 @@ def timed_step(step_name: str):
         @wraps(func)
         async def wrapper(self, *args, **kwargs):
             start_time = time.time()
-            logger.info(f"Starting step: {step_name}")
+            logger.info("Starting step: %s", step_name)
             
             try:
                 result = await func(self, *args, **kwargs)
@@ -93,11 +160,11 @@ def timed_step(step_name: str):
                 if hasattr(self, 'step_timings'):
                     self.step_timings[step_name] = elapsed
                 
-                logger.info(f"Step complete: {step_name} ({elapsed:.1f}s)")
+                logger.info("Step complete: %s (%.1fs)", step_name, elapsed)
                 return result
             except Exception as e:
                 elapsed = time.time() - start_time
-                logger.error(f"Step failed: {step_name} ({elapsed:.1f}s) - {str(e)}")
+                logger.error("Step failed: %s (%.1fs) - %s", step_name, elapsed, str(e))
                 raise
         
         return wrapper
@@ -108,6 +175,12 @@ def timed_step(step_name: str):
 # Provider Metadata Tracking (Story 4.4)
 # ============================================================================
 
+# Keys build_provider_metadata always emits, even when the value is None
+_REQUIRED_METADATA_KEYS = frozenset(
+    ("primary_provider", "actual_provider", "failover_used", "timestamp", "endpoint")
+)
+
+
 def build_provider_metadata(
     primary_provider: str,
     actual_provider: str,
@@ -131,21 +204,16 @@ def build_provider_metadata(
     Returns:
         Dictionary with provider metadata in standard format
     """
-    metadata = {
-        "primary_provider": primary_provider,
-        "actual_provider": actual_provider,
-        "failover_used": failover_used,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "endpoint": endpoint,
-    }
-
-    if failover_reason:
-        metadata["failover_reason"] = failover_reason
-
-    if generation_duration_ms is not None:
-        metadata["generation_duration_ms"] = generation_duration_ms
-
-    return metadata
+    # Built in one pass; optional fields are dropped when unset
+    return {k: v for k, v in (
+        ("primary_provider", primary_provider),
+        ("actual_provider", actual_provider),
+        ("failover_used", failover_used),
+        ("timestamp", datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")),
+        ("endpoint", endpoint),
+        ("failover_reason", failover_reason or None),
+        ("generation_duration_ms", generation_duration_ms),
+    ) if v is not None or k in _REQUIRED_METADATA_KEYS}
 
 
 class GenerationPipeline:
@@ -175,33 +243,35 @@ class GenerationPipeline:
 
         self.db = db_connection.SessionLocal()
         self.step_timings: Dict[str, float] = {}
-        self.total_cost: Decimal = Decimal("0.00")
-        self.step_costs: Dict[str, Decimal] = {}
+        self.total_cost: float = 0.0
+        self.step_costs: Dict[str, float] = {}
+        self._guidelines_task: Optional[asyncio.Future] = None
 
-        # Load campaign, product, and brand from database
+        # Load campaign, product, and brand in one query (get_campaign_by_id
+        # joins product and brand eagerly)
         self.campaign = get_campaign_by_id(self.db, campaign_id)
         if not self.campaign:
             raise ValueError(f"Campaign {campaign_id} not found")
 
-        logger.info(f"🔍 Loaded campaign {self.campaign.id}: product_id={self.campaign.product_id}")
+        logger.info("🔍 Loaded campaign %s: product_id=%s", self.campaign.id, self.campaign.product_id)
 
-        self.product = get_product_by_id(self.db, self.campaign.product_id)
+        self.product = self.campaign.product
         if not self.product:
             raise ValueError(f"Product {self.campaign.product_id} not found")
 
-        logger.info(f"🔍 Loaded product {self.product.id}: brand_id={self.product.brand_id}")
+        logger.info("🔍 Loaded product %s: brand_id=%s", self.product.id, self.product.brand_id)
 
-        # Load brand through product
-        self.brand = get_brand_by_id(self.db, self.product.brand_id)
+        # Brand comes from the same query, through product
+        self.brand = self.product.brand
         if not self.brand:
             raise ValueError(f"Brand {self.product.brand_id} not found")
 
-        logger.info(f"🔍 Loaded brand {self.brand.id}: user_id={self.brand.user_id}")
+        logger.info("🔍 Loaded brand %s: user_id=%s", self.brand.id, self.brand.user_id)
 
         if self.creative_id:
-            logger.info(f"✅ Verified IDs: brand={self.brand.id}, product={self.product.id}, campaign={self.campaign.id}, creative={self.creative_id}")
+            logger.info("✅ Verified IDs: brand=%s, product=%s, campaign=%s, creative=%s", self.brand.id, self.product.id, self.campaign.id, self.creative_id)
         else:
-            logger.info(f"✅ Verified IDs: brand={self.brand.id}, product={self.product.id}, campaign={self.campaign.id}")
+            logger.info("✅ Verified IDs: brand=%s, product=%s, campaign=%s", self.brand.id, self.product.id, self.campaign.id)
 
     def _update_status(self, status: str, progress: int = 0, current_step: Optional[str] = None, error_message: Optional[str] = None):
         """Update creative status and progress.
@@ -212,7 +282,7 @@ class GenerationPipeline:
             current_step: Detailed step description for UI (e.g., "Planning Scenes", "Generating Videos")
             error_message: Optional error message
         """
-        update_creative_status(
+        queue_creative_status(
             self.db,
             self.creative_id,
             status=status,
@@ -221,6 +291,66 @@ class GenerationPipeline:
             error_message=error_message
         )
 
+    async def _load_brand_guidelines(self, brand: Any, brand_name: str):
+        """Return the brand's extracted guidelines, loading them once per pipeline.
+
+        Planning steps running concurrently share one in-flight load.
+        """
+        if self._guidelines_task is None:
+            self._guidelines_task = asyncio.ensure_future(
+                self._fetch_brand_guidelines(brand, brand_name)
+            )
+        return await self._guidelines_task
+
+    async def _fetch_brand_guidelines(self, brand: Any, brand_name: str):
+        """Return the brand's extracted guidelines, extracting them only on a cache miss.
+
+        Looks at the copy cached on the brand row, then _GUIDELINES_CACHE, and
+        only then downloads and runs the document through the extractor.
+
+        Returns:
+            ExtractedGuidelines, or None if there is no document or extraction fails
+        """
+        from app.services.brand_guidelines_extractor import BrandGuidelineExtractor, ExtractedGuidelines
+
+        guidelines_url = brand.guidelines
+        cache_key = (brand.id, guidelines_url)
+
+        stored = brand.extracted_guidelines_json
+        if stored and stored.get("source_url") == guidelines_url:
+            _GUIDELINES_CACHE[cache_key] = stored
+            logger.info("Using brand guidelines cached on brand %s", brand.id)
+            return ExtractedGuidelines.from_dict(stored)
+
+        cached = _GUIDELINES_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("Using brand guidelines cached in process for brand %s", brand.id)
+            return ExtractedGuidelines.from_dict(cached)
+
+        from app.services.openai_client import get_async_openai_client
+
+        extractor = BrandGuidelineExtractor(
+            openai_client=get_async_openai_client(settings.openai_api_key),
+            aws_access_key_id=settings.aws_access_key_id,
+            aws_secret_access_key=settings.aws_secret_access_key,
+            s3_bucket_name=settings.s3_bucket_name,
+            aws_region=settings.aws_region,
+        )
+        extracted = await extractor.extract_guidelines(
+            guidelines_url=guidelines_url,
+            brand_name=brand_name
+        )
+        if extracted is None:
+            return None
+
+        guidelines_json = {**extracted.to_dict(), "source_url": guidelines_url}
+        _GUIDELINES_CACHE[cache_key] = guidelines_json
+        try:
+            await asyncio.to_thread(save_brand_guidelines, self.db, brand.id, guidelines_json)
+        except Exception as e:
+            logger.warning("Could not persist extracted guidelines for brand %s: %s", brand.id, e)
+        return extracted
+
     async def run(self) -> Dict[str, Any]:
         """Execute the full generation pipeline.
         
@@ -234,23 +364,25 @@ class GenerationPipeline:
         music_task = None
         
         try:
-            logger.info(f"Starting generation pipeline for campaign {self.campaign_id}")
+            logger.info("Starting generation pipeline for campaign %s", self.campaign_id)
 
             # Campaign, product, and brand already loaded in __init__
             campaign = self.campaign
             product = self.product
             brand = self.brand
 
-            # Initialize local storage (using campaign_id)
-            logger.info("Initializing local storage...")
-            try:
-                local_paths = LocalStorageManager.initialize_campaign_storage(self.campaign_id)
-                self.local_paths = local_paths
-                storage_size = LocalStorageManager.get_campaign_storage_size(self.campaign_id)
-                logger.info(f"Local storage initialized: {self.local_paths}")
-            except Exception as e:
-                logger.error(f"Failed to initialize local storage: {e}")
-                raise
+            # Initialize local storage (using campaign_id). The mkdirs run on a
+            # worker thread, alongside product extraction and scene planning.
+            async def init_local_storage() -> None:
+                logger.info("Initializing local storage...")
+                try:
+                    self.local_paths = await asyncio.to_thread(
+                        LocalStorageManager.initialize_campaign_storage, self.campaign_id
+                    )
+                    logger.info("Local storage initialized: %s", self.local_paths)
+                except Exception as e:
+                    logger.error("Failed to initialize local storage: %s", e)
+                    raise
 
             # Parse Campaign JSON from scene_configs
             # Build campaign_json from existing fields since Campaign model doesn't have campaign_json attribute
@@ -262,20 +394,24 @@ class GenerationPipeline:
                 'year': campaign.year,
                 'duration': campaign.duration
             }
-            logger.info(f"🔍 Built campaign_json from Campaign model fields")
+            logger.info("🔍 Built campaign_json from Campaign model fields")
             
             # Build AdCampaign from campaign data
             ad_campaign = self._build_ad_campaign_from_campaign(campaign, product, brand, campaign_json)
             
             # STEP 0 REMOVED: Reference image extraction (feature removed in Phase 2 B2B SaaS)
 
-            # STEP 1: Extract Product from Product Images
-            product_url = None
+            # STEP 1 + STEP 2: Extract product and plan scenes concurrently.
+            # Scene planning doesn't need the extracted product (only the
+            # variation steps do), so the two network-bound steps overlap.
             has_product = product.image_urls and isinstance(product.image_urls, list) and len(product.image_urls) > 0
 
-            if has_product:
+            async def extract_product() -> Optional[str]:
+                if not has_product:
+                    logger.info("Step 1: Skipping product extraction (no product images)")
+                    return None
+
                 logger.info("Step 1: Extracting product from product image...")
-                from app.config import settings
                 import os
 
                 # In Lambda, don't pass explicit credentials - let boto3 use IAM role
@@ -290,52 +426,70 @@ class GenerationPipeline:
                 )
                 # Use first image from image_urls array
                 front_image_url = product.image_urls[0]
-                logger.info(f"Extracting product from image: {front_image_url}")
-                product_url = await extractor.extract_product(
+                logger.info("Extracting product from image: %s", front_image_url)
+                return await extractor.extract_product(
                     image_url=front_image_url,
                     campaign_id=str(campaign.id)
                 )
-            else:
-                logger.info("Step 1: Skipping product extraction (no product images)")
 
             # STEP 2: Plan Scenes (with multi-variation support)
             planning_start = 15 if has_product else 10
             num_variations = campaign.num_variations or 1
-            logger.info(f"Step 2: Planning scenes (variations: {num_variations})...")
-            
-            if num_variations > 1:
-                # Multi-variation flow: Generate N scene plan variations
-                logger.info(f"Generating {num_variations} scene plan variations...")
-                scene_variations = await self._plan_scenes_variations(
-                    campaign, product, brand, ad_campaign, num_variations, progress_start=planning_start
-                )
-                # Use first variation's ad_campaign for metadata (all variations share same brand/product info)
-                # _plan_scenes modifies ad_campaign in place, so we don't need to recreate it
-                await self._plan_scenes(campaign, product, brand, ad_campaign, progress_start=planning_start)
-            else:
+
+            async def plan_scenes() -> List[Any]:
+                logger.info("Step 2: Planning scenes (variations: %s)...", num_variations)
+                if num_variations > 1:
+                    # Multi-variation flow: Generate N scene plan variations. _plan_scenes
+                    # still runs for the shared style spec and metadata every variation
+                    # copies from ad_campaign (modified in place). The two plans run side
+                    # by side: the variations planner reads its own copy of ad_campaign
+                    # and is the only one reporting the step, so neither the result nor
+                    # the status depends on which finishes first.
+                    logger.info("Generating %s scene plan variations...", num_variations)
+                    scene_variations, _ = await asyncio.gather(
+                        self._plan_scenes_variations(
+                            campaign, product, brand, ad_campaign.model_copy(deep=True), num_variations,
+                            progress_start=planning_start
+                        ),
+                        self._plan_scenes(
+                            campaign, product, brand, ad_campaign, progress_start=planning_start, report_status=False
+                        ),
+                    )
+                    return scene_variations
                 # Single variation flow (existing behavior)
                 # _plan_scenes modifies ad_campaign in place, so we don't need to recreate it
                 await self._plan_scenes(campaign, product, brand, ad_campaign, progress_start=planning_start)
-                scene_variations = [ad_campaign.scenes]
+                return [ad_campaign.scenes]
+
+            _, product_url, scene_variations = await asyncio.gather(
+                init_local_storage(), extract_product(), plan_scenes()
+            )
 
             # STEP 3-7: Process all variations IN PARALLEL
-            logger.info(f"Processing {num_variations} variations in parallel...")
-            variation_tasks = [
-                self._process_variation(
-                    scenes=scenes,
-                    var_idx=var_idx,
-                    num_variations=num_variations,
-                    campaign=campaign,
-                    product=product,
-                    brand=brand,
-                    ad_campaign=ad_campaign,
-                    product_url=product_url,
-                    has_product=has_product,
-                    progress_start=planning_start + 5,
-                )
-                for var_idx, scenes in enumerate(scene_variations)
-            ]
-            final_videos = await asyncio.gather(*variation_tasks, return_exceptions=True)
+            logger.info("Processing %s variations in parallel...", num_variations)
+            # Bounded so N variations don't hit the rate-limited video, LLM
+            # and S3 APIs all at once
+            variation_slots = asyncio.Semaphore(max(1, settings.max_parallel_variations))
+
+            async def run_variation(var_idx: int, scenes: List[Any]) -> str:
+                async with variation_slots:
+                    return await self._process_variation(
+                        scenes=scenes,
+                        var_idx=var_idx,
+                        num_variations=num_variations,
+                        campaign=campaign,
+                        product=product,
+                        brand=brand,
+                        ad_campaign=ad_campaign,
+                        product_url=product_url,
+                        has_product=has_product,
+                        progress_start=planning_start + 5,
+                    )
+
+            final_videos = await asyncio.gather(
+                *(run_variation(var_idx, scenes) for var_idx, scenes in enumerate(scene_variations)),
+                return_exceptions=True
+            )
             
             # Separate successful variations from errors
             successful_videos = []
@@ -343,10 +497,10 @@ class GenerationPipeline:
             for var_idx, result in enumerate(final_videos):
                 if isinstance(result, Exception):
                     failed_variations.append((var_idx, result))
-                    logger.error(f"Variation {var_idx + 1} failed: {result}")
+                    logger.error("Variation %s failed: %s", var_idx + 1, result)
                 else:
                     successful_videos.append(result)
-                    logger.info(f"Variation {var_idx + 1} succeeded: {result}")
+                    logger.info("Variation %s succeeded: %s", var_idx + 1, result)
             
             # If all variations failed, raise error
             if len(successful_videos) == 0:
@@ -358,8 +512,9 @@ class GenerationPipeline:
             if failed_variations:
                 failed_indices = [idx + 1 for idx, _ in failed_variations]
                 logger.warning(
-                    f"⚠️ {len(failed_variations)} variation(s) failed (indices: {failed_indices}), "
-                    f"but {len(successful_videos)} variation(s) succeeded. Continuing with successful variations."
+                    "⚠️ %s variation(s) failed (indices: %s), but %s variation(s) succeeded. "
+                    "Continuing with successful variations.",
+                    len(failed_variations), failed_indices, len(successful_videos)
                 )
             
             # Update campaign with successful variation info (S3 URLs)
@@ -367,7 +522,12 @@ class GenerationPipeline:
             await self._update_campaign_variations(actual_num_variations, successful_videos)
             
             total_elapsed = time.time() - pipeline_start
-            logger.info(f"Pipeline complete in {total_elapsed:.1f}s ({actual_num_variations}/{num_variations} variations succeeded)")
+            logger.info("Pipeline complete in %.1fs (%s/%s variations succeeded)", total_elapsed, actual_num_variations, num_variations)
+            
+            # Walks the campaign directory, so it is measured once, off the loop
+            storage_size = await asyncio.to_thread(
+                LocalStorageManager.get_campaign_storage_size, self.campaign_id
+            )
             
             # Build message indicating partial success if applicable
             if failed_variations:
@@ -380,8 +540,8 @@ class GenerationPipeline:
                 "storage_size": storage_size,
                 "storage_size_formatted": format_storage_size(storage_size),
                 "message": "Videos ready for preview. Videos stored in S3.",
-                "total_cost": float(self.total_cost),
-                "cost_breakdown": {k: float(v) for k, v in self.step_costs.items()},
+                "total_cost": round(self.total_cost, 2),
+                "cost_breakdown": {k: round(v, 2) for k, v in self.step_costs.items()},
                 "campaign_id": str(self.campaign_id),
                 "video_urls": successful_videos,  # S3 URLs
                 "num_variations": actual_num_variations,
@@ -394,7 +554,7 @@ class GenerationPipeline:
 
         except Exception as e:
             total_elapsed = time.time() - pipeline_start
-            logger.error(f"Pipeline failed after {total_elapsed:.1f}s: {e}", exc_info=True)
+            logger.error("Pipeline failed after %.1fs: %s", total_elapsed, e, exc_info=True)
 
             # Handle background music task (cancel if running, retrieve exception if failed)
             if music_task is not None:
@@ -403,7 +563,7 @@ class GenerationPipeline:
                     try:
                         await music_task  # This will raise if task failed
                     except Exception as task_error:
-                        logger.warning(f"Music task had exception: {task_error}")
+                        logger.warning("Music task had exception: %s", task_error)
                 else:
                     # Task still running - cancel it
                     logger.info("Cancelling background music generation task...")
@@ -413,7 +573,7 @@ class GenerationPipeline:
                     except asyncio.CancelledError:
                         logger.info("Music task cancelled successfully")
                     except Exception as cancel_error:
-                        logger.warning(f"Error cancelling music task: {cancel_error}")
+                        logger.warning("Error cancelling music task: %s", cancel_error)
 
             # Cleanup partial files
             try:
@@ -421,7 +581,7 @@ class GenerationPipeline:
                 LocalStorageManager.cleanup_campaign_storage(self.campaign_id)
                 logger.info("Cleanup completed")
             except Exception as cleanup_error:
-                logger.warning(f"Failed to cleanup storage: {cleanup_error}")
+                logger.warning("Failed to cleanup storage: %s", cleanup_error)
 
             # Mark as failed (creative or campaign based on mode)
             error_msg = str(e)[:500]
@@ -462,27 +622,22 @@ class GenerationPipeline:
             import tempfile
             from pathlib import Path
             
-            s3_urls = []
-            
             # Create a temp session for downloads
-            from app.config import settings
             from app.utils.s3_utils import parse_s3_url, get_s3_client
             
             # Initialize S3 client for authenticated downloads
             s3_client = get_s3_client()
-            
-            async with aiohttp.ClientSession() as session:
-                for i, url in enumerate(video_urls):
-                    # Check if it's already an S3 URL - if so, skip re-uploading
-                    is_s3_url = (
-                        url.startswith("https://") and 
-                        ("s3." in url or "s3.amazonaws.com" in url or settings.s3_bucket_name in url)
-                    )
-                    if is_s3_url:
-                        logger.info(f"Scene {i+1} video already in S3, skipping re-upload: {url[:80]}...")
-                        s3_urls.append(url)
-                        continue
-                    
+            semaphore = asyncio.Semaphore(SCENE_TRANSFER_CONCURRENCY)
+            s3_url_re = _s3_url_re(settings.s3_bucket_name)
+            
+            async def transfer_one(session: aiohttp.ClientSession, i: int, url: str) -> str:
+                # Check if it's already an S3 URL - if so, skip re-uploading
+                is_s3_url = s3_url_re.match(url) is not None
+                if is_s3_url:
+                    logger.info("Scene %s video already in S3, skipping re-upload: %s...", i+1, url[:80])
+                    return url
+                
+                async with semaphore:
                     # Create temp file
                     with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
                         temp_path = tmp.name
@@ -492,26 +647,27 @@ class GenerationPipeline:
                         if url.startswith("http"):
                             # Check if it's an S3 URL that needs authentication
                             if ".s3." in url or "s3.amazonaws.com" in url:
-                                # Use boto3 for authenticated S3 download
+                                # Use boto3 for authenticated S3 download (on a worker thread)
                                 try:
                                     bucket_name, s3_key = parse_s3_url(url)
-                                    s3_client.download_file(bucket_name, s3_key, temp_path)
-                                    logger.info(f"✅ Downloaded from S3 using boto3: {s3_key}")
+                                    await asyncio.to_thread(
+                                        s3_client.download_file, bucket_name, s3_key, temp_path,
+                                        Config=S3_TRANSFER_CONFIG
+                                    )
+                                    logger.info("✅ Downloaded from S3 using boto3: %s", s3_key)
                                 except Exception as e:
-                                    logger.error(f"Failed to download from S3 with boto3: {e}")
+                                    logger.error("Failed to download from S3 with boto3: %s", e)
                                     raise ValueError(f"Failed to download video {i+1} from S3: {str(e)}")
                             else:
                                 # Use HTTP for non-S3 URLs (e.g., Replicate URLs)
                                 async with session.get(url, timeout=aiohttp.ClientTimeout(total=120)) as resp:
                                     if resp.status != 200:
                                         raise ValueError(f"Failed to download video {i+1}: HTTP {resp.status}")
-                                    content = await resp.read()
-                                    with open(temp_path, "wb") as f:
-                                        f.write(content)
+                                    await stream_response_to_file(resp, temp_path)
                         else:
                             # It's a local path
                             import shutil
-                            shutil.copy2(url, temp_path)
+                            await asyncio.to_thread(shutil.copy2, url, temp_path)
                             
                         # Upload to S3
                         result = await upload_draft_video(
@@ -522,14 +678,20 @@ class GenerationPipeline:
                             scene_index=i+1,  # 1-based index
                             file_path=temp_path
                         )
-                        s3_urls.append(result["url"])
+                        return result["url"]
                         
                     finally:
                         # Cleanup temp file
                         if os.path.exists(temp_path):
                             os.unlink(temp_path)
             
-            logger.info(f"Uploaded {len(s3_urls)} scenes to S3 for variation {variation_index}")
+            # Scenes transfer concurrently; gather keeps them in scene order
+            async with aiohttp.ClientSession() as session:
+                s3_urls = list(await asyncio.gather(
+                    *(transfer_one(session, i, url) for i, url in enumerate(video_urls))
+                ))
+            
+            logger.info("Uploaded %s scenes to S3 for variation %s", len(s3_urls), variation_index)
             return s3_urls
             
             product_url = await extractor.extract_product(
@@ -537,25 +699,37 @@ class GenerationPipeline:
                 campaign_id=str(self.campaign_id),
             )
 
-            logger.info(f"✅ Product extracted: {product_url}")
+            logger.info("✅ Product extracted: %s", product_url)
             return product_url
 
         except Exception as e:
-            logger.error(f"Failed to upload scenes to S3: {e}")
+            logger.error("Failed to upload scenes to S3: %s", e)
             raise
 
     @timed_step("Scene Planning")
-    async def _plan_scenes(self, campaign: Any, product: Any, brand: Any, ad_campaign: AdCampaign, progress_start: int = 15) -> Dict[str, Any]:
-        """Plan product scenes using LLM with shot grammar constraints."""
+    async def _plan_scenes(
+        self,
+        campaign: Any,
+        product: Any,
+        brand: Any,
+        ad_campaign: AdCampaign,
+        progress_start: int = 15,
+        report_status: bool = True,
+    ) -> Dict[str, Any]:
+        """Plan product scenes using LLM with shot grammar constraints.
+
+        report_status=False skips the "Planning Scenes" status write, for when
+        another planner running alongside reports the step.
+        """
         try:
-            self._update_status(status="processing", progress=progress_start, current_step="Planning Scenes")
+            if report_status:
+                self._update_status(status="processing", progress=progress_start, current_step="Planning Scenes")
 
-            from app.config import settings
             planner = ScenePlanner(api_key=settings.openai_api_key)
             
             # Extract product-specific info from product table
             product_name = product.name
-            logger.info(f"Using product name: {product_name}")
+            logger.info("Using product name: %s", product_name)
             
             # Brand colors from brand guidelines (extracted from brand table)
             brand_colors = []
@@ -568,29 +742,17 @@ class GenerationPipeline:
             extracted_guidelines = None
             guidelines_url = brand.guidelines  # Text field containing guidelines URL or content
             if guidelines_url:
-                logger.info("Extracting brand guidelines from document...")
+                logger.info("Loading brand guidelines...")
                 try:
-                    from app.services.brand_guidelines_extractor import BrandGuidelineExtractor
-                    from openai import AsyncOpenAI
-                    
-                    openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
-                    extractor = BrandGuidelineExtractor(
-                        openai_client=openai_client,
-                        aws_access_key_id=settings.aws_access_key_id,
-                        aws_secret_access_key=settings.aws_secret_access_key,
-                        s3_bucket_name=settings.s3_bucket_name,
-                        aws_region=settings.aws_region,
-                    )
-                    
-                    extracted_guidelines = await extractor.extract_guidelines(
-                        guidelines_url=guidelines_url,
+                    extracted_guidelines = await self._load_brand_guidelines(
+                        brand,
                         brand_name=ad_campaign.brand.get('name', '') if isinstance(ad_campaign.brand, dict) else ''
                     )
                     
                     if extracted_guidelines:
                         logger.info(
-                            f"Extracted guidelines: {len(extracted_guidelines.color_palette)} colors, "
-                            f"tone='{extracted_guidelines.tone_of_voice}'"
+                            "Extracted guidelines: %s colors, tone='%s'",
+                            len(extracted_guidelines.color_palette), extracted_guidelines.tone_of_voice
                         )
                         if ad_campaign.video_metadata is None:
                             ad_campaign.video_metadata = {}
@@ -599,7 +761,7 @@ class GenerationPipeline:
                         logger.warning("Guidelines extraction returned None, continuing without")
                     
                 except Exception as e:
-                    logger.error(f"Guidelines extraction failed: {e}")
+                    logger.error("Guidelines extraction failed: %s", e)
                     logger.warning("Continuing pipeline without brand guidelines")
                     extracted_guidelines = None
             else:
@@ -608,8 +770,8 @@ class GenerationPipeline:
             # Merge colors from guidelines into brand_colors
             if extracted_guidelines and extracted_guidelines.color_palette:
                 brand_colors.extend(extracted_guidelines.color_palette)
-                brand_colors = list(set(brand_colors))
-                logger.info(f"Merged brand colors from guidelines: {brand_colors}")
+                brand_colors = list(dict.fromkeys(brand_colors))
+                logger.info("Merged brand colors from guidelines: %s", brand_colors)
             
             # Build creative prompt from user's creative_vision input stored in scene_configs
             # The frontend stores the user's creative prompt in scene_configs[].creative_vision
@@ -642,7 +804,7 @@ INSTRUCTIONS FOR SCENE PLANNING:
                 # Fallback to generic prompt if no creative_vision provided
                 creative_prompt = f"Create a compelling {campaign.seasonal_event} campaign video for {product_name}. Campaign: {campaign.name}. Target duration: {campaign.duration} seconds."
 
-            logger.info(f"📝 Creative prompt built from user input: {len(user_creative_vision)} chars of creative vision")
+            logger.info("📝 Creative prompt built from user input: %s chars of creative vision", len(user_creative_vision))
 
             # Add brand guidelines context to creative prompt
             if extracted_guidelines:
@@ -699,10 +861,10 @@ BRAND GUIDELINES (extracted from guidelines document):
             plan_scenes_list = plan.get('scenes', [])
             plan_style_spec = plan.get('style_spec', {})
             
-            logger.info(f"ScenePlanner chose style: {chosen_style} ({style_source})")
+            logger.info("ScenePlanner chose style: %s (%s)", chosen_style, style_source)
             
             # PHASE 8: Validate grammar compliance
-            from app.services.product_grammar_loader import ProductGrammarLoader
+            from app.services.product_grammar_loader import get_grammar_loader
             from app.product_config.product_types import get_product_type_config
             from pathlib import Path
 
@@ -710,50 +872,17 @@ BRAND GUIDELINES (extracted from guidelines document):
             product_config = get_product_type_config(product.product_type)
             base_dir = Path(__file__).parent.parent
             grammar_path = base_dir / "templates" / "scene_grammar" / product_config.shot_grammar_file
-            grammar_loader = ProductGrammarLoader(str(grammar_path))
+            grammar_loader = get_grammar_loader(str(grammar_path))
 
             is_valid, violations = grammar_loader.validate_scene_plan(plan_scenes_list)
             
             if not is_valid:
-                logger.warning(f"⚠️ Grammar violations detected: {violations}")
+                logger.warning("⚠️ Grammar violations detected: %s", violations)
 
             # Update ad_campaign with scenes and style spec from plan
             # Convert plan scenes to AdCampaign scenes format
-            from app.models.schemas import Overlay, Scene as AdCampaignScene
             ad_campaign.scenes = [
-                AdCampaignScene(
-                    id=str(scene.get('scene_id', i)),
-                    role=scene.get('role', 'showcase'),
-                    duration=scene.get('duration', 5),
-                    description=scene.get('background_prompt', ''),
-                    background_prompt=scene.get('background_prompt', ''),
-                    background_type=scene.get('background_type', 'cinematic'),
-                    style=scene.get('style', chosen_style),
-                    
-                    use_product=scene.get('use_product', False),
-                    product_usage=scene.get('product_usage', 'static_insert'),
-                    product_position=scene.get('product_position', 'center'),
-                    product_scale=scene.get('product_scale', 0.3),
-                    product_opacity=scene.get('product_opacity', 1.0),
-                    
-                    use_logo=scene.get('use_logo', False),
-                    logo_position=scene.get('logo_position', 'top_right'),
-                    logo_scale=scene.get('logo_scale', 0.1),
-                    logo_opacity=scene.get('logo_opacity', 0.9),
-                    
-                    camera_movement=scene.get('camera_movement', 'static'),
-                    transition_to_next=scene.get('transition_to_next', 'cut'),
-                    safe_zone=scene.get('safe_zone'),
-                    overlay_preference=scene.get('overlay_preference'),
-                    
-                    # Text overlay
-                    overlay=Overlay(
-                        text=scene.get('overlay', {}).get('text', ''),
-                        position=scene.get('overlay', {}).get('position', 'bottom'),
-                        font_size=scene.get('overlay', {}).get('font_size', 48),
-                        duration=scene.get('overlay', {}).get('duration', 2.0),
-                    ) if scene.get('overlay') else None,
-                )
+                _scene_from_plan(i, scene, chosen_style)
                 for i, scene in enumerate(plan_scenes_list)
             ]
             
@@ -786,7 +915,7 @@ BRAND GUIDELINES (extracted from guidelines document):
             }
             if 'derivedTone' in plan:
                 ad_campaign.video_metadata['derivedTone'] = plan['derivedTone']
-                logger.info(f"Stored derived tone in metadata: {plan['derivedTone']}")
+                logger.info("Stored derived tone in metadata: %s", plan['derivedTone'])
             
             # Store results in campaign_json (build from scene_configs since campaign_json doesn't exist in model)
             campaign_json = {}
@@ -814,7 +943,7 @@ BRAND GUIDELINES (extracted from guidelines document):
                 else ad_campaign.audio_settings
             )
 
-            logger.info(f"✅ Built campaign_json for scene planning")
+            logger.info("✅ Built campaign_json for scene planning")
 
             # PHASE 7: Store chosen style in ad_campaign_json
             if not ad_campaign.video_metadata:
@@ -825,18 +954,21 @@ BRAND GUIDELINES (extracted from guidelines document):
                 'appliedAt': datetime.utcnow().isoformat()
             }
 
-            # Save back to database
-            update_campaign_json(
+            # Save back to database. Blocking DB calls inside run() go through
+            # to_thread so concurrent tasks keep running; each is awaited before
+            # the next, so self.db is never used from two threads at once.
+            await asyncio.to_thread(
+                update_campaign_json,
                 self.db,
                 self.campaign_id,
                 ad_campaign_json=campaign_json
             )
 
-            logger.info(f"Planned {len(ad_campaign.scenes)} scenes with style spec")
+            logger.info("Planned %s scenes with style spec", len(ad_campaign.scenes))
             return campaign_json
 
         except Exception as e:
-            logger.error(f"Scene planning failed: {e}")
+            logger.error("Scene planning failed: %s", e)
             raise
 
     @timed_step("Video Generation")
@@ -854,12 +986,10 @@ BRAND GUIDELINES (extracted from guidelines document):
         try:
             self._update_status(status="processing", progress=progress_start, current_step="Generating Video Scenes")
 
-            from app.config import settings
-
             # STORY 4.4: Get provider from campaign (defaults to "replicate")
             # Validate provider parameter
             if self.video_provider not in ["replicate", "ecs"]:
-                logger.warning(f"Invalid provider '{self.video_provider}', defaulting to 'replicate'")
+                logger.warning("Invalid provider '%s', defaulting to 'replicate'", self.video_provider)
                 self.video_provider = "replicate"
 
             # Check if ECS selected but not configured
@@ -867,7 +997,7 @@ BRAND GUIDELINES (extracted from guidelines document):
                 logger.warning("ECS provider requested but not configured, falling back to Replicate")
                 self.video_provider = "replicate"
 
-            logger.info(f"🎬 Campaign {self.campaign_id}: Using video provider: {self.video_provider}")
+            logger.info("🎬 Campaign %s: Using video provider: %s", self.campaign_id, self.video_provider)
             video_provider = self.video_provider
 
             # Initialize VideoGenerator with provider
@@ -887,19 +1017,19 @@ BRAND GUIDELINES (extracted from guidelines document):
 
             # PHASE 7: Get the chosen style for all scenes (skip - using default styles)
             chosen_style = None
-            logger.info(f"PHASE 7: Using default style generation (ad_campaign_json not available in Campaign model)")
+            logger.info("PHASE 7: Using default style generation (ad_campaign_json not available in Campaign model)")
 
             # Get the chosen style for all scenes (from campaign)
             chosen_style = None  # Campaign model doesn't have selected_style field
-            logger.info(f"Using chosen style for ALL scenes: {chosen_style}")
+            logger.info("Using chosen style for ALL scenes: %s", chosen_style)
             
             # Generate TikTok vertical videos (9:16 hardcoded)
             logger.info("Generating TikTok vertical videos (9:16)")
 
             # LOG: Show scene scripts that will be sent to video generator
-            logger.info(f"📝 Scene scripts to send to video generator ({len(ad_campaign.scenes)} scenes):")
+            logger.info("📝 Scene scripts to send to video generator (%s scenes):", len(ad_campaign.scenes))
             for i, scene in enumerate(ad_campaign.scenes):
-                logger.info(f"   Scene {i+1} script: {scene.background_prompt}")
+                logger.info("   Scene %s script: %s", i+1, scene.background_prompt)
             
             tasks = []
             for i, scene in enumerate(ad_campaign.scenes):
@@ -913,7 +1043,7 @@ BRAND GUIDELINES (extracted from guidelines document):
                     )
                     tasks.append(task)
                 except Exception as e:
-                    logger.error(f"Failed to create task for scene {i} (role: {scene.role}): {e}")
+                    logger.error("Failed to create task for scene %s (role: %s): %s", i, scene.role, e)
                     raise
 
             scene_videos = await asyncio.gather(*tasks, return_exceptions=True)
@@ -923,19 +1053,20 @@ BRAND GUIDELINES (extracted from guidelines document):
                 if isinstance(result, Exception):
                     scene = ad_campaign.scenes[i]
                     logger.error(
-                        f"Scene {i} generation failed:\n"
-                        f"   Role: {scene.role}\n"
-                        f"   Prompt: {scene.background_prompt[:100]}...\n"
-                        f"   Duration: {scene.duration}s\n"
-                        f"   Error: {result}"
+                        "Scene %s generation failed:\n"
+                        "   Role: %s\n"
+                        "   Prompt: %s...\n"
+                        "   Duration: %ss\n"
+                        "   Error: %s",
+                        i, scene.role, scene.background_prompt[:100], scene.duration, result
                     )
                     raise RuntimeError(f"Scene {i} ({scene.role}) generation failed: {result}")
 
-            logger.info(f"Generated {len(scene_videos)} videos")
+            logger.info("Generated %s videos", len(scene_videos))
             return scene_videos
 
         except Exception as e:
-            logger.error(f"Video generation failed: {e}")
+            logger.error("Video generation failed: %s", e)
             raise
 
     # REMOVED: _composite_products() - Veo S3 integrates product naturally (no manual overlay needed)
@@ -949,7 +1080,6 @@ BRAND GUIDELINES (extracted from guidelines document):
         try:
             self._update_status(status="processing", progress=progress_start, current_step="Generating Background Music")
 
-            from app.config import settings
             audio_engine = AudioEngine(
                 replicate_api_token=settings.replicate_api_token,
                 aws_access_key_id=settings.aws_access_key_id,
@@ -972,11 +1102,11 @@ BRAND GUIDELINES (extracted from guidelines document):
                 campaign_id=str(self.campaign_id),
             )
 
-            logger.info(f"Generated product audio: {audio_url}")
+            logger.info("Generated product audio: %s", audio_url)
             return audio_url
 
         except Exception as e:
-            logger.error(f"Audio generation failed: {e}")
+            logger.error("Audio generation failed: %s", e)
             raise
 
     # REMOVED: _infer_product_gender - product gender now comes directly from product table
@@ -1004,13 +1134,13 @@ BRAND GUIDELINES (extracted from guidelines document):
         deviation = abs(total_duration - target_duration) / target_duration if target_duration > 0 else 0
         
         if deviation <= tolerance:
-            logger.info(f"Duration within tolerance: {total_duration}s vs {target_duration}s target ({deviation*100:.1f}% deviation)")
+            logger.info("Duration within tolerance: %ss vs %ss target (%.1f%% deviation)", total_duration, target_duration, deviation*100)
             return scenes
         
         # Normalize durations proportionally
         scale_factor = target_duration / total_duration if total_duration > 0 else 1.0
-        logger.warning(f"Duration outside tolerance: {total_duration}s vs {target_duration}s target ({deviation*100:.1f}% deviation)")
-        logger.info(f"Normalizing with scale factor: {scale_factor:.3f}")
+        logger.warning("Duration outside tolerance: %ss vs %ss target (%.1f%% deviation)", total_duration, target_duration, deviation*100)
+        logger.info("Normalizing with scale factor: %.3f", scale_factor)
         
         normalized_scenes = []
         for scene in scenes:
@@ -1020,10 +1150,10 @@ BRAND GUIDELINES (extracted from guidelines document):
             scene_dict['duration'] = new_duration
             
             normalized_scenes.append(Scene(**scene_dict))
-            logger.debug(f"Scene {scene.id} ({scene.role}): {scene.duration}s → {new_duration}s")
+            logger.debug("Scene %s (%s): %ss → %ss", scene.id, scene.role, scene.duration, new_duration)
         
         new_total = sum(s.duration for s in normalized_scenes)
-        logger.info(f"Normalized duration: {new_total}s (target: {target_duration}s, {abs(new_total-target_duration)}s diff)")
+        logger.info("Normalized duration: %ss (target: %ss, %ss diff)", new_total, target_duration, abs(new_total-target_duration))
         
         return normalized_scenes
 
@@ -1054,7 +1184,7 @@ BRAND GUIDELINES (extracted from guidelines document):
         elif any(word in tone_lower for word in ['modern', 'tech', 'innovative', 'futuristic']):
             return 'electronic'
         else:
-            logger.info(f"No tone mapping found for '{tone}', using default mood: {default_mood}")
+            logger.info("No tone mapping found for '%s', using default mood: %s", tone, default_mood)
             return default_mood
 
     @timed_step("Final Rendering")
@@ -1070,7 +1200,6 @@ BRAND GUIDELINES (extracted from guidelines document):
         try:
             self._update_status(status="processing", progress=progress_start, current_step="Rendering Final Video")
 
-            from app.config import settings
             renderer = Renderer(
                 aws_access_key_id=settings.aws_access_key_id,
                 aws_secret_access_key=settings.aws_secret_access_key,
@@ -1090,11 +1219,11 @@ BRAND GUIDELINES (extracted from guidelines document):
 
             self._update_status(status="processing", progress=100, current_step="Finalizing")
 
-            logger.info(f"✅ Rendered final TikTok vertical video: {final_video}")
+            logger.info("✅ Rendered final TikTok vertical video: %s", final_video)
             return final_video
 
         except Exception as e:
-            logger.error(f"Final rendering failed: {e}")
+            logger.error("Final rendering failed: %s", e)
             raise
     
     async def _cleanup_intermediate_files(self, campaign_id: str) -> None:
@@ -1118,8 +1247,6 @@ BRAND GUIDELINES (extracted from guidelines document):
         This reduces S3 storage from ~950MB to ~150MB per campaign.
         """
         try:
-            from app.config import settings
-            
             s3_client = boto3.client(
                 "s3",
                 aws_access_key_id=settings.aws_access_key_id,
@@ -1152,12 +1279,12 @@ BRAND GUIDELINES (extracted from guidelines document):
                         Key=key
                     )
                     deleted_count += 1
-                    logger.debug(f"Deleted intermediate: {filename}")
+                    logger.debug("Deleted intermediate: %s", filename)
             
-            logger.info(f"Cleaned up {deleted_count} intermediate files from S3")
+            logger.info("Cleaned up %s intermediate files from S3", deleted_count)
             
         except Exception as e:
-            logger.warning(f"Failed to cleanup intermediate files: {e}")
+            logger.warning("Failed to cleanup intermediate files: %s", e)
 
     async def _save_final_video_locally(
         self, s3_video_url: str
@@ -1176,7 +1303,7 @@ BRAND GUIDELINES (extracted from guidelines document):
             
             logger.info("Downloading TikTok vertical (9:16) video from S3...")
             
-            response = requests.get(s3_video_url, timeout=300)
+            response = requests.get(s3_video_url, timeout=300, stream=True)
             response.raise_for_status()
             
             local_path = LocalStorageManager.save_final_video(
@@ -1188,15 +1315,16 @@ BRAND GUIDELINES (extracted from guidelines document):
             os.makedirs(os.path.dirname(local_path), exist_ok=True)
             
             with open(local_path, 'wb') as f:
-                f.write(response.content)
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
             
             file_size = os.path.getsize(local_path)
-            logger.info(f"Saved TikTok vertical (9:16) ({file_size / 1024 / 1024:.1f} MB) to {local_path}")
+            logger.info("Saved TikTok vertical (9:16) (%.1f MB) to %s", file_size / 1024 / 1024, local_path)
             
             return local_path
             
         except Exception as e:
-            logger.error(f"Failed to save TikTok vertical video locally: {e}")
+            logger.error("Failed to save TikTok vertical video locally: %s", e)
             raise
 
     async def _plan_scenes_variations(
@@ -1225,7 +1353,6 @@ BRAND GUIDELINES (extracted from guidelines document):
         try:
             self._update_status(status="processing", progress=progress_start, current_step="Planning Scene Variations")
 
-            from app.config import settings
             planner = ScenePlanner(api_key=settings.openai_api_key)
             
             # Extract product-specific info from product table
@@ -1243,30 +1370,18 @@ BRAND GUIDELINES (extracted from guidelines document):
             guidelines_url = brand.guidelines  # Text field containing guidelines URL or content
             if guidelines_url:
                 try:
-                    from app.services.brand_guidelines_extractor import BrandGuidelineExtractor
-                    from openai import AsyncOpenAI
-                    
-                    openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
-                    extractor = BrandGuidelineExtractor(
-                        openai_client=openai_client,
-                        aws_access_key_id=settings.aws_access_key_id,
-                        aws_secret_access_key=settings.aws_secret_access_key,
-                        s3_bucket_name=settings.s3_bucket_name,
-                        aws_region=settings.aws_region,
-                    )
-                    
-                    extracted_guidelines = await extractor.extract_guidelines(
-                        guidelines_url=guidelines_url,
+                    extracted_guidelines = await self._load_brand_guidelines(
+                        brand,
                         brand_name=ad_campaign.brand.get('name', '') if isinstance(ad_campaign.brand, dict) else ''
                     )
                 except Exception as e:
-                    logger.warning(f"Guidelines extraction failed: {e}")
+                    logger.warning("Guidelines extraction failed: %s", e)
                     extracted_guidelines = None
             
             # Merge colors from guidelines
             if extracted_guidelines and extracted_guidelines.color_palette:
                 brand_colors.extend(extracted_guidelines.color_palette)
-                brand_colors = list(set(brand_colors))
+                brand_colors = list(dict.fromkeys(brand_colors))
             
             # Build creative prompt (reference image removed in Phase 2)
             # Campaign model doesn't have creative_prompt field - generate from campaign data
@@ -1308,11 +1423,11 @@ BRAND GUIDELINES (extracted from guidelines document):
                 product_type=product.product_type,
             )
             
-            logger.info(f"Generated {len(scene_variations)} scene plan variations")
+            logger.info("Generated %s scene plan variations", len(scene_variations))
             return scene_variations
             
         except Exception as e:
-            logger.error(f"Failed to plan scene variations: {e}")
+            logger.error("Failed to plan scene variations: %s", e)
             raise
 
     async def _process_variation(
@@ -1353,7 +1468,7 @@ BRAND GUIDELINES (extracted from guidelines document):
         Returns:
             Final video path for this variation
         """
-        logger.info(f"Processing variation {var_idx + 1}/{num_variations}...")
+        logger.info("Processing variation %s/%s...", var_idx + 1, num_variations)
         
         try:
             # Convert scene dictionaries to AdCampaignScene objects
@@ -1406,7 +1521,7 @@ BRAND GUIDELINES (extracted from guidelines document):
                     )
                 else:
                     # Unknown type, try to convert using getattr
-                    logger.warning(f"Unknown scene type: {type(scene_item)}, attempting attribute access")
+                    logger.warning("Unknown scene type: %s, attempting attribute access", type(scene_item))
                     ad_campaign_scenes.append(
                         AdCampaignScene(
                             id=str(getattr(scene_item, 'scene_id', getattr(scene_item, 'id', i))),
@@ -1499,11 +1614,11 @@ BRAND GUIDELINES (extracted from guidelines document):
             )
             final_video_url = final_result["url"]
             
-            logger.info(f"Variation {var_idx + 1} complete: {final_video_url}")
+            logger.info("Variation %s complete: %s", var_idx + 1, final_video_url)
             return final_video_url
             
         except Exception as e:
-            logger.error(f"Failed to process variation {var_idx + 1}: {e}")
+            logger.error("Failed to process variation %s: %s", var_idx + 1, e)
             raise
 
     async def _save_final_video_locally(
@@ -1522,10 +1637,10 @@ BRAND GUIDELINES (extracted from guidelines document):
             import requests
             import os
             
-            logger.info(f"⬇️ Downloading {aspect_ratio} video from S3...")
+            logger.info("⬇️ Downloading %s video from S3...", aspect_ratio)
             
             # Download from S3 URL
-            response = requests.get(s3_video_url, timeout=300)
+            response = requests.get(s3_video_url, timeout=300, stream=True)
             response.raise_for_status()
             
             # Save to local storage
@@ -1540,15 +1655,16 @@ BRAND GUIDELINES (extracted from guidelines document):
             
             # Write video bytes to local file
             with open(local_path, 'wb') as f:
-                f.write(response.content)
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
             
             file_size = os.path.getsize(local_path)
-            logger.info(f"✅ Saved {aspect_ratio} ({file_size / 1024 / 1024:.1f} MB) to {local_path}")
+            logger.info("✅ Saved %s (%.1f MB) to %s", aspect_ratio, file_size / 1024 / 1024, local_path)
             
             return local_path
             
         except Exception as e:
-            logger.error(f"❌ Failed to save {aspect_ratio} video locally: {e}")
+            logger.error("❌ Failed to save %s video locally: %s", aspect_ratio, e)
             raise
 
     def _build_ad_campaign_from_campaign(
@@ -1725,22 +1841,19 @@ BRAND GUIDELINES (extracted from guidelines document):
             final_videos: List of final video S3 URLs
         """
         try:
-            campaign = get_campaign_by_id(self.db, self.campaign_id)
+            campaign = await asyncio.to_thread(get_campaign_by_id, self.db, self.campaign_id)
             if not campaign:
                 raise ValueError(f"Campaign {self.campaign_id} not found")
             
             # Update campaign_json (build from scene_configs since campaign_json doesn't exist in model)
+            # scene_configs is JSONB, so the driver has already decoded it
             campaign_json = {}
-            if campaign.scene_configs:
-                if isinstance(campaign.scene_configs, str):
-                    import json
-                    campaign_json = json.loads(campaign.scene_configs)
-                elif isinstance(campaign.scene_configs, dict):
-                    campaign_json = campaign.scene_configs.copy()
-            logger.info(f"✅ Built campaign_json from scene_configs")
+            if type(campaign.scene_configs) is dict:
+                campaign_json = campaign.scene_configs.copy()
+            logger.info("✅ Built campaign_json from scene_configs")
             
-            logger.info(f"🔍 Current campaign_json before update: {campaign_json}")
-            logger.info(f"🔍 Final videos to store: {final_videos}")
+            logger.info("🔍 Current campaign_json before update: %s", campaign_json)
+            logger.info("🔍 Final videos to store: %s", final_videos)
             
             # Store S3 URLs in variationPaths with correct structure for API
             # Format: {"variation_0": {"aspectExports": {"9:16": "url"}}, ...}
@@ -1754,7 +1867,7 @@ BRAND GUIDELINES (extracted from guidelines document):
             
             campaign_json["variationPaths"] = variation_paths
             
-            logger.info(f"🔍 Updated campaign_json with variationPaths: {campaign_json}")
+            logger.info("🔍 Updated campaign_json with variationPaths: %s", campaign_json)
             
             # Clean up legacy local path fields to ensure S3 usage
             if "local_video_paths" in campaign_json:
@@ -1763,26 +1876,29 @@ BRAND GUIDELINES (extracted from guidelines document):
                 del campaign_json["local_video_path"]
             
             # Save campaign_json with variationPaths to database
-            update_campaign_json(
+            await asyncio.to_thread(
+                update_campaign_json,
                 self.db,
                 self.campaign_id,
                 ad_campaign_json=campaign_json
             )
-            logger.info(f"✅ Persisted campaign_json with variationPaths to database")
+            logger.info("✅ Persisted campaign_json with variationPaths to database")
 
             # Update creative status to completed
-            self._update_status(status="completed", progress=100, current_step="Completed")
+            await asyncio.to_thread(
+                self._update_status, status="completed", progress=100, current_step="Completed"
+            )
 
             # Verify the update was successful
-            updated_campaign = get_campaign_by_id(self.db, self.campaign_id)
+            updated_campaign = await asyncio.to_thread(get_campaign_by_id, self.db, self.campaign_id)
             if updated_campaign:
-                logger.info(f"✅ Campaign {self.campaign_id} marked as completed")
-                logger.info(f"✅ Generated variationPaths: {list(campaign_json.get('variationPaths', {}).keys())}")
+                logger.info("✅ Campaign %s marked as completed", self.campaign_id)
+                logger.info("✅ Generated variationPaths: %s", list(campaign_json.get('variationPaths', {}).keys()))
             
-            logger.info(f"Updated campaign with {num_variations} variations (S3 URLs)")
+            logger.info("Updated campaign with %s variations (S3 URLs)", num_variations)
             
         except Exception as e:
-            logger.error(f"Failed to update campaign variations: {e}")
+            logger.error("Failed to update campaign variations: %s", e)
             raise
 
 
@@ -1801,8 +1917,9 @@ def generate_video(campaign_id: str, video_provider: str = "replicate") -> Dict[
         Dict with error status
     """
     logger.error(
-        f"DEPRECATED: generate_video() called for campaign {campaign_id}. "
-        "Use generate_video_for_creative() with a creative_id instead."
+        "DEPRECATED: generate_video() called for campaign %s. Use "
+        "generate_video_for_creative() with a creative_id instead.",
+        campaign_id
     )
     return {
         "status": "FAILED",
@@ -1843,33 +1960,33 @@ class CreativeGenerationPipeline:
         if not self.creative:
             raise ValueError(f"Creative {creative_id} not found")
 
-        logger.info(f"🔍 Loaded creative {self.creative.id}: campaign_id={self.creative.campaign_id}")
+        logger.info("🔍 Loaded creative %s: campaign_id=%s", self.creative.id, self.creative.campaign_id)
 
         # Get campaign from creative's relationship (eagerly loaded by get_creative_by_id)
         self.campaign = self.creative.campaign
         if not self.campaign:
             raise ValueError(f"Campaign for creative {creative_id} not found")
 
-        logger.info(f"🔍 Loaded campaign {self.campaign.id}: product_id={self.campaign.product_id}")
+        logger.info("🔍 Loaded campaign %s: product_id=%s", self.campaign.id, self.campaign.product_id)
 
         # Get product from campaign's relationship
         self.product = self.campaign.product
         if not self.product:
             raise ValueError(f"Product {self.campaign.product_id} not found")
 
-        logger.info(f"🔍 Loaded product {self.product.id}: brand_id={self.product.brand_id}")
+        logger.info("🔍 Loaded product %s: brand_id=%s", self.product.id, self.product.brand_id)
 
         # Get brand from product's relationship
         self.brand = self.product.brand
         if not self.brand:
             raise ValueError(f"Brand {self.product.brand_id} not found")
 
-        logger.info(f"🔍 Loaded brand {self.brand.id}: user_id={self.brand.user_id}")
-        logger.info(f"✅ Verified IDs: brand={self.brand.id}, product={self.product.id}, campaign={self.campaign.id}, creative={self.creative.id}")
+        logger.info("🔍 Loaded brand %s: user_id=%s", self.brand.id, self.brand.user_id)
+        logger.info("✅ Verified IDs: brand=%s, product=%s, campaign=%s, creative=%s", self.brand.id, self.product.id, self.campaign.id, self.creative.id)
 
     def _update_creative_status(self, status: str, progress: int = 0, error_message: Optional[str] = None):
         """Update creative status and progress in the database."""
-        update_creative_status(
+        queue_creative_status(
             self.db,
             self.creative_id,
             status=status,
@@ -1895,7 +2012,7 @@ class CreativeGenerationPipeline:
             # Mark creative as processing
             self._update_creative_status("processing", progress=5)
 
-            logger.info(f"Starting creative generation pipeline for creative {self.creative_id}")
+            logger.info("Starting creative generation pipeline for creative %s", self.creative_id)
 
             # Create the underlying campaign pipeline with creative_id for status tracking
             campaign_pipeline = GenerationPipeline(
@@ -1920,20 +2037,20 @@ class CreativeGenerationPipeline:
                     # Get variationPaths from campaign if available
                     if self.campaign.campaign_json and "variationPaths" in self.campaign.campaign_json:
                         creative_json["variationPaths"] = self.campaign.campaign_json["variationPaths"]
-                    update_creative_json(self.db, self.creative_id, creative_json)
+                    await asyncio.to_thread(update_creative_json, self.db, self.creative_id, creative_json)
 
-                logger.info(f"✅ Creative {self.creative_id} generation completed successfully")
+                logger.info("✅ Creative %s generation completed successfully", self.creative_id)
             else:
                 error_msg = result.get("error", "Unknown error")
                 self._update_creative_status("failed", error_message=error_msg)
-                logger.error(f"❌ Creative {self.creative_id} generation failed: {error_msg}")
+                logger.error("❌ Creative %s generation failed: %s", self.creative_id, error_msg)
 
             return result
 
         except Exception as e:
             total_elapsed = time.time() - pipeline_start
             error_msg = str(e)[:500]
-            logger.error(f"Creative pipeline failed after {total_elapsed:.1f}s: {e}", exc_info=True)
+            logger.error("Creative pipeline failed after %.1fs: %s", total_elapsed, e, exc_info=True)
 
             # Mark creative as failed
             self._update_creative_status("failed", error_message=error_msg)
@@ -1969,7 +2086,7 @@ class CreativeGenerationPipeline:
                         last_progress = campaign.progress
                         # Update creative with same progress
                         self._update_creative_status("processing", progress=last_progress)
-                        logger.debug(f"Synced progress to creative: {last_progress}%")
+                        logger.debug("Synced progress to creative: %s%%", last_progress)
 
                     # Check if campaign is done
                     if campaign and campaign.status in ["completed", "failed"]:
@@ -1977,7 +2094,7 @@ class CreativeGenerationPipeline:
 
                     await asyncio.sleep(2)  # Sync every 2 seconds
                 except Exception as e:
-                    logger.warning(f"Progress sync error (continuing): {e}")
+                    logger.warning("Progress sync error (continuing): %s", e)
                     await asyncio.sleep(5)
 
         # Run pipeline and progress sync in parallel
@@ -2023,7 +2140,7 @@ def generate_video_for_creative(creative_id: str, video_provider: str = "replica
         from app.database.connection import init_db
         init_db()
 
-        logger.info(f"Starting creative generation pipeline for creative {creative_id}")
+        logger.info("Starting creative generation pipeline for creative %s", creative_id)
         creative_uuid = UUID(creative_id)
         pipeline = CreativeGenerationPipeline(creative_uuid, video_provider=video_provider)
 
@@ -2040,10 +2157,10 @@ def generate_video_for_creative(creative_id: str, video_provider: str = "replica
         result = loop.run_until_complete(pipeline.run())
         return result
     except KeyboardInterrupt:
-        logger.warning(f"Generation interrupted for creative {creative_id}")
+        logger.warning("Generation interrupted for creative %s", creative_id)
         raise
     except Exception as e:
-        logger.error(f"Job failed for creative {creative_id}: {e}", exc_info=True)
+        logger.error("Job failed for creative %s: %s", creative_id, e, exc_info=True)
 
         # Try to update creative status to failed
         try:
@@ -2052,11 +2169,15 @@ def generate_video_for_creative(creative_id: str, video_provider: str = "replica
                 db = db_connection.SessionLocal()
                 update_creative_status(db, UUID(creative_id), status="failed", error_message=str(e)[:500])
         except Exception as status_error:
-            logger.warning(f"Could not update creative status: {status_error}")
+            logger.warning("Could not update creative status: %s", status_error)
 
         return {
             "status": "FAILED",
             "creative_id": creative_id,
             "error": str(e),
         }
+    finally:
+        # Write progress ticks still queued for the background flusher; the
+        # RQ work horse exits via os._exit() and would drop them
+        flush_creative_progress()
 
@@ -10,7 +10,14 @@ from app.config import settings
 from app.database.connection import test_connection, init_db
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+if settings.log_format == "json":
+    from app.utils.json_logging import JsonFormatter
+
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(JsonFormatter())
+    logging.basicConfig(level=logging.INFO, handlers=[_handler])
+else:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Create FastAPI app
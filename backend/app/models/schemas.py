@@ -96,8 +96,8 @@ class CreateProjectRequest(BaseModel):
             if fmt not in valid_formats:
                 raise ValueError(f"Invalid aspect ratio: {fmt}. Must be one of {valid_formats}")
 
-        # Remove duplicates
-        return list(set(v))
+        # Remove duplicates, keeping the requested order
+        return list(dict.fromkeys(v))
 
     @validator('product_images')
     def validate_product_images(cls, v):
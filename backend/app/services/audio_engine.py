@@ -155,7 +155,7 @@ class AudioEngine:
             f"High-quality cinematic production suitable for luxury brand advertising."
         )
         
-        logger.debug(f"Product music prompt: {prompt}")
+        logger.debug("Product music prompt: %s", prompt)
         return prompt
 
     def _create_music_prompt(self, mood: str, duration: float, tempo: str) -> str:
@@ -192,7 +192,7 @@ class AudioEngine:
             f"Professional quality, suitable for commercial use."
         )
 
-        logger.debug(f"Music prompt: {prompt}")
+        logger.debug("Music prompt: %s", prompt)
         return prompt
 
     async def _call_musicgen_model(self, prompt: str, duration: float) -> str:
@@ -44,6 +44,17 @@ class ExtractedGuidelines:
             "raw_text_preview": self.raw_text[:500] if self.raw_text else None,  # Truncate for storage
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ExtractedGuidelines":
+        """Rebuild from to_dict() output; raw_text is only the stored preview."""
+        return cls(
+            color_palette=data.get("color_palette") or [],
+            tone_of_voice=data.get("tone_of_voice") or "",
+            font_family=data.get("font_family"),
+            dos_and_donts=data.get("dos_and_donts") or {},
+            raw_text=data.get("raw_text_preview") or "",
+        )
+
 
 class BrandGuidelineExtractor:
     """Extract brand guidelines from documents (PDF, DOCX, TXT)."""
@@ -16,6 +16,8 @@ import aiohttp
 import boto3
 from botocore.exceptions import ClientError
 
+from app.utils.http_download import stream_response_to_file
+
 logger = logging.getLogger(__name__)
 
 # Safe imports for OpenCV and NumPy
@@ -175,8 +177,7 @@ class Compositor:
                 async with aiohttp.ClientSession() as session:
                     async with session.get(url, timeout=aiohttp.ClientTimeout(total=60)) as resp:
                         if resp.status == 200:
-                            with open(output_path, "wb") as f:
-                                f.write(await resp.read())
+                            await stream_response_to_file(resp, output_path)
                             logger.info(f"Downloaded via HTTP: {output_path}")
                         else:
                             raise ValueError(f"HTTP {resp.status}")
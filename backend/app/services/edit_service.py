@@ -5,7 +5,8 @@ import uuid
 import json
 from typing import Dict, Any, Optional
 from datetime import datetime
-from openai import AsyncOpenAI
+
+from app.services.openai_client import get_async_openai_client
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +16,7 @@ class EditService:
     
     def __init__(self, openai_api_key: str):
         """Initialize with OpenAI API key."""
-        self.client = AsyncOpenAI(api_key=openai_api_key)
+        self.client = get_async_openai_client(openai_api_key)
         self.model = "gpt-4o-mini"
         logger.info("✅ EditService initialized")
     
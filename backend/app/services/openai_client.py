@@ -0,0 +1,34 @@
+"""Shared OpenAI client.
+
+Every ScenePlanner, EditService and guidelines extraction used to build its own
+AsyncOpenAI client, and with it a fresh HTTP connection pool (new TCP + TLS
+handshakes for each request batch). One client per event loop lets all of them
+reuse pooled connections.
+"""
+
+import asyncio
+import weakref
+from typing import Dict
+
+from openai import AsyncOpenAI
+
+# Pooled connections belong to the loop that opened them, so clients are
+# cached per running loop (and dropped with it) rather than per process.
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_openai_client(api_key: str) -> AsyncOpenAI:
+    """Return the AsyncOpenAI client for this API key on the running event loop.
+
+    Must be called from a coroutine (or code running on the loop).
+    """
+    loop = asyncio.get_running_loop()
+    clients = _CLIENTS.get(loop)
+    if clients is None:
+        clients = _CLIENTS[loop] = {}
+    client = clients.get(api_key)
+    if client is None:
+        client = clients[api_key] = AsyncOpenAI(api_key=api_key)
+    return client
@@ -4,6 +4,7 @@ This service takes a product image, removes the background using rembg,
 and uploads the result to S3 for use in compositing.
 """
 
+import asyncio
 import logging
 import io
 from typing import Optional, Tuple, Any
@@ -193,8 +194,9 @@ class ProductExtractor:
                 # Ensure we still return a format suitable for compositing
                 return input_image.convert("RGBA")
 
-            # Remove background via rembg
-            output_image = remove(input_image)
+            # Remove background via rembg, off the event loop (CPU-bound model
+            # inference) so concurrent pipeline steps keep running
+            output_image = await asyncio.to_thread(remove, input_image)
 
             logger.info(f"Background removed: {input_image.size} → {output_image.size}")
             return output_image
@@ -10,6 +10,7 @@ Version: 1.0
 
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -57,6 +58,12 @@ class ProductGrammarLoader:
             with open(self.grammar_file_path, "r") as f:
                 self.grammar = json.load(f)
             
+            # Shot type ids are checked for every scene of every plan
+            self._shot_type_ids = [
+                config.get("id") for config in self.grammar.get("allowed_shot_types", {}).values()
+            ]
+            self._shot_type_id_set = frozenset(self._shot_type_ids)
+            
             version = self.grammar.get("grammar_version", "1.0")
             product_type = self.grammar.get("product_type", "unknown")
             logger.info(f"✅ Loaded {product_type} shot grammar v{version}")
@@ -83,8 +90,7 @@ class ProductGrammarLoader:
         Returns:
             List of IDs like ["macro_bottle", "aesthetic_broll", "atmospheric", ...]
         """
-        shot_types = self.get_allowed_shot_types()
-        return [config.get("id") for config in shot_types.values()]
+        return list(self._shot_type_ids)
 
     def get_scene_count_for_duration(self, duration: int) -> int:
         """Determine optimal scene count based on duration.
@@ -176,7 +182,7 @@ class ProductGrammarLoader:
         """
         violations = []
         flow_rules = self.get_flow_rules()
-        shot_types = self.get_shot_type_ids()
+        shot_types = self._shot_type_id_set
 
         # Check if we have scenes
         if not scenes:
@@ -192,7 +198,7 @@ class ProductGrammarLoader:
             if shot_type not in shot_types:
                 violations.append(
                     f"Scene {i+1}: Invalid shot_type '{shot_type}'. "
-                    f"Must be one of: {', '.join(shot_types)}"
+                    f"Must be one of: {', '.join(self._shot_type_ids)}"
                 )
 
             # Check duration is in valid range
@@ -323,6 +329,16 @@ class ProductGrammarLoader:
         logger.info("✅ Grammar reloaded")
 
 
+@lru_cache(maxsize=None)
+def get_grammar_loader(grammar_file_path: Optional[str] = None) -> ProductGrammarLoader:
+    """Return the shared loader for a grammar file, reading and parsing it once per process.
+
+    Loaders are read-only after construction, so one instance serves every
+    planner and pipeline run.
+    """
+    return ProductGrammarLoader(grammar_file_path)
+
+
 # Example usage
 if __name__ == "__main__":
     # Test the loader
@@ -5,7 +5,9 @@ with the internal ALB endpoint fronting VPC-hosted Wan2.5 inference containers
 on GPU instances (g5.xlarge).
 """
 
+import asyncio
 import logging
+import random
 from typing import Optional
 import aiohttp
 
@@ -13,6 +15,22 @@ from app.services.providers.base import BaseVideoProvider
 
 logger = logging.getLogger(__name__)
 
+# Throttled generate calls (rate limit / fleet busy) are retried with
+# exponential backoff, honoring Retry-After when the endpoint sends one
+THROTTLE_STATUSES = frozenset({429, 503})
+MAX_THROTTLE_RETRIES = 3
+THROTTLE_BASE_DELAY_SECONDS = 2.0
+
+
+def _throttle_delay(retry_after: Optional[str], attempt: int) -> float:
+    """Seconds to wait before retry number `attempt` (0-based)."""
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return THROTTLE_BASE_DELAY_SECONDS * (2 ** attempt) + random.uniform(0, 1)
+
 
 class ECSVideoProvider(BaseVideoProvider):
     """ECS provider for video generation using VPC-hosted Wan2.5 model.
@@ -88,30 +106,40 @@ class ECSVideoProvider(BaseVideoProvider):
                 # Set 300-second timeout for inference (5 minutes max)
                 timeout = aiohttp.ClientTimeout(total=300)
 
-                async with session.post(
-                    f"{self.endpoint_url}/generate",
-                    json=payload,
-                    timeout=timeout,
-                ) as response:
-                    # Raise error for HTTP error responses
-                    response.raise_for_status()
-
-                    # Parse JSON response
-                    try:
-                        data = await response.json()
-                    except Exception as e:
-                        self.logger.error(f"ECS endpoint returned invalid JSON: {e}")
-                        raise ValueError(f"Invalid response from ECS endpoint: {e}")
-
-                    # Extract video URL
-                    if "video_url" not in data:
-                        self.logger.error(f"ECS endpoint response missing 'video_url': {data}")
-                        raise ValueError("ECS endpoint response missing 'video_url' field")
-
-                    video_url = data["video_url"]
-                    self.logger.info(f"ECS endpoint: Video generated successfully: {video_url}")
-
-                    return video_url
+                for attempt in range(MAX_THROTTLE_RETRIES + 1):
+                    async with session.post(
+                        f"{self.endpoint_url}/generate",
+                        json=payload,
+                        timeout=timeout,
+                    ) as response:
+                        if response.status in THROTTLE_STATUSES and attempt < MAX_THROTTLE_RETRIES:
+                            delay = _throttle_delay(response.headers.get("Retry-After"), attempt)
+                        else:
+                            # Raise error for HTTP error responses
+                            response.raise_for_status()
+
+                            # Parse JSON response
+                            try:
+                                data = await response.json()
+                            except Exception as e:
+                                self.logger.error(f"ECS endpoint returned invalid JSON: {e}")
+                                raise ValueError(f"Invalid response from ECS endpoint: {e}")
+
+                            # Extract video URL
+                            if "video_url" not in data:
+                                self.logger.error(f"ECS endpoint response missing 'video_url': {data}")
+                                raise ValueError("ECS endpoint response missing 'video_url' field")
+
+                            video_url = data["video_url"]
+                            self.logger.info(f"ECS endpoint: Video generated successfully: {video_url}")
+
+                            return video_url
+
+                    self.logger.warning(
+                        f"ECS endpoint throttled (HTTP {response.status}), "
+                        f"retrying in {delay:.1f}s ({attempt + 1}/{MAX_THROTTLE_RETRIES})"
+                    )
+                    await asyncio.sleep(delay)
 
         except aiohttp.ClientTimeout as e:
             self.logger.error(f"ECS endpoint timeout after 300s: {e}")
@@ -13,6 +13,8 @@ import aiohttp
 import boto3
 from botocore.exceptions import ClientError
 
+from app.utils.http_download import stream_response_to_file
+
 logger = logging.getLogger(__name__)
 
 
@@ -134,7 +136,7 @@ class Renderer:
         try:
             # Check if it's a local file path
             if url_or_path.startswith('/') or '/tmp/' in url_or_path:
-                logger.debug(f"Copying local file: {url_or_path}")
+                logger.debug("Copying local file: %s", url_or_path)
                 import shutil
                 source_path = Path(url_or_path)
                 
@@ -142,7 +144,7 @@ class Renderer:
                     raise FileNotFoundError(f"Local file not found: {url_or_path}")
                 
                 shutil.copy2(source_path, output_path)
-                logger.debug(f"Copied from local: {output_path.name}")
+                logger.debug("Copied from local: %s", output_path.name)
                 return
             
             # Check if it's an S3 URL
@@ -164,9 +166,8 @@ class Renderer:
                 async with aiohttp.ClientSession() as session:
                     async with session.get(url_or_path, timeout=aiohttp.ClientTimeout(total=120)) as resp:
                         if resp.status == 200:
-                            with open(output_path, "wb") as f:
-                                f.write(await resp.read())
-                            logger.debug(f"Downloaded via HTTP: {output_path.name}")
+                            await stream_response_to_file(resp, output_path)
+                            logger.debug("Downloaded via HTTP: %s", output_path.name)
                         else:
                             raise ValueError(f"HTTP {resp.status}")
         except Exception as e:
@@ -197,7 +198,7 @@ class Renderer:
                 str(output_path),
             ]
 
-            logger.debug(f"Concatenating {len(video_paths)} videos...")
+            logger.debug("Concatenating %s videos...", len(video_paths))
             result = subprocess.run(cmd, capture_output=True, text=True)
 
             if result.returncode != 0:
@@ -274,7 +275,7 @@ class Renderer:
                 str(output_path),
             ]
 
-            logger.debug(f"Applying {aspect_ratio} aspect ratio...")
+            logger.debug("Applying %s aspect ratio...", aspect_ratio)
             result = subprocess.run(cmd, capture_output=True, text=True)
 
             if result.returncode != 0:
@@ -321,7 +322,7 @@ class Renderer:
         """Get duration of video from FFprobe."""
         try:
             # This is a simplified version - in production, download and check locally
-            logger.debug(f"Getting video duration: {video_url}")
+            logger.debug("Getting video duration: %s", video_url)
             return 30.0  # Default 30s for now
 
         except Exception as e:
@@ -16,9 +16,9 @@ import json
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 from pydantic import BaseModel
-from openai import AsyncOpenAI
+from app.services.openai_client import get_async_openai_client
 from app.services.style_manager import StyleManager
-from app.services.product_grammar_loader import ProductGrammarLoader
+from app.services.product_grammar_loader import get_grammar_loader
 from app.product_config.product_types import get_product_type_config
 
 logger = logging.getLogger(__name__)
@@ -92,7 +92,7 @@ class ScenePlanner:
 
         Grammar loader is initialized per product type when planning scenes.
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = get_async_openai_client(api_key)
         self.model = "gpt-5.1"
         self.grammar_loader = None  # Will be initialized per product type
         logger.info("✅ ScenePlanner initialized")
@@ -144,7 +144,7 @@ class ScenePlanner:
         from pathlib import Path
         base_dir = Path(__file__).parent.parent
         grammar_path = base_dir / "templates" / "scene_grammar" / product_config.shot_grammar_file
-        self.grammar_loader = ProductGrammarLoader(str(grammar_path))
+        self.grammar_loader = get_grammar_loader(str(grammar_path))
 
         # Use product_name if provided, otherwise fallback to brand_name
         actual_product_name = product_name or brand_name
@@ -16,6 +16,8 @@ import aiohttp
 import boto3
 from botocore.exceptions import ClientError
 
+from app.utils.http_download import stream_response_to_file
+
 logger = logging.getLogger(__name__)
 
 
@@ -323,8 +325,7 @@ class TextOverlayRenderer:
                 async with aiohttp.ClientSession() as session:
                     async with session.get(url, timeout=aiohttp.ClientTimeout(total=60)) as resp:
                         if resp.status == 200:
-                            with open(output_path, "wb") as f:
-                                f.write(await resp.read())
+                            await stream_response_to_file(resp, output_path)
                             logger.debug(f"Downloaded via HTTP: {output_path.name}")
                         else:
                             raise ValueError(f"HTTP {resp.status}")
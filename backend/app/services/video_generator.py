@@ -150,7 +150,7 @@ s
             
             # With "Prefer: wait", the prediction should already be complete
             status = prediction_data.get("status")
-            logger.debug(f"Prediction status: {status}")
+            logger.debug("Prediction status: %s", status)
             
             # Check if prediction is already complete (from "Prefer: wait")
             if status in ["succeeded", "completed"]:
@@ -191,7 +191,7 @@ s
                 if style_config and "keywords" in style_config:
                     keywords = style_config["keywords"]
                     style_parts.append(f"Visual Style Keywords: {', '.join(keywords)}")
-                    logger.debug(f"Added style keywords: {keywords}")
+                    logger.debug("Added style keywords: %s", keywords)
             except Exception as e:
                 logger.warning(f"Failed to apply style override: {e}")
 
@@ -300,16 +300,16 @@ s
                 check_count += 1
                 
                 if status == "processing":
-                    logger.debug(f"  [{check_count}] Processing ({elapsed:.0f}s)")
+                    logger.debug("  [%s] Processing (%.0fs)", check_count, elapsed)
                     await asyncio.sleep(5)
                 elif status == "succeeded":
-                    logger.debug(f"  Succeeded ({elapsed:.0f}s)")
+                    logger.debug("  Succeeded (%.0fs)", elapsed)
                     return prediction
                 elif status == "failed":
                     logger.error(f"Prediction failed: {prediction.get('error')}")
                     return None
                 else:
-                    logger.debug(f"  Status: {status}")
+                    logger.debug("  Status: %s", status)
                     await asyncio.sleep(5)
             
             except requests.exceptions.RequestException as e:
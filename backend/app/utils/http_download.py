@@ -0,0 +1,27 @@
+"""Streaming HTTP downloads to local files."""
+
+import asyncio
+import os
+from typing import Union
+
+import aiohttp
+
+# Read size for streamed response bodies
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+async def stream_response_to_file(
+    resp: aiohttp.ClientResponse, path: Union[str, os.PathLike]
+) -> None:
+    """Write an aiohttp response body to ``path`` chunk by chunk.
+
+    The body is never held in memory whole, and opening, writing and closing
+    the file all run in worker threads so concurrent downloads keep the event
+    loop free.
+    """
+    f = await asyncio.to_thread(open, path, "wb")
+    try:
+        async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+            await asyncio.to_thread(f.write, chunk)
+    finally:
+        await asyncio.to_thread(f.close)
@@ -0,0 +1,19 @@
+"""JSON log formatter for log shipping (one object per line)."""
+
+import json
+import logging
+
+
+class JsonFormatter(logging.Formatter):
+    """Render records as single-line JSON so shippers can skip regex parsing."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
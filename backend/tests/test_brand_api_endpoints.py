@@ -54,6 +54,12 @@ def sample_brands_list(sample_brand):
 
 # Test crud.update_brand()
 
+def _update_params(mock_db):
+    """Bound SET/WHERE parameters of the UPDATE passed to db.execute()."""
+    statement = mock_db.execute.call_args[0][0]
+    return statement.compile().params
+
+
 def test_update_brand_crud_success(mock_db, sample_brand):
     """Test successful brand update in CRUD."""
     # Import at module level to avoid config loading issues
@@ -63,10 +69,8 @@ def test_update_brand_crud_success(mock_db, sample_brand):
 
     from app.database.crud import update_brand
 
-    # Mock query
-    mock_query = Mock()
-    mock_query.filter.return_value.first.return_value = sample_brand
-    mock_db.query.return_value = mock_query
+    # Mock UPDATE ... RETURNING to return the brand row
+    mock_db.execute.return_value.scalar_one_or_none.return_value = sample_brand
 
     # Update brand using **kwargs pattern
     result = update_brand(
@@ -78,13 +82,17 @@ def test_update_brand_crud_success(mock_db, sample_brand):
         guidelines="https://s3.amazonaws.com/new_guidelines.pdf"
     )
 
-    # Verify
-    assert result is not None
-    assert result.brand_name == "UpdatedBrand"
-    assert result.logo_urls == ["https://s3.amazonaws.com/new_logo.png"]
-    assert result.guidelines == "https://s3.amazonaws.com/new_guidelines.pdf"
+    # Verify a single UPDATE carried the new values and the ownership check
+    assert result is sample_brand
+    mock_db.execute.assert_called_once()
+    params = _update_params(mock_db)
+    assert params["brand_name"] == "UpdatedBrand"
+    assert params["logo_urls"] == ["https://s3.amazonaws.com/new_logo.png"]
+    assert params["guidelines"] == "https://s3.amazonaws.com/new_guidelines.pdf"
+    assert sample_brand.id in params.values()
+    assert sample_brand.user_id in params.values()
     mock_db.commit.assert_called_once()
-    mock_db.refresh.assert_called_once()
+    mock_db.refresh.assert_not_called()
 
 
 def test_update_brand_crud_partial_update(mock_db, sample_brand):
@@ -95,24 +103,22 @@ def test_update_brand_crud_partial_update(mock_db, sample_brand):
 
     from app.database.crud import update_brand
 
-    # Mock query
-    mock_query = Mock()
-    mock_query.filter.return_value.first.return_value = sample_brand
-    mock_db.query.return_value = mock_query
+    # Mock UPDATE ... RETURNING to return the brand row
+    mock_db.execute.return_value.scalar_one_or_none.return_value = sample_brand
 
     # Update only brand name using **kwargs pattern
-    result = update_brand(
+    update_brand(
         db=mock_db,
         brand_id=sample_brand.id,
         user_id=sample_brand.user_id,
         brand_name="UpdatedBrand"
     )
 
-    # Verify only brand_name was updated
-    assert result.brand_name == "UpdatedBrand"
-    # Original values should remain
-    assert result.logo_urls == ["https://s3.amazonaws.com/logo.png"]
-    assert result.guidelines == "https://s3.amazonaws.com/guidelines.pdf"
+    # Verify only brand_name is written; other columns are left alone
+    params = _update_params(mock_db)
+    assert params["brand_name"] == "UpdatedBrand"
+    assert "logo_urls" not in params
+    assert "guidelines" not in params
 
 
 def test_update_brand_crud_not_found(mock_db):
@@ -123,10 +129,8 @@ def test_update_brand_crud_not_found(mock_db):
 
     from app.database.crud import update_brand
 
-    # Mock query to return None
-    mock_query = Mock()
-    mock_query.filter.return_value.first.return_value = None
-    mock_db.query.return_value = mock_query
+    # Mock UPDATE ... RETURNING to match no row
+    mock_db.execute.return_value.scalar_one_or_none.return_value = None
 
     # Update non-existent brand using **kwargs pattern
     result = update_brand(
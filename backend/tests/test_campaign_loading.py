@@ -0,0 +1,294 @@
+"""Tests for campaign loader options and query counts (eager product/brand, no hidden lazy loads or N+1)."""
+
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import defaultload, raiseload, sessionmaker
+
+from app.database.models import Base, Brand, Product, Campaign, Creative
+from app.models.schemas import CampaignDetail
+from app.cache import campaigns as campaign_cache
+from app.database import crud
+from app.database.crud import (
+    create_campaign,
+    delete_campaign,
+    get_brand_stats,
+    get_campaign,
+    get_campaign_by_id,
+    get_campaigns_by_product,
+    get_product_campaigns,
+    page_cursor,
+    update_campaign_status,
+)
+
+
+# SQLite has no JSONB/ARRAY; store them as JSON so the real tables can be created
+@compiles(JSONB, "sqlite")
+@compiles(ARRAY, "sqlite")
+def _compile_json_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest.fixture
+def db_session():
+    """In-memory SQLite session with the Brand/Product/Campaign tables."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(
+        engine, tables=[Brand.__table__, Product.__table__, Campaign.__table__, Creative.__table__]
+    )
+    session = sessionmaker(bind=engine)()
+
+    yield session
+
+    session.close()
+    engine.dispose()
+
+
+class FakeRedis:
+    """Just enough of the redis-py client for the campaign listing cache."""
+
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def pipeline(self):
+        return self
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    def expire(self, key, ttl):
+        self.ttls[key] = ttl
+
+    def execute(self):
+        pass
+
+    def smembers(self, key):
+        return set(self.sets.get(key, ()))
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.sets.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(campaign_cache, "get_client", lambda: client)
+    return client
+
+
+@pytest.fixture
+def brand_stats_cache():
+    """The process-wide brand stats cache, emptied around the test."""
+    crud._BRAND_STATS_CACHE.clear()
+    yield crud._BRAND_STATS_CACHE
+    crud._BRAND_STATS_CACHE.clear()
+
+
+@pytest.fixture
+def raise_on_lazy_load(db_session):
+    """
+    Make every relationship a loaded campaign did not eager-load raise on access.
+
+    Applied per test session rather than in crud, so the shared lookups used by
+    the pipelines keep ordinary lazy loading.
+    """
+    guard = (
+        raiseload("*"),
+        defaultload(Campaign.product).raiseload("*"),
+        defaultload(Campaign.product).defaultload(Product.brand).raiseload("*"),
+    )
+
+    def add_guard(state):
+        if state.is_select and state.bind_mapper is Campaign.__mapper__:
+            state.statement = state.statement.options(*guard)
+
+    event.listen(db_session, "do_orm_execute", add_guard)
+    yield
+    event.remove(db_session, "do_orm_execute", add_guard)
+
+
+@pytest.fixture
+def query_count(db_session):
+    """Count SQL statements executed on the session's engine."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def campaign(db_session):
+    """A campaign owned by a fresh brand/product, with the session cleared."""
+    user_id = uuid.uuid4()
+    brand = Brand(user_id=user_id, company_name="Test Company", logo_urls={"urls": []})
+    product = Product(brand=brand, user_id=user_id, product_type="SaaS", name="Test Product")
+    campaign = Campaign(
+        product=product,
+        user_id=user_id,
+        name="Launch",
+        seasonal_event="Spring",
+        year=2025,
+        duration=30,
+        scene_configs=[],
+    )
+    db_session.add_all([brand, product, campaign])
+    db_session.commit()
+    ids = (campaign.id, brand.user_id)
+    db_session.expunge_all()
+    return ids
+
+
+def test_get_campaign_by_id_loads_product_and_brand_in_one_query(db_session, campaign, query_count):
+    """Product and brand come back with the campaign; reading them issues no SQL."""
+    campaign_id, _ = campaign
+
+    loaded = get_campaign_by_id(db_session, campaign_id)
+    assert loaded.product.brand.logo_urls == {"urls": []}
+
+    assert len(query_count) == 1
+
+
+def test_get_campaign_by_id_reuses_the_session_identity_map(db_session, campaign, query_count):
+    """A second lookup of the same campaign in one session issues no SQL."""
+    campaign_id, _ = campaign
+
+    first = get_campaign_by_id(db_session, campaign_id)
+    assert get_campaign_by_id(db_session, campaign_id) is first
+
+    assert len(query_count) == 1
+
+
+def test_get_campaign_checks_ownership_in_one_query(db_session, campaign, query_count):
+    """Ownership, product and brand are resolved in a single statement."""
+    campaign_id, user_id = campaign
+
+    loaded = get_campaign(db_session, user_id, campaign_id)
+    assert loaded.product.brand.user_id == user_id
+    assert get_campaign(db_session, uuid.uuid4(), campaign_id) is None
+
+    assert len(query_count) == 2
+
+
+def test_unrequested_relationships_raise_instead_of_lazy_loading(db_session, campaign, raise_on_lazy_load):
+    """Traversals outside the eager-loaded set fail loudly under the test guard."""
+    campaign_id, _ = campaign
+
+    loaded = get_campaign_by_id(db_session, campaign_id)
+
+    with pytest.raises(InvalidRequestError):
+        loaded.creatives
+    with pytest.raises(InvalidRequestError):
+        loaded.product.brand.products
+
+
+def test_get_product_campaigns_lists_a_page_in_two_queries(db_session, campaign, query_count):
+    """Ownership probe plus one list query, however many campaigns are on the page."""
+    campaign_id, user_id = campaign
+    product_id = get_campaign_by_id(db_session, campaign_id).product_id
+    for i in range(5):
+        db_session.add(Campaign(
+            product_id=product_id,
+            user_id=user_id,
+            name=f"Campaign {i}",
+            seasonal_event="Spring",
+            year=2025,
+            duration=30,
+            scene_configs=[],
+        ))
+    db_session.commit()
+    db_session.expunge_all()
+    query_count.clear()
+
+    campaigns = get_product_campaigns(db_session, user_id, product_id, limit=50)
+    assert len(campaigns) == 6
+    assert all(c.product_id == product_id for c in campaigns)
+
+    assert len(query_count) <= 2
+
+
+def test_get_campaigns_by_product_serves_repeat_pages_from_cache(db_session, campaign, query_count, fake_redis):
+    """A second request for the same page issues no SQL; a status write drops it."""
+    campaign_id, _ = campaign
+    product_id = get_campaign_by_id(db_session, campaign_id).product_id
+    db_session.expunge_all()
+    query_count.clear()
+
+    campaigns, total = get_campaigns_by_product(db_session, product_id, page=1, limit=20)
+    assert total == 1
+    assert [c.id for c in campaigns] == [campaign_id]
+    assert len(query_count) == 2
+
+    query_count.clear()
+    cached, cached_total = get_campaigns_by_product(db_session, product_id, page=1, limit=20)
+    assert (cached[0].id, cached[0].status, cached_total) == (campaign_id, campaigns[0].status, 1)
+    assert query_count == []
+    assert CampaignDetail.model_validate(cached[0]).display_name == "Launch-Spring-2025"
+
+    tag = f"camp:tag:{product_id}"
+    assert fake_redis.ttls[tag] >= fake_redis.ttls[next(iter(fake_redis.sets[tag]))]
+
+    update_campaign_status(db_session, campaign_id, status="processing", progress=40)
+    refreshed, _ = get_campaigns_by_product(db_session, product_id, page=1, limit=20)
+    assert (refreshed[0].status, refreshed[0].progress) == ("processing", 40)
+
+
+def test_get_campaigns_by_product_pages_by_keyset_cursor(db_session, campaign):
+    """A cursor from page_cursor() continues where the previous page ended."""
+    campaign_id, user_id = campaign
+    product_id = get_campaign_by_id(db_session, campaign_id).product_id
+    for i in range(4):
+        db_session.add(Campaign(
+            product_id=product_id,
+            user_id=user_id,
+            name=f"Campaign {i}",
+            seasonal_event="Spring",
+            year=2025,
+            duration=30,
+            scene_configs=[],
+        ))
+    db_session.commit()
+
+    first, total = get_campaigns_by_product(db_session, product_id, limit=3)
+    second, _ = get_campaigns_by_product(db_session, product_id, limit=3, cursor=page_cursor(first, 3))
+
+    assert total == 5
+    assert len(first) == 3 and len(second) == 2
+    assert {c.id for c in first}.isdisjoint(c.id for c in second)
+
+
+def test_campaign_writes_refresh_cached_brand_stats(db_session, campaign, brand_stats_cache):
+    """Creating or deleting a campaign drops the brand's cached stats."""
+    campaign_id, user_id = campaign
+    product = get_campaign_by_id(db_session, campaign_id).product
+    brand_id, product_id = product.brand_id, product.id
+
+    assert get_brand_stats(db_session, brand_id)["total_campaigns"] == 1
+
+    created = create_campaign(
+        db_session, user_id, product_id, brand_id, name="Sequel", seasonal_event="Summer",
+        year=2025, duration=30, scene_configs=[]
+    )
+    assert get_brand_stats(db_session, brand_id)["total_campaigns"] == 2
+
+    assert delete_campaign(db_session, user_id, created.id)
+    assert get_brand_stats(db_session, brand_id)["total_campaigns"] == 1
@@ -0,0 +1,91 @@
+"""Tests for retrying crud write helpers on serialization failures and deadlocks."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+
+from app.database import crud
+
+
+def _pg_error(pgcode):
+    """A DBAPIError as raised by psycopg2 for the given SQLSTATE."""
+    return DBAPIError("UPDATE creatives ...", {}, SimpleNamespace(pgcode=pgcode))
+
+
+def _session(*outcomes):
+    """Mock session whose execute() raises/returns each outcome in turn."""
+    db = MagicMock()
+    db.execute.side_effect = [
+        outcome if isinstance(outcome, Exception)
+        else MagicMock(scalar_one_or_none=MagicMock(return_value=outcome))
+        for outcome in outcomes
+    ]
+    return db
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(crud, "TRANSIENT_DB_BACKOFF", 0)
+
+
+@pytest.mark.parametrize("pgcode", ["40001", "40P01"])
+def test_update_creative_status_retries_transient_error(pgcode):
+    creative = SimpleNamespace(id=uuid.uuid4(), user_id=uuid.uuid4(), campaign_id=uuid.uuid4())
+    db = _session(_pg_error(pgcode), _pg_error(pgcode), creative)
+
+    result = crud.update_creative_status(db, creative.id, status="completed", progress=100)
+
+    assert result is creative
+    assert db.execute.call_count == 3
+    assert db.rollback.call_count == 2
+    db.commit.assert_called_once()
+
+
+def test_update_creative_status_raises_once_retries_are_exhausted():
+    db = _session(*[_pg_error("40P01")] * (crud.TRANSIENT_DB_RETRIES + 1))
+
+    with pytest.raises(DBAPIError):
+        crud.update_creative_status(db, uuid.uuid4(), status="failed")
+
+    assert db.execute.call_count == crud.TRANSIENT_DB_RETRIES + 1
+
+
+def test_update_creative_status_swallows_other_errors():
+    db = _session(_pg_error("23505"))
+
+    assert crud.update_creative_status(db, uuid.uuid4(), status="completed") is None
+    assert db.execute.call_count == 1
+
+
+def test_transient_error_is_not_retried_inside_caller_transaction():
+    db = _session(_pg_error("40001"))
+
+    with pytest.raises(DBAPIError):
+        crud.update_creative_status(db, uuid.uuid4(), status="completed", auto_commit=False)
+
+    assert db.execute.call_count == 1
+    db.rollback.assert_not_called()
+
+
+def test_positional_auto_commit_false_is_not_retried():
+    db = _session(_pg_error("40001"))
+    creative_id = uuid.uuid4()
+
+    with pytest.raises(DBAPIError):
+        crud.update_creative_status(db, creative_id, "completed", 100, None, None, False)
+
+    assert db.execute.call_count == 1
+    db.rollback.assert_not_called()
+
+
+def test_delete_brand_returns_false_on_other_errors():
+    user_id = uuid.uuid4()
+    db = MagicMock()
+    db.get.return_value = SimpleNamespace(user_id=user_id)
+    db.commit.side_effect = _pg_error("23503")
+
+    assert crud.delete_brand(db, uuid.uuid4(), user_id) is False
+    db.rollback.assert_called_once()
@@ -2,10 +2,11 @@
 
 import pytest
 from datetime import datetime
+import time
 import uuid
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from app.database.models import Base, Brand, Product, Campaign
+from app.database.models import Base, Brand, Product, Campaign, uuid7
 
 
 @pytest.fixture(scope="function")
@@ -174,6 +175,12 @@ class TestSchemaDefinition:
         assert Product is not None
         assert Campaign is not None
 
+    def test_each_table_mapped_once(self):
+        """Test that every table has exactly one mapped class on the shared Base."""
+        mapped_tables = [mapper.local_table.name for mapper in Base.registry.mappers]
+        assert len(mapped_tables) == len(set(mapped_tables))
+        assert len(Base.metadata.tables) == len(mapped_tables)
+
     def test_table_names_correct(self):
         """Test that all tables have correct names."""
         assert Brand.__tablename__ == "brands"
@@ -223,3 +230,14 @@ class TestSchemaDefinition:
         # Check timestamps
         assert hasattr(product, 'created_at')
         assert hasattr(product, 'updated_at')
+
+    def test_primary_keys_are_time_ordered(self):
+        """Test that generated primary keys are version 7 UUIDs in creation order."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first.version == 7
+        assert first.variant == uuid.RFC_4122
+        assert first < second
+        assert Campaign.__table__.c.id.default.arg.__name__ == "uuid7"